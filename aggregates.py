@@ -0,0 +1,219 @@
+# ============================================================================
+# AGGREGATES - MATERIALIZED SUMMARIES PER COMPANY AND SECTOR
+# ============================================================================
+# One row per (Unternehmen, Sektor): count, sum, sum of squares, min and max
+# of the weighted total and of every dimension score, plus the timestamp of
+# the latest saved assessment. Saving an assessment updates one row in O(1);
+# summaries for any company/sector filter are merged from the matching rows.
+# Persistence and resync go through derived.DerivedStore like benchmark.py:
+# AGGREGATES_PATH stores the store sequence, store location and MODEL_VERSION
+# it covers, and every get_aggregates() call compares the sequence with the
+# store in O(1) (reload, or one pass over the history).
+# ============================================================================
+
+import json
+import math
+import os
+
+import numpy as np
+
+from config import AGGREGATES_PATH, DEFAULT_WEIGHTS, MODEL_VERSION
+from derived import DerivedStore
+from scoring import SCORING_ENGINE
+from storage import record_answers, record_field
+
+
+def _empty_stat() -> dict:
+    return {"sum": 0.0, "sumsq": 0.0, "min": None, "max": None}
+
+
+def _add_stat(stat: dict, value: float):
+    stat["sum"] += value
+    stat["sumsq"] += value * value
+    stat["min"] = value if stat["min"] is None else min(stat["min"], value)
+    stat["max"] = value if stat["max"] is None else max(stat["max"], value)
+
+
+def _merge_stat(into: dict, stat: dict):
+    into["sum"] += stat["sum"]
+    into["sumsq"] += stat["sumsq"]
+    for key, pick in (("min", min), ("max", max)):
+        if stat[key] is not None:
+            into[key] = stat[key] if into[key] is None else pick(into[key], stat[key])
+
+
+def _describe(stat: dict, count: int) -> dict:
+    """Mittelwert, Standardabweichung (Grundgesamtheit), Minimum, Maximum."""
+    if not count:
+        return {"mean": None, "std": None, "min": None, "max": None}
+    mean = stat["sum"] / count
+    variance = max(stat["sumsq"] / count - mean * mean, 0.0)
+    return {"mean": mean, "std": math.sqrt(variance), "min": stat["min"], "max": stat["max"]}
+
+
+class AggregateTable:
+    """Aggregate je (Unternehmen, Sektor)."""
+
+    def __init__(self, themes=None):
+        self.themes = list(themes or SCORING_ENGINE.themes)
+        self.rows = {}
+        self.record_count = 0
+        self.sequence = None
+        self.store_location = None
+
+    def _row(self, company: str, sector: str) -> dict:
+        key = (company or "", sector or "")
+        row = self.rows.get(key)
+        if row is None:
+            row = {
+                "count": 0,
+                "total": _empty_stat(),
+                "dimensions": {theme: _empty_stat() for theme in self.themes},
+                "latest": None,
+            }
+            self.rows[key] = row
+        return row
+
+    def add(self, company: str, sector: str, total: float, dimensions: dict, timestamp=None):
+        """Nimmt ein Assessment auf (Gesamtscore und Dimensionen 0-1)."""
+        row = self._row(company, sector)
+        row["count"] += 1
+        _add_stat(row["total"], float(total))
+        for theme in self.themes:
+            _add_stat(row["dimensions"][theme], float(dimensions.get(theme) or 0.0))
+        if timestamp:
+            row["latest"] = timestamp
+        self.record_count += 1
+
+    def add_records(self, records, fallback_weights=None):
+        """Nimmt gespeicherte Assessments auf (Scores werden gemeinsam berechnet)."""
+        records = list(records)
+        if not records:
+            return
+        weights = [
+            r.get("weights") if isinstance(r.get("weights"), dict) else (fallback_weights or DEFAULT_WEIGHTS)
+            for r in records
+        ]
+        result = SCORING_ENGINE.score(
+            SCORING_ENGINE.answers_to_matrix(record_answers(r) for r in records),
+            SCORING_ENGINE.weights_to_matrix(weights),
+        )
+        dimensions = np.nan_to_num(result["dimension"], nan=0.0)
+        for record, total, dims in zip(records, result["total"], dimensions):
+            self.add(
+                record_field(record, "Unternehmen"),
+                record_field(record, "Sektor"),
+                total,
+                dict(zip(SCORING_ENGINE.themes, dims)),
+                record_field(record, "Timestamp"),
+            )
+
+    def summary(self, company=None, sector=None) -> dict:
+        """
+        Zusammenfassung über alle passenden Zeilen (None = ohne Filter)
+
+        Returns:
+            dict: {"count", "latest", "total": {mean, std, min, max}, "dimensions": {Thema: {...}}}
+        """
+        count = 0
+        latest = None
+        total = _empty_stat()
+        dimensions = {theme: _empty_stat() for theme in self.themes}
+        for (row_company, row_sector), row in self.rows.items():
+            if company is not None and row_company != company:
+                continue
+            if sector is not None and row_sector != sector:
+                continue
+            count += row["count"]
+            _merge_stat(total, row["total"])
+            for theme in self.themes:
+                _merge_stat(dimensions[theme], row["dimensions"][theme])
+            if row["latest"] and (latest is None or str(row["latest"]) > str(latest)):
+                latest = row["latest"]
+        return {
+            "count": count,
+            "latest": latest,
+            "total": _describe(total, count),
+            "dimensions": {theme: _describe(stat, count) for theme, stat in dimensions.items()},
+        }
+
+    # ------------------------------------------------------------------ persistence
+
+    def save(self, path=None):
+        path = path or AGGREGATES_PATH
+        payload = {
+            "model_version": MODEL_VERSION,
+            "record_count": self.record_count,
+            "sequence": self.sequence,
+            "store_location": self.store_location,
+            "themes": self.themes,
+            "rows": [
+                {"Unternehmen": company, "Sektor": sector, **row} for (company, sector), row in self.rows.items()
+            ],
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError:
+            # Ohne beschreibbares Cache-Verzeichnis wird beim nächsten Start neu aufgebaut
+            pass
+
+    @classmethod
+    def load(cls, path=None):
+        """Gespeicherte Tabelle oder None (fehlend, unlesbar oder andere Modellversion)."""
+        try:
+            payload = json.loads((path or AGGREGATES_PATH).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        table = cls()
+        if payload.get("model_version") != MODEL_VERSION or payload.get("themes") != table.themes:
+            return None
+        for entry in payload.get("rows", []):
+            key = (entry.pop("Unternehmen"), entry.pop("Sektor"))
+            table.rows[key] = entry
+        table.record_count = int(payload.get("record_count", 0))
+        table.sequence = payload.get("sequence")
+        table.store_location = payload.get("store_location")
+        return table
+
+
+_AGGREGATES = DerivedStore(AggregateTable, AggregateTable.load)
+
+
+def rebuild(store=None) -> AggregateTable:
+    """Baut die Tabelle in einem Durchlauf über die Historie neu auf."""
+    return _AGGREGATES.rebuild(store)
+
+
+def get_aggregates() -> AggregateTable:
+    """
+    Prozessweite Aggregat-Tabelle
+
+    Bei jedem Aufruf wird der Stand der Ablage (store.sequence()) verglichen;
+    Einträge anderer Prozesse werden so nachgeladen bzw. die Tabelle neu
+    aufgebaut.
+    """
+    return _AGGREGATES.get()
+
+
+def record_saved(record: dict, result: dict, sequence: tuple):
+    """
+    Nach dem Speichern eines Assessments: betroffene Zeile fortschreiben und sichern
+
+    Args:
+        record (dict): gespeicherter Eintrag (Unternehmen, Sektor, Timestamp)
+        result (dict): Ergebnis von core.score_answers für diesen Eintrag
+        sequence (tuple): Rückgabe von store.append() für diesen Eintrag
+    """
+    _AGGREGATES.record_saved(
+        sequence,
+        lambda table: table.add(
+            record_field(record, "Unternehmen"),
+            record_field(record, "Sektor"),
+            result["total"],
+            result["dimension"],
+            record_field(record, "Timestamp"),
+        ),
+    )
@@ -3,47 +3,64 @@
 # ============================================================================
 # Styled UI: top status bar, dynamic backgrounds per dimension,
 # main layout with dimension list + question cards.
-# Local storage via assessments.json
+# Local storage via storage.py (assessments.json / segment log)
 # ============================================================================
 
 import streamlit as st
 import streamlit.components.v1 as components
+import numpy as np
 import pandas as pd
+import copy
 import json
+import hashlib
 import html
 import textwrap
-import plotly.graph_objects as go
 import plotly.express as px
+from functools import partial
 from typing import Optional
 from datetime import datetime
 from pathlib import Path
 
 from config import (
+    BATCH_EXPORT_DIR,
     CIRCULAR_MODEL,
+    COMPILED_MODEL,
     DEFAULT_WEIGHTS,
-    INDICATOR_RECOMMENDATIONS,
     MATURITY_LEVELS,
+    MODEL_VERSION,
+    QUESTION_INDEX,
+    load_indicator,
+    question_text,
 )
 
-from utils import (
+from core import (
     get_maturity_level,
-    get_improvement_areas,
+    get_recommendations,
+    maturity_transitions,
+    score_answers,
+)
+import aggregates
+import pdf_jobs
+import score_matrix
+from benchmark import get_benchmark, record_saved
+from questionnaire import questionnaire
+from scoring import SCORING_ENGINE
+from storage import FILTER_FIELDS, get_store, record_answers, record_field
+from styles import THEME_UI, stylesheet, theme_marker
+from utils import (
+    COMPARISON_MAX_OVERLAYS,
+    HEATMAP_MAX_ROWS,
+    create_comparison_chart,
+    create_dimension_gauges,
     create_radar_chart,
-    generate_pdf_report,
+    create_score_heatmap,
+    create_trend_chart,
 )
 
 # ============================================================================
 # UI THEME (DYNAMIC BACKGROUND + CARD STYLES)
 # ============================================================================
 
-THEME_UI = {
-    "Design": {"bg": "#E9FBF5", "bg2": "#F6FFFC", "accent": "#1F7E8A", "pill": "#D8F6EE"},
-    "Strategie": {"bg": "#EAF3FF", "bg2": "#F6FAFF", "accent": "#2B6CB0", "pill": "#DCEBFF"},
-    "Wirtschaftlichkeit": {"bg": "#FFF6E8", "bg2": "#FFFBF3", "accent": "#B7791F", "pill": "#FFE9C8"},
-    "Regulatorik": {"bg": "#F3EEFF", "bg2": "#FAF7FF", "accent": "#6B46C1", "pill": "#E8DEFF"},
-    "Systemische Befähiger": {"bg": "#FFF0F5", "bg2": "#FFF7FB", "accent": "#C026D3", "pill": "#FAD5E8"},
-}
-
 THEME_SUMMARIES = {
     "Design": "Produktseitige Voraussetzungen wie Demontage, Materialprofil und Aufbereitbarkeit.",
     "Strategie": "Markt, Organisation und Entscheidungslogik für zirkuläre Geschäftsmodelle.",
@@ -53,455 +70,12 @@ THEME_SUMMARIES = {
 }
 
 
-def inject_dynamic_theme_css(theme_name: str):
-    """Inject theme-dependent CSS. Sidebar remains untouched."""
-    ui = THEME_UI.get(theme_name, THEME_UI["Design"])
-
-    st.markdown(
-        f"""
-<style>
-  .stApp {{
-    background: linear-gradient(180deg, {ui['bg']} 0%, {ui['bg2']} 65%, #FFFFFF 100%) !important;
-  }}
-
-  /* main container spacing + max width */
-  [data-testid="stAppViewContainer"] > .main {{
-    padding-top: 140px;
-    padding-bottom: 36px;
-  }}
-  [data-testid="stAppViewContainer"] > .main > div {{
-    max-width: 1220px;
-    margin: 0 auto;
-    padding-left: 22px;
-    padding-right: 22px;
-  }}
-
-  /* nicer headers in main */
-  h1, h2, h3 {{
-    color: #0F172A !important;
-    letter-spacing: -0.3px;
-  }}
-  h3 {{
-    font-size: 26px !important;
-    font-weight: 900 !important;
-  }}
-  /* vertical "Dimensionen" label */
-
-  /* top status bar */
-  [class*="st-key-topbar"] {{
-    background: rgba(255,255,255,0.85) !important;
-    border: 1px solid rgba(15,23,42,0.08) !important;
-    border-radius: 16px !important;
-    box-shadow: 0 12px 28px rgba(15,23,42,0.06) !important;
-    margin: 6px 0 18px 0 !important;
-  }}
-  [class*="st-key-topbar"] .topbar-inner {{
-    max-width: 1220px;
-    margin: 0 auto;
-    padding: 20px 20px 26px 20px;
-    display: flex;
-    flex-direction: column;
-    align-items: center;
-  }}
-  [class*="st-key-topbar"] .topbar-inner * {{
-    color: #0F172A !important;
-    visibility: visible !important;
-    opacity: 1 !important;
-  }}
-  .topbar-title {{
-    font-size:22px !important;
-    font-weight:900 !important;
-    color:#0F172A !important;
-    text-align:center;
-    line-height:1.2;
-  }}
-  .topbar-sub {{
-    font-size:15px !important;
-    color:rgba(15,23,42,0.65) !important;
-    text-align:center;
-    line-height:1.2;
-  }}
-  .topbar-rail {{
-    width:100%;
-    height:8px;
-    background:rgba(15,23,42,0.08);
-    border-radius:999px;
-    overflow:hidden;
-  }}
-  .topbar-fill {{
-    height:8px;
-    width:var(--p);
-    background:{ui['accent']};
-    border-radius:999px;
-  }}
-  .topbar-left button, .topbar-right button {{
-    height:36px !important;
-    min-width:36px !important;
-    border-radius:10px !important;
-    border:1px solid rgba(15,23,42,0.12) !important;
-    background:#fff !important;
-    font-weight:900 !important;
-  }}
-  .topbar-left, .topbar-right {{
-    pointer-events: auto;
-  }}
-
-  .progress-wrap {{
-    display:flex;
-    align-items:center;
-    justify-content:space-between;
-    gap:18px;
-    margin-top:10px;
-  }}
-  .progress-rail {{
-    width:100%;
-    height:10px;
-    background:rgba(15,23,42,0.08);
-    border-radius:999px;
-    overflow:hidden;
-  }}
-  .progress-bar {{
-    height:10px;
-    width:var(--p);
-    background:{ui['accent']};
-    border-radius:999px;
-  }}
-  .progress-metric {{
-    min-width:110px;
-    text-align:right;
-    color:#0F172A;
-    font-weight:900;
-  }}
-  .progress-metric small {{
-    display:block;
-    font-weight:700;
-    color:rgba(15,23,42,0.6);
-  }}
-
-  /* dimension cards (left column) */
-  .dim-card {{
-    background: rgba(255,255,255,0.72) !important;
-    border: 1px solid rgba(15,23,42,0.06) !important;
-    border-radius: 20px !important;
-    box-shadow: 0 12px 32px rgba(15,23,42,0.06), 0 2px 10px rgba(15,23,42,0.04) !important;
-    backdrop-filter: blur(8px);
-    padding: 16px 16px !important;
-    margin: 0 0 12px 0 !important;
-    min-height: 140px;
-  }}
-
-  .dim-card, .q-card, .indicator-card, .indicator-bar, .topbar {{
-    transition: transform .18s ease, box-shadow .18s ease, border-color .18s ease;
-  }}
-  .dim-card:hover, .q-card:hover {{
-    transform: translateY(-2px);
-    box-shadow: 0 16px 38px rgba(15,23,42,0.08), 0 4px 14px rgba(15,23,42,0.06) !important;
-    border-color: rgba(15,23,42,0.10) !important;
-  }}
-
-  .dim-row {{
-    display:flex;
-    align-items:flex-start;
-    justify-content:space-between;
-    gap:12px;
-  }}
-
-  .dim-left {{
-    display:flex;
-    gap:12px;
-    align-items:flex-start;
-  }}
-
-  .dim-icon {{
-    width:44px;
-    height:44px;
-    border-radius:14px;
-    background: rgba(15,23,42,0.04);
-    border: 1px solid rgba(15,23,42,0.08);
-    display:flex;
-    align-items:center;
-    justify-content:center;
-    font-weight:900;
-    color: rgba(15,23,42,0.72);
-    font-size:18px;
-    flex: 0 0 auto;
-    margin-top:2px;
-  }}
-  .dim-icon svg {{
-    width: 22px;
-    height: 22px;
-    stroke: rgba(15,23,42,0.7);
-    stroke-width: 2;
-    fill: none;
-    stroke-linecap: round;
-    stroke-linejoin: round;
-  }}
-
-  .dim-title {{
-    font-weight:800 !important;
-    color:#0F172A;
-    font-size:20px !important;
-    line-height:1.15;
-    margin:0;
-  }}
-
-  .dim-meta {{
-    margin-top:4px;
-    font-size:14.5px;
-    font-weight:800;
-    color: rgba(15,23,42,0.55);
-  }}
-
-  .dim-desc {{
-    color:rgba(15,23,42,0.62);
-    font-size:15.5px;
-    margin-top:10px;
-    line-height:1.5;
-  }}
-
-  /* dimension container styled like a card */
-  [class*="st-key-dim-card-"] {{
-    background: rgba(255,255,255,0.72) !important;
-    border: 1px solid rgba(15,23,42,0.06) !important;
-    border-radius: 20px !important;
-    box-shadow: 0 12px 32px rgba(15,23,42,0.06), 0 2px 10px rgba(15,23,42,0.04) !important;
-    backdrop-filter: blur(8px);
-    padding: 16px 16px !important;
-    margin: 0 0 12px 0 !important;
-  }}
-  .dim-arrow-in {{
-    margin-top: 10px;
-  }}
-  .dim-arrow-in div[data-testid="stButton"] {{
-    width: 100% !important;
-    display: block !important;
-  }}
-  .dim-arrow-in div[data-testid="stButton"] > button {{
-    width: 100% !important;
-    height: 38px !important;
-    border-radius: 12px !important;
-    border: 1px solid rgba(15,23,42,0.10) !important;
-    background: rgba(255,255,255,0.92) !important;
-    color: rgba(15,23,42,0.65) !important;
-    font-weight: 900 !important;
-    font-size: 15px !important;
-    line-height: 1 !important;
-    padding: 0 !important;
-    box-shadow: 0 8px 18px rgba(15,23,42,0.06) !important;
-  }}
-  .dim-arrow-in div[data-testid="stButton"] > button:hover {{
-    transform: translateY(-1px);
-    box-shadow: 0 12px 24px rgba(15,23,42,0.08) !important;
-    border-color: rgba(15,23,42,0.22) !important;
-  }}
-
-  /* question card (right column) */
-  /* question card container */
-  [class*="st-key-q-card-"] {{
-    background: rgba(255,255,255,0.72) !important;
-    border: 1px solid rgba(15,23,42,0.06) !important;
-    border-radius: 20px !important;
-    box-shadow: 0 12px 32px rgba(15,23,42,0.06), 0 2px 10px rgba(15,23,42,0.04) !important;
-    backdrop-filter: blur(8px);
-    padding: 16px !important;
-    margin: 0 0 16px 0 !important;
-  }}
-  .q-head {{
-    display:flex;
-    gap:10px;
-    align-items:flex-start;
-  }}
-  .q-num {{
-    width:38px;
-    height:38px;
-    border-radius:999px;
-    background:rgba(15,23,42,0.92);
-    color:#fff;
-    font-weight:900;
-    display:flex;
-    align-items:center;
-    justify-content:center;
-    font-size:16px;
-    margin-top:2px;
-    flex: 0 0 auto;
-  }}
-  .q-text {{
-    font-weight:900;
-    color:#0F172A;
-    font-size:18px;
-    line-height:1.35;
-  }}
-  .q-text-wrap {{
-    display:flex;
-    gap:8px;
-    align-items:flex-start;
-    flex:1;
-  }}
-  .q-info {{
-    position:relative;
-    display:inline-flex;
-    flex:0 0 auto;
-  }}
-  .q-info-icon {{
-    width:22px;
-    height:22px;
-    border-radius:999px;
-    border:1px solid rgba(15,23,42,0.18);
-    background:rgba(255,255,255,0.94);
-    color:{ui['accent']};
-    font-size:13px;
-    font-weight:900;
-    display:inline-flex;
-    align-items:center;
-    justify-content:center;
-    cursor:help;
-    box-shadow:0 6px 14px rgba(15,23,42,0.06);
-  }}
-  .q-info-bubble {{
-    position:absolute;
-    top:30px;
-    right:0;
-    width:min(360px, calc(100vw - 80px));
-    padding:12px 14px;
-    border-radius:14px;
-    background:#0F172A;
-    color:#F8FAFC;
-    font-size:13px;
-    line-height:1.5;
-    box-shadow:0 18px 38px rgba(15,23,42,0.22);
-    opacity:0;
-    visibility:hidden;
-    transform:translateY(6px);
-    transition:opacity 0.16s ease, transform 0.16s ease;
-    z-index:1000;
-  }}
-  .q-info:hover .q-info-bubble,
-  .q-info:focus-within .q-info-bubble {{
-    opacity:1;
-    visibility:visible;
-    transform:translateY(0);
-  }}
-  .q-head {{
-    margin-bottom: 14px;
-  }}
-
-  /* score buttons (horizontal tiles) */
-  /* answer buttons inside question card */
-  [class*="st-key-q-card-"] div[data-testid="stButton"] {{
-    width: 100% !important;
-  }}
-  [class*="st-key-q-card-"] div[data-testid="stButton"] > button {{
-    width: 100% !important;
-    text-align: left !important;
-    justify-content: flex-start !important;
-    border-radius: 10px !important;
-    border: 1px solid rgba(15,23,42,0.12) !important;
-    background: #ffffff !important;
-    color: rgba(15,23,42,0.85) !important;
-    padding: 9px 14px !important;
-    margin-bottom: 4px !important;
-    box-shadow: 0 6px 18px rgba(15,23,42,0.04) !important;
-    font-weight: 600 !important;
-  }}
-  [class*="st-key-q-card-"] div[data-testid="stButton"] > button:hover {{
-    border-color: rgba(15,23,42,0.22) !important;
-    box-shadow: 0 10px 22px rgba(15,23,42,0.06) !important;
-  }}
-  [class*="st-key-q-card-"] div[data-testid="stButton"] > button[kind="primary"] {{
-    background: {ui['pill']} !important;
-    border-color: {ui['accent']} !important;
-    color: #0F172A !important;
-  }}
-
-  /* indicator accordion buttons */
-  .indicator-acc {{
-    width: 100%;
-  }}
-  .indicator-acc div[data-testid="stButton"] > button {{
-    width: 100% !important;
-    height: 44px !important;
-    border-radius: 10px !important;
-    border: 1px solid rgba(15,23,42,0.14) !important;
-    background: #ffffff !important;
-    color: #0B1220 !important;
-    font-weight: 900 !important;
-    font-size: 20px !important;
-    box-shadow: 0 6px 14px rgba(15,23,42,0.05) !important;
-    transition: none !important;
-    padding: 0 12px !important;
-    text-align: left !important;
-  }}
-  .indicator-acc div[data-testid="stButton"] > button * {{
-    font-size: 20px !important;
-    font-weight: 900 !important;
-    color: #0B1220 !important;
-  }}
-  .indicator-acc div[data-testid="stButton"] {{
-    font-size: 20px !important;
-    font-weight: 900 !important;
-    color: #0B1220 !important;
-  }}
-  .indicator-acc div[data-testid="stButton"] * {{
-    font-size: 20px !important;
-    font-weight: 900 !important;
-    color: #0B1220 !important;
-  }}
-  .indicator-acc div[data-testid="stButton"] > button:hover {{
-    border-color: rgba(15,23,42,0.25) !important;
-    box-shadow: 0 10px 22px rgba(15,23,42,0.08) !important;
-  }}
-
-  /* expander header styling for indicator section */
-  div[data-testid="stExpander"] summary {{
-    font-weight: 700 !important;
-    font-size: 20px !important;
-    padding: 12px 0 !important;
-    border: none !important;
-  }}
-  div[data-testid="stExpander"] summary * {{
-    font-size: 20px !important;
-    font-weight: 700 !important;
-    color: #0B1220 !important;
-  }}
-  div[data-testid="stExpander"] {{
-    background: #ffffff !important;
-    border: none !important;
-    border-radius: 16px !important;
-    box-shadow: 0 10px 24px rgba(15,23,42,0.06) !important;
-    padding: 8px 10px !important;
-  }}
-  div[data-testid="stExpander"] > details {{
-    background: #ffffff !important;
-    border-radius: 16px !important;
-    border: none !important;
-  }}
-  div[data-testid="stExpander"] summary {{
-    padding: 12px 12px !important;
-    font-size: 20px !important;
-    font-weight: 700 !important;
-    border: none !important;
-    outline: none !important;
-    box-shadow: none !important;
-  }}
-  div[data-testid="stExpander"] summary,
-  div[data-testid="stExpander"] summary * {{
-    background: rgba(255,255,255,0.95) !important;
-  }}
-  div[data-testid="stExpander"] summary::before,
-  div[data-testid="stExpander"] summary::after {{
-    border: none !important;
-    outline: none !important;
-    box-shadow: none !important;
-  }}
-  div[data-testid="stExpander"] summary,
-  div[data-testid="stExpander"] summary *,
-  div[data-testid="stExpander"] > details {{
-    border-color: transparent !important;
-  }}
-</style>
-""",
-        unsafe_allow_html=True,
-    )
+def inject_dynamic_theme_css(theme_name: str, dimension_index=None, indicator_index=None):
+    """Precompiled assessment stylesheet plus a marker selecting the theme. Sidebar remains untouched."""
+    # The stylesheet is a <link> to a content-hashed file the browser caches;
+    # only the marker changes with theme, dimension and indicator.
+    st.markdown(stylesheet("assessment"), unsafe_allow_html=True)
+    st.markdown(theme_marker(theme_name, dimension_index, indicator_index), unsafe_allow_html=True)
 
 
 # ============================================================================
@@ -519,40 +93,20 @@ st.set_page_config(
 # BASE CSS (Sidebar stays as-is)
 # ============================================================================
 
-st.markdown(
-    """
-<style>
-  [data-testid="stSidebar"]{
-    background: rgba(255,255,255,0.55) !important;
-    border-right: 1px solid rgba(15,23,42,0.06);
-    backdrop-filter: blur(10px);
-  }
-  header[data-testid="stHeader"] { display: block; z-index: 1500; background: transparent; }
-  [data-testid="stAppViewContainer"] > .main { padding-top: 24px; }
-  div[data-testid="stStatusWidget"] { display: none !important; }
-  div[data-testid="stSpinner"] { display: none !important; }
-  .js-plotly-plot .plotly .loading,
-  .js-plotly-plot .plotly .loading-text,
-  .js-plotly-plot .plotly .plotly-loading {
-    display: none !important;
-  }
-  .dim-icon {
-    width:44px;
-    height:44px;
-    border-radius:14px;
-    background: rgba(15,23,42,0.04);
-    border: 1px solid rgba(15,23,42,0.08);
-    display:flex;
-    align-items:center;
-    justify-content:center;
-  }
-  .dim-icon svg {
-    width: 22px;
-    height: 22px;
-  }
-</style>
-""",
-    unsafe_allow_html=True,
+st.markdown(stylesheet("base"), unsafe_allow_html=True)
+
+# ============================================================================
+# PDF WORKERS (pre-warmed once per process)
+# ============================================================================
+
+pdf_jobs.warm_up(
+    product_name="",
+    company="",
+    theme_scores={theme: 0.5 for theme in DEFAULT_WEIGHTS},
+    weights=DEFAULT_WEIGHTS,
+    detailed_answers={},
+    improvement_areas=[],
+    theme_colors={theme: ui["accent"] for theme, ui in THEME_UI.items()},
 )
 
 # ============================================================================
@@ -588,47 +142,62 @@ if "dimension_priority" not in st.session_state:
     st.session_state.dimension_priority = list(CIRCULAR_MODEL.keys())
 if "intake_completed" not in st.session_state:
     st.session_state.intake_completed = False
+if "pdf_job_id" not in st.session_state:
+    st.session_state.pdf_job_id = None
 
 
 # ============================================================================
 # HELPER FUNCTIONS - LOCAL STORAGE
 # ============================================================================
 
-def calculate_scores(answers):
-    scores = {}
-    for theme, theme_data in CIRCULAR_MODEL.items():
-        scores[theme] = {}
-        for indicator_name, indicator_data in theme_data.items():
-            indicator_scores = []
-            for question in indicator_data.get("questions", []):
-                q_code = question["code"]
-                score = answers.get(theme, {}).get(indicator_name, {}).get(q_code)
-                if score is not None:
-                    indicator_scores.append(score)
-
-            scores[theme][indicator_name] = (
-                sum(indicator_scores) / len(indicator_scores) if indicator_scores else None
-            )
-    return scores
+def _has_materialized_scores(record) -> bool:
+    return (
+        record.get("model_version") == MODEL_VERSION
+        and isinstance(record.get("dimension_scores"), dict)
+        and isinstance(record.get("weights"), dict)
+        and record.get("total_score") is not None
+    )
 
 
-def get_overall_score(scores):
-    total_score = 0.0
-    used_weights = 0.0
-    for theme, theme_score in scores.items():
-        if theme_score:
-            valid_scores = [v for v in theme_score.values() if v is not None]
-            theme_avg = (sum(valid_scores) / len(valid_scores)) if valid_scores else None
-            weight = DEFAULT_WEIGHTS.get(theme, 0.2)
-            if theme_avg is not None:
-                total_score += theme_avg * weight
-                used_weights += weight
-    if used_weights == 0:
-        return 0.0
-    return (total_score / used_weights) * 5.0
+def materialized_scores(records, fallback_weights):
+    """
+    Dimensionen-Scores (N x Themen) und gewichtete Gesamtscores (0-1) gespeicherter Assessments
+
+    Gespeicherte Werte werden direkt übernommen, solange sie mit der aktuellen
+    Modellversion berechnet wurden; alle übrigen Einträge werden gemeinsam in
+    einem Durchlauf der Scoring-Engine neu berechnet.
+    """
+    themes = SCORING_ENGINE.themes
+    dimension = np.zeros((len(records), len(themes)))
+    total = np.zeros(len(records))
+
+    stale = []
+    for row, record in enumerate(records):
+        if _has_materialized_scores(record):
+            stored = record["dimension_scores"]
+            dimension[row] = [stored.get(theme, 0.0) for theme in themes]
+            total[row] = record["total_score"]
+        else:
+            stale.append(row)
+
+    if stale:
+        stale_records = [records[row] for row in stale]
+        weights = [
+            r.get("weights") if isinstance(r.get("weights"), dict) else fallback_weights
+            for r in stale_records
+        ]
+        result = SCORING_ENGINE.score(
+            SCORING_ENGINE.answers_to_matrix(record_answers(r) for r in stale_records),
+            SCORING_ENGINE.weights_to_matrix(weights),
+        )
+        dimension[stale] = np.nan_to_num(result["dimension"], nan=0.0)
+        total[stale] = result["total"]
+    return dimension, total
 
 
 def save_assessment_mc(answers, product_name="Mein Produkt", company="Mein Unternehmen"):
+    weights = st.session_state.weights
+    result = score_answers(answers, weights)
     assessment_data = {
         "Timestamp": datetime.now().isoformat(),
         "Produkt": product_name,
@@ -636,42 +205,22 @@ def save_assessment_mc(answers, product_name="Mein Produkt", company="Mein Unter
         "Sektor": st.session_state.sector,
         "Dimensionen_Prioritaet": st.session_state.dimension_priority,
         "answers": answers,
-        "scores": calculate_scores(answers),
-        "weights": st.session_state.weights,
+        "scores": result["indicator"],
+        "dimension_scores": result["dimension"],
+        "total_score": result["total"],
+        "model_version": MODEL_VERSION,
+        "weights": weights,
     }
 
-    path = Path("assessments.json")
-    history = []
-
-    if path.exists():
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                existing = json.load(f)
-            if isinstance(existing, list):
-                history = existing
-            elif isinstance(existing, dict):
-                history = [existing]
-        except Exception:
-            history = []
-
-    history.append(assessment_data)
-
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(history, f, indent=2, ensure_ascii=False)
+    sequence = get_store().append(assessment_data)
+    record_saved(assessment_data, result, sequence)
+    aggregates.record_saved(assessment_data, result, sequence)
+    score_matrix.record_saved(assessment_data, sequence)
 
 
 def load_assessment_history_local():
-    path = Path("assessments.json")
-    if not path.exists():
-        return []
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        if isinstance(data, list):
-            return data
-        if isinstance(data, dict):
-            return [data]
-        return []
+        return get_store().load_all()
     except Exception:
         return []
 
@@ -742,10 +291,19 @@ def _start_assessment():
     st.session_state.scroll_target = "top"
 
 
-def _select_answer(theme: str, indicator: str, code: str, score_value):
+def _select_answer(code: str, score_value):
+    theme, indicator, _, _ = QUESTION_INDEX[code]
     _ensure_answer_state(theme, indicator)
     st.session_state.theme_answers[theme][indicator][code] = score_value
-    st.session_state.scroll_target = f"q-{code}"
+    # Nur der Fragebogen läuft neu (Fragment); er aktualisiert danach den Fortschritt
+    st.session_state.progress_dirty = True
+
+
+def _apply_answer_batch(key: str):
+    batch = st.session_state.get(key) or {}
+    for code, score_value in (batch.get("changes") or {}).items():
+        if code in QUESTION_INDEX:
+            _select_answer(code, score_value)
 
 
 def _set_scroll_to_progress_top():
@@ -853,132 +411,7 @@ with st.sidebar:
 # ============================================================================
 
 def render_welcome():
-    st.markdown(
-        textwrap.dedent(
-            """
-        <style>
-          .stApp {
-            background:
-              radial-gradient(800px 360px at 12% -8%, rgba(31,126,138,0.14) 0%, rgba(31,126,138,0.0) 60%),
-              radial-gradient(900px 380px at 50% -6%, rgba(43,108,176,0.12) 0%, rgba(43,108,176,0.0) 60%),
-              radial-gradient(900px 380px at 90% -6%, rgba(183,121,31,0.12) 0%, rgba(183,121,31,0.0) 60%),
-              radial-gradient(900px 420px at 15% 10%, rgba(107,70,193,0.10) 0%, rgba(107,70,193,0.0) 65%),
-              radial-gradient(900px 420px at 85% 12%, rgba(192,38,211,0.10) 0%, rgba(192,38,211,0.0) 65%),
-              #F6F7FB !important;
-          }
-          [data-testid="stSidebar"] { background: #EEF1F5 !important; }
-
-          .home-hero {
-            background: transparent;
-            border: none;
-            padding: 12px 0 8px 0;
-            box-shadow: none;
-            margin: 8px 0 18px 0;
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-          }
-          .home-row {
-            display:flex;
-            gap:18px;
-            flex-wrap:wrap;
-          }
-          .home-hero { flex: 1 1 100%; }
-
-          .home-title {
-            font-size: 64px;
-            font-weight: 900;
-            font-style: italic;
-            letter-spacing: -1px;
-            color: #0F172A;
-            margin: 0;
-            line-height: 1.0;
-            text-align: center;
-          }
-          .home-hero .home-subtitle { text-align:center; }
-          .home-badges { justify-content:center; }
-          .home-steps { justify-items:center; }
-
-          .home-subtitle {
-            margin-top: 12px;
-            color: rgba(15,23,42,0.72);
-            font-size: 18px;
-            line-height: 1.7;
-            max-width: 860px;
-            text-align: center;
-          }
-
-          .home-badges {
-            display:flex;
-            gap: 10px;
-            flex-wrap: wrap;
-            margin-top: 14px;
-          }
-
-          .home-badge {
-            display:inline-block;
-            padding: 8px 12px;
-            border-radius: 999px;
-            border: 1px solid rgba(15,23,42,0.08);
-            background: rgba(255,255,255,0.85);
-            font-size: 12px;
-            font-weight: 800;
-            color: rgba(15,23,42,0.72);
-          }
-
-          .home-card {
-            background:#fff;
-            border: 1px solid rgba(15,23,42,0.08);
-            border-radius: 16px;
-            padding: 18px 18px;
-            box-shadow: 0 10px 26px rgba(15,23,42,0.05);
-            height: 100%;
-            transition: transform .18s ease, box-shadow .18s ease;
-            margin-bottom: 10px;
-          }
-          .home-card * { text-align: center; }
-          .home-cards { max-width: 1100px; margin: 0 auto; }
-          .home-shell {
-            min-height: 0;
-            display: block;
-          }
-          .home-card:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 16px 38px rgba(15,23,42,0.08);
-          }
-
-          .home-card-title {
-            font-weight: 900;
-            color:#0F172A;
-            font-size: 17px;
-            margin-bottom: 6px;
-          }
-
-          .home-card-text {
-            color: rgba(15,23,42,0.68);
-            font-size: 15px;
-            line-height: 1.65;
-          }
-          .home-steps {
-            margin-top: 14px;
-            display:grid;
-            grid-template-columns: repeat(auto-fit, minmax(160px, 1fr));
-            gap:10px;
-          }
-          .home-step {
-            background: rgba(15,23,42,0.04);
-            border: 1px solid rgba(15,23,42,0.08);
-            border-radius: 12px;
-            padding: 10px 12px;
-            font-size: 13px;
-            font-weight: 800;
-            color:#0F172A;
-          }
-        </style>
-        """
-        ),
-        unsafe_allow_html=True,
-    )
+    st.markdown(stylesheet("welcome"), unsafe_allow_html=True)
 
     st.markdown(
         textwrap.dedent(
@@ -1163,12 +596,69 @@ def render_welcome():
 # ============================================================================
 # PAGE: ASSESSMENT (UPDATED LAYOUT)
 # ============================================================================
+# Fortschrittsbalken und Fragebogen sind entkoppelt: Der Fragebogen eines
+# Indikators ist eine Client-Komponente (questionnaire.py), die Antworten
+# gebündelt zurückschickt. Ein Batch führt nur das Fragment des Fragebogens
+# neu aus, das danach den Fortschritt im Platzhalter ersetzt. Vollständige
+# Reruns gibt es nur bei der Navigation.
+
+def _answered_count() -> int:
+    answered_count = 0
+    for t, indicators in st.session_state.theme_answers.items():
+        if t not in CIRCULAR_MODEL:
+            continue
+        for ind, questions in indicators.items():
+            if ind in CIRCULAR_MODEL[t]:
+                answered_count += sum(1 for v in questions.values() if v is not None)
+    return answered_count
+
+
+def _render_progress(slot, current_theme: str):
+    total_questions = COMPILED_MODEL["total_questions"]
+    answered_count = _answered_count()
+    pct = 0 if total_questions == 0 else int((answered_count / total_questions) * 100)
+    slot.markdown(
+        f"""
+        <div class="topbar-inner">
+          <div class="topbar-title">Zirkularitäts-Assessment Status</div>
+          <div class="topbar-sub">Aktuell: <b>{current_theme}</b> • {answered_count} von {total_questions} Fragen</div>
+          <div style="margin-top:8px;" class="topbar-rail">
+            <div class="topbar-fill" style="--p:{pct}%;"></div>
+          </div>
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+
+@st.fragment
+def _render_questionnaire(theme: str, indicator: str, progress_slot):
+    if st.session_state.get("progress_dirty"):
+        _render_progress(progress_slot, theme)
+        st.session_state.progress_dirty = False
+
+    ui = THEME_UI.get(theme, THEME_UI["Design"])
+    key = f"questionnaire_{COMPILED_MODEL['indicator_index'][(theme, indicator)]}"
+    questionnaire(
+        load_indicator(theme, indicator).get("questions", []),
+        st.session_state.theme_answers.get(theme, {}).get(indicator, {}),
+        key=key,
+        accent=ui["accent"],
+        pill=ui["pill"],
+        on_change=partial(_apply_answer_batch, key),
+    )
+
 
 def render_assessment():
     themes = list(CIRCULAR_MODEL.keys())
     current_theme = themes[st.session_state.current_theme]
 
-    inject_dynamic_theme_css(current_theme)
+    indicator_count = len(CIRCULAR_MODEL[current_theme])
+    inject_dynamic_theme_css(
+        current_theme,
+        dimension_index=st.session_state.current_theme,
+        indicator_index=min(st.session_state.current_indicator, indicator_count - 1) if indicator_count else None,
+    )
 
     if st.session_state.scroll_target:
         target = st.session_state.scroll_target
@@ -1214,35 +704,11 @@ def render_assessment():
             )
         st.session_state.scroll_target = None
 
-    total_questions = sum(
-        len(CIRCULAR_MODEL[t][i]["questions"])
-        for t in CIRCULAR_MODEL
-        for i in CIRCULAR_MODEL[t]
-    )
-
-    answered_count = 0
-    for t in CIRCULAR_MODEL.keys():
-        if t in st.session_state.theme_answers:
-            for ind in CIRCULAR_MODEL[t].keys():
-                if ind in st.session_state.theme_answers[t]:
-                    answered_count += len([v for v in st.session_state.theme_answers[t][ind].values() if v is not None])
-
-    pct = 0 if total_questions == 0 else int((answered_count / total_questions) * 100)
-
     st.markdown("<div id='progress-top'></div>", unsafe_allow_html=True)
     with st.container(key="topbar"):
-        st.markdown(
-            f"""
-            <div class="topbar-inner">
-              <div class="topbar-title">Zirkularitäts-Assessment Status</div>
-              <div class="topbar-sub">Aktuell: <b>{current_theme}</b> • {answered_count} von {total_questions} Fragen</div>
-              <div style="margin-top:8px;" class="topbar-rail">
-                <div class="topbar-fill" style="--p:{pct}%;"></div>
-              </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
+        progress_slot = st.empty()
+    _render_progress(progress_slot, current_theme)
+    st.session_state.progress_dirty = False
 
     left, right = st.columns([0.34, 0.66], gap="large")
 
@@ -1285,21 +751,12 @@ def render_assessment():
             ),
         }
         for idx, theme in enumerate(themes):
-            ui = THEME_UI.get(theme, THEME_UI["Design"])
-            q_count = sum(len(CIRCULAR_MODEL[theme][i]["questions"]) for i in CIRCULAR_MODEL[theme])
-            active = idx == st.session_state.current_theme
+            q_count = COMPILED_MODEL["theme_question_counts"][theme]
 
             first_ind = list(CIRCULAR_MODEL[theme].keys())[0]
-            teaser = THEME_SUMMARIES.get(theme) or CIRCULAR_MODEL[theme][first_ind].get("description", "")
+            teaser = THEME_SUMMARIES.get(theme) or load_indicator(theme, first_ind).get("description", "")
             teaser = (teaser[:120] + "...") if len(teaser) > 120 else teaser
 
-            outline = f"2px solid {ui['accent']}" if active else "none"
-
-            if active:
-                st.markdown(
-                    f"<style>[class*='st-key-dim-card-{idx}']{{outline:2px solid {ui['accent']};}}</style>",
-                    unsafe_allow_html=True,
-                )
             with st.container(key=f"dim-card-{idx}"):
                 st.markdown(
                     f"""
@@ -1339,8 +796,6 @@ def render_assessment():
 
         # st.markdown(f"## {current_theme}")
 
-        current_idx = min(st.session_state.current_indicator, len(indicators) - 1)
-
         def fmt_indicator(ind_name: str) -> str:
             parts = ind_name.split(" ", 1)
             if len(parts) > 1 and parts[0][0].isdigit():
@@ -1352,12 +807,6 @@ def render_assessment():
         with st.expander("Indikatorauswahl", expanded=True):
             st.markdown("<div class='indicator-acc'>", unsafe_allow_html=True)
             for i, name in enumerate(indicators):
-                is_active = i == current_idx
-                if is_active:
-                    st.markdown(
-                        f"<style>[class*='st-key-indicator-btn-{i}'] button{{background:{THEME_UI[current_theme]['pill']} !important; border-color:{THEME_UI[current_theme]['accent']} !important; color:#0B1220 !important; font-weight:900 !important;}}</style>",
-                        unsafe_allow_html=True,
-                    )
                 with st.container(key=f"indicator-btn-{i}"):
                     st.button(
                         fmt_indicator(name),
@@ -1375,71 +824,7 @@ def render_assessment():
 
         st.markdown("### Leitfragen")
 
-        indicator_data = CIRCULAR_MODEL[current_theme][current_indicator]
-        for q_idx, question_data in enumerate(indicator_data.get("questions", []), start=1):
-            code = question_data.get("code", "")
-            text = question_data.get("text", "")
-            explanation = question_data.get("explanation", "")
-            options = question_data.get("options", [])
-            escaped_code = html.escape(code)
-            escaped_text = html.escape(text)
-            tooltip_html = ""
-            if explanation:
-                tooltip_html = (
-                    f"<span class='q-info'>"
-                    f"<span class='q-info-icon'>i</span>"
-                    f"<span class='q-info-bubble'>{html.escape(explanation)}</span>"
-                    f"</span>"
-                )
-
-            with st.container(key=f"q-card-{current_theme}-{current_indicator}-{code}"):
-                st.markdown(f"<div id='q-{code}'></div>", unsafe_allow_html=True)
-                st.markdown(
-                    f"""
-                    <div class="q-head">
-                      <div class="q-num">{q_idx}</div>
-                      <div class="q-text-wrap">
-                        <div class="q-text">{escaped_code}: {escaped_text}</div>
-                        {tooltip_html}
-                      </div>
-                    </div>
-                    """,
-                    unsafe_allow_html=True,
-                )
-
-                prev_score = st.session_state.theme_answers[current_theme][current_indicator].get(code)
-
-                def fmt_score(value: float) -> str:
-                    return f"{value:.2f}".rstrip("0").rstrip(".")
-
-                option_items = []
-                for opt in options:
-                    score = opt.get("score", 0.0)
-                    label = opt.get("label", "")
-                    display_label = f"{fmt_score(score)} — {label}"
-                    option_items.append({"display": display_label, "score": score})
-
-                display_labels = ["Keine Auswahl"] + [opt["display"] for opt in option_items]
-                display_to_score = {opt["display"]: opt["score"] for opt in option_items}
-
-                selected_label = "Keine Auswahl"
-                if prev_score is not None:
-                    for opt in option_items:
-                        if opt["score"] == prev_score:
-                            selected_label = opt["display"]
-                            break
-
-                for label in display_labels:
-                    is_selected = label == selected_label
-                    score_value = None if label == "Keine Auswahl" else display_to_score.get(label, 0.0)
-                    st.button(
-                        label,
-                        key=f"q_{current_theme}_{current_indicator}_{code}_{label}",
-                        use_container_width=True,
-                        type="primary" if is_selected else "secondary",
-                        on_click=_select_answer,
-                        args=(current_theme, current_indicator, code, score_value),
-                    )
+        _render_questionnaire(current_theme, current_indicator, progress_slot)
 
     st.divider()
 
@@ -1543,81 +928,69 @@ def render_settings():
 
 
 # ============================================================================
-# PAGE: RESULTS
+# RESULTS PIPELINE (MEMOIZED)
 # ============================================================================
+# Tabellen und Figuren der Ergebnisseite hängen nur von Antworten, Gewichtung
+# und Modellversion ab. Sie werden je Fingerprint einmal berechnet und mit
+# begrenzter LRU-Verdrängung zwischengespeichert; Filter schneiden nur die
+# gecachten Frames zu.
 
-def render_results():
-    st.header("Ergebnisse & Dashboard")
-    st.markdown(
-        "<style>div[data-testid='stSpinner']{display:none;}</style>",
-        unsafe_allow_html=True,
+RESULTS_CACHE_SIZE = 32
+
+MATURITY_SCALE = [
+    ("Stufe 1", "0–25%"),
+    ("Stufe 2", ">25–50%"),
+    ("Stufe 3", ">50–75%"),
+    ("Stufe 4", ">75–100%"),
+    ("Stufe 5", "100%"),
+]
+
+
+def _soften_hex(hex_color: str, mix: float = 0.25) -> str:
+    hex_color = hex_color.lstrip("#")
+    r = int(hex_color[0:2], 16)
+    g = int(hex_color[2:4], 16)
+    b = int(hex_color[4:6], 16)
+    r = int(r + (255 - r) * mix)
+    g = int(g + (255 - g) * mix)
+    b = int(b + (255 - b) * mix)
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+THEME_COLORS = {k: v["accent"] for k, v in THEME_UI.items()}
+THEME_COLORS_SOFT = {k: _soften_hex(v["accent"], 0.28) for k, v in THEME_UI.items()}
+
+
+def results_fingerprint(answers, weights) -> str:
+    """Inhalts-Hash über Antworten, Gewichtung und Modellversion."""
+    payload = json.dumps(
+        [answers, weights, MODEL_VERSION], sort_keys=True, ensure_ascii=False, separators=(",", ":")
     )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
 
-    scores = calculate_scores(st.session_state.theme_answers)
 
-    theme_scores = {}
-    for theme in CIRCULAR_MODEL.keys():
-        if theme in scores:
-            vals = [v for v in scores[theme].values() if v is not None]
-            theme_scores[theme] = (sum(vals) / len(vals)) if vals else 0.0
-        else:
-            theme_scores[theme] = 0.0
-
-    weights_sum = sum(st.session_state.weights.get(dim, 0.0) for dim in CIRCULAR_MODEL.keys())
-    if weights_sum > 0:
-        total_01 = sum(
-            theme_scores.get(dim, 0.0) * st.session_state.weights.get(dim, 0.0)
-            for dim in CIRCULAR_MODEL.keys()
-        ) / weights_sum
-    else:
-        total_01 = 0.0
-    total_score = total_01 * 5.0
-    level = get_maturity_level(total_01)
-    def soften_hex(hex_color: str, mix: float = 0.25) -> str:
-        hex_color = hex_color.lstrip("#")
-        r = int(hex_color[0:2], 16)
-        g = int(hex_color[2:4], 16)
-        b = int(hex_color[4:6], 16)
-        r = int(r + (255 - r) * mix)
-        g = int(g + (255 - g) * mix)
-        b = int(b + (255 - b) * mix)
-        return f"#{r:02x}{g:02x}{b:02x}"
-
-    theme_colors = {k: v["accent"] for k, v in THEME_UI.items()}
-    theme_colors_soft = {k: soften_hex(v["accent"], 0.28) for k, v in THEME_UI.items()}
-    maturity_scale = [
-        ("Stufe 1", "0–25%"),
-        ("Stufe 2", ">25–50%"),
-        ("Stufe 3", ">50–75%"),
-        ("Stufe 4", ">75–100%"),
-        ("Stufe 5", "100%"),
-    ]
+@st.cache_data(max_entries=RESULTS_CACHE_SIZE, show_spinner=False)
+def _results_tables(fingerprint: str, _answers, _weights) -> dict:
+    """Scores und abgeleitete Tabellen; Cache-Schlüssel ist allein der Fingerprint."""
+    result = score_answers(_answers, _weights)
+    scores = result["indicator"]
+    theme_scores = result["dimension"]
 
-    # Build detailed rows
     detail_rows = []
-    for theme, indicators in CIRCULAR_MODEL.items():
-        for indicator_name, indicator_data in indicators.items():
-            questions = indicator_data.get("questions", [])
-            for q in questions:
-                code = q.get("code", "")
-                text = q.get("text", "")
-                selected_score = (
-                    st.session_state.theme_answers.get(theme, {})
-                    .get(indicator_name, {})
-                    .get(code)
-                )
-                detail_rows.append(
-                    {
-                        "Thema": theme,
-                        "Indikator": indicator_name,
-                        "Frage-Code": code,
-                        "Frage": text,
-                        "Score": selected_score,
-                        "Score_%": (selected_score * 100) if selected_score is not None else None,
-                        "Bewertet": selected_score is not None,
-                    }
-                )
-
+    for code in COMPILED_MODEL["codes"]:
+        theme, indicator_name, _, _ = QUESTION_INDEX[code]
+        selected_score = _answers.get(theme, {}).get(indicator_name, {}).get(code)
+        detail_rows.append(
+            {
+                "Thema": theme,
+                "Indikator": indicator_name,
+                "Frage-Code": code,
+                "Frage": question_text(code).get("text", ""),
+                "Score": selected_score,
+                "Score_%": (selected_score * 100) if selected_score is not None else None,
+                "Bewertet": selected_score is not None,
+            }
+        )
     detail_df = pd.DataFrame(detail_rows)
 
     indicator_rows = []
@@ -1641,455 +1014,887 @@ def render_results():
     )
     theme_order = {k: i for i, k in enumerate(CIRCULAR_MODEL.keys())}
     indicator_df["ThemeOrder"] = indicator_df["Thema"].map(theme_order).fillna(99).astype(int)
-    recommendation_df = indicator_df.copy()
-    recommendation_df = recommendation_df[recommendation_df["Score"].notna()]
-    recommendation_df = recommendation_df[recommendation_df["Score"] < 0.5]
-    recommendation_df = recommendation_df.sort_values(["ThemeOrder", "Order", "Indikator"], ascending=True)
 
     theme_df = pd.DataFrame(
         [{"Thema": k, "Score": v, "Score_%": v * 100} for k, v in theme_scores.items()]
     ).sort_values("Score", ascending=True)
 
-    tab_overview, tab_themes, tab_indicators, tab_questions, tab_recommendations, tab_export = st.tabs(
-        ["Überblick", "Dimensionen", "Indikatoren", "Leitfragen", "Handlungsempfehlungen", "Export"]
+    return {
+        "scores": scores,
+        "theme_scores": theme_scores,
+        "total": result["total"],
+        "level": get_maturity_level(result["total"]),
+        "recommendations": get_recommendations(scores, threshold=0.5),
+        "detail_df": detail_df,
+        "indicator_df": indicator_df,
+        "theme_df": theme_df,
+        "theme_df_ordered": theme_df.set_index("Thema").loc[list(CIRCULAR_MODEL.keys())].reset_index(),
+    }
+
+
+@st.cache_data(max_entries=RESULTS_CACHE_SIZE, show_spinner=False)
+def _radar_figure(fingerprint: str, _theme_scores):
+    return create_radar_chart(_theme_scores, "", theme_colors=THEME_COLORS)
+
+
+@st.cache_data(max_entries=RESULTS_CACHE_SIZE, show_spinner=False)
+def _dimension_figures(fingerprint: str, _theme_df_ordered) -> dict:
+    gauges = create_dimension_gauges(
+        dict(zip(_theme_df_ordered["Thema"], _theme_df_ordered["Score"])),
+        theme_colors=THEME_COLORS,
+        bar_colors=THEME_COLORS_SOFT,
     )
 
-    with tab_overview:
-        st.markdown("### Ihre Zirkularitätsreife")
-        col1, col2, col3 = st.columns([1, 2, 1])
-        with col2:
-            scale_html = "<br/>".join(
-                [
-                    f"{m['emoji']} {m['name']} ({m.get('label', '')}) ({rng})"
-                    for m, (_, rng) in zip(MATURITY_LEVELS, maturity_scale)
-                ]
-            )
-            st.markdown(
-                f"""
-            <div style='padding: 20px; background: #ffffff; border-radius: 16px;
-                        border: 1px solid rgba(15,23,42,0.08); box-shadow: 0 10px 28px rgba(15,23,42,0.06);
-                        text-align: center;'>
-                <h4 style='margin-top: 0; color: #0F172A;'>Reifegrad</h4>
-                <div style='font-size: 3em; font-weight: 900; color: #0F172A; margin: 10px 0;'>{level['emoji']}</div>
-                <p style='margin: 5px 0; font-size: 1.4em; font-weight: 800;'>{level['name']} ({level.get('label', '')})</p>
-                <p style='margin: 5px 0; color: rgba(15,23,42,0.65);'>{level['description']}</p>
-                <hr style='margin: 10px 0; border:none; border-top:1px solid rgba(15,23,42,0.10);'>
-                <p style='margin: 5px 0; font-size: 1em;'><strong>Gewichteter Score:</strong> {total_score:.2f}/5.0</p>
-                <p style='margin: 5px 0; font-size: 1em;'><strong>Gewichteter Prozentwert:</strong> {total_01*100:.0f}%</p>
-                <hr style='margin: 10px 0; border:none; border-top:1px dashed rgba(15,23,42,0.12);'>
-                <div style='text-align:left; font-size:0.92em; color: rgba(15,23,42,0.8);'>
-                  <strong>Reifegrad-Skala</strong><br/>{scale_html}
-                </div>
-            </div>
-            """,
-                unsafe_allow_html=True,
-            )
+    theme_bar = px.bar(
+        _theme_df_ordered,
+        x="Score_%",
+        y="Thema",
+        orientation="h",
+        text="Score_%",
+        color="Thema",
+        color_discrete_map=THEME_COLORS_SOFT,
+    )
+    theme_bar.update_traces(texttemplate="%{text:.0f}%", textposition="outside")
+    theme_bar.update_layout(
+        height=320,
+        showlegend=False,
+        xaxis_title="",
+        yaxis_title="",
+        bargap=0.25,
+        yaxis=dict(tickfont=dict(color="#0F172A")),
+    )
+    return {"gauges": gauges, "ranking": theme_bar}
+
+
+@st.cache_data(max_entries=RESULTS_CACHE_SIZE, show_spinner=False)
+def _indicator_figure(fingerprint: str, selected_theme: str, _view_df):
+    chart_df = _view_df.copy()
+    chart_df["Score"] = chart_df["Score"].fillna(0)
+    chart_df["Score_%"] = chart_df["Score_%"].fillna(0)
+    chart_df = chart_df.sort_values(["ThemeOrder", "Order", "Indikator"], ascending=True)
+    y_order = chart_df["Indikator"].tolist()
+    if selected_theme == "Alle":
+        bar_color = "Thema"
+        color_map = THEME_COLORS_SOFT
+    else:
+        bar_color = None
+        color_map = None
+    ind_bar = px.bar(
+        chart_df,
+        x="Score_%",
+        y="Indikator",
+        orientation="h",
+        text="Score_%",
+        color=bar_color,
+        color_discrete_map=color_map,
+    )
+    ind_bar.update_traces(texttemplate="%{text:.0f}%", textposition="outside")
+    if selected_theme != "Alle":
+        ind_bar.update_traces(marker_color=THEME_COLORS_SOFT.get(selected_theme, "#0F172A"))
+    chart_height = max(420, 28 * len(chart_df) + 120)
+    ind_bar.update_layout(
+        height=chart_height,
+        showlegend=selected_theme == "Alle",
+        xaxis_title="",
+        yaxis_title="",
+        yaxis=dict(categoryorder="array", categoryarray=y_order, autorange="reversed", tickfont=dict(color="#0F172A")),
+    )
+    return ind_bar
 
-        st.markdown("### Radar-Chart")
-        fig_radar = create_radar_chart(
-            theme_scores, "", theme_colors=theme_colors
-        )
-        st.plotly_chart(fig_radar, use_container_width=True)
-
-        st.markdown("### Detaillierte Berechnung mit Gewichtungen")
-        weighted_terms = []
-        for dim in CIRCULAR_MODEL.keys():
-            score = theme_scores.get(dim, 0.0)
-            weight = st.session_state.weights.get(dim, 0.0)
-            weighted_terms.append(f"{score:.2f} \\cdot {weight:.2f}")
-        numerator = " + ".join(weighted_terms) if weighted_terms else "0"
-        denominator = " + ".join([f"{st.session_state.weights.get(dim, 0.0):.2f}" for dim in CIRCULAR_MODEL.keys()]) or "1"
-        total_5 = total_01 * 5.0
-        st.latex(
-            rf"\text{{Gesamtscore}}=\frac{{{numerator}}}{{{denominator}}}={total_01:.2f}"
-        )
-        st.markdown("### Reifestufen im Überblick")
-        for stage, (_, interval) in zip(MATURITY_LEVELS, maturity_scale):
-            st.markdown(
-                f"""
-                <div style="margin-bottom:12px; padding:16px 18px; background:#ffffff; border:1px solid rgba(15,23,42,0.08);
-                            border-radius:14px; box-shadow:0 8px 22px rgba(15,23,42,0.05);">
-                    <div style="font-weight:900; color:#0F172A;">{stage['emoji']} {stage['name']} ({stage.get('label', '')})</div>
-                    <div style="font-size:13px; color:rgba(15,23,42,0.56); margin:4px 0 8px 0;">Zuordnung: {interval}</div>
-                    <div style="color:#334155; line-height:1.55;">{html.escape(stage['description'])}</div>
-                </div>
-                """,
-                unsafe_allow_html=True,
-            )
 
+@st.cache_data(max_entries=RESULTS_CACHE_SIZE, show_spinner=False)
+def _score_distribution_figure(fingerprint: str, q_theme: str, q_indicator: str, _answered_df):
+    score_counts = (
+        _answered_df.dropna(subset=["Score"])
+        .groupby("Score")["Frage-Code"]
+        .count()
+        .reset_index()
+        .rename(columns={"Frage-Code": "Anzahl"})
+    )
+    if score_counts.empty:
+        return None
+    if q_theme != "Alle":
+        scale = ["#F1F5F9", THEME_COLORS.get(q_theme, "#B7791F")]
+    else:
+        scale = ["#FFF6E8", "#B7791F"]
+    dist_chart = px.bar(
+        score_counts,
+        x="Score",
+        y="Anzahl",
+        text="Anzahl",
+        color="Score",
+        color_continuous_scale=scale,
+    )
+    dist_chart.update_traces(textposition="outside")
+    dist_chart.update_layout(
+        height=280,
+        coloraxis_showscale=False,
+        xaxis_title="Score",
+        yaxis_title="Anzahl",
+    )
+    return dist_chart
 
-    with tab_themes:
-        st.markdown("### Dimensionenübersicht")
-        theme_cols = st.columns(3, gap="large")
-        theme_order = list(CIRCULAR_MODEL.keys())
-        theme_df_ordered = theme_df.set_index("Thema").loc[theme_order].reset_index()
-        for idx, row in theme_df_ordered.iterrows():
-            col = theme_cols[idx % 3]
-            with col:
-                theme_color = theme_colors.get(row["Thema"], "#0F172A")
-                theme_color_soft = theme_colors_soft.get(row["Thema"], theme_color)
-                gauge = go.Figure(
-                    go.Indicator(
-                        mode="gauge+number",
-                        value=row["Score_%"],
-                        number={"suffix": "%", "font": {"size": 28, "color": theme_color}},
-                        gauge={
-                            "axis": {"range": [0, 100]},
-                            "bar": {"color": theme_color_soft},
-                            "bgcolor": "#F8FAFC",
-                            "bordercolor": "#E2E8F0",
-                            "borderwidth": 2,
-                            "steps": [{"range": [0, 100], "color": "#F1F5F9"}],
-                        },
-                        title={"text": row["Thema"], "font": {"size": 14, "color": "#0F172A"}},
-                    )
-                )
-                gauge.update_layout(height=220, margin=dict(l=10, r=10, t=40, b=10))
-                st.plotly_chart(gauge, use_container_width=True)
-        st.markdown("### Dimensionen-Ranking")
-        theme_order = list(CIRCULAR_MODEL.keys())
-        theme_df_ordered = theme_df.set_index("Thema").loc[theme_order].reset_index()
-        theme_bar = px.bar(
-            theme_df_ordered,
-            x="Score_%",
-            y="Thema",
-            orientation="h",
-            text="Score_%",
-            color="Thema",
-            color_discrete_map=theme_colors_soft,
-        )
-        theme_bar.update_traces(texttemplate="%{text:.0f}%", textposition="outside")
-        theme_bar.update_layout(
-            height=320,
-            showlegend=False,
-            xaxis_title="",
-            yaxis_title="",
-            bargap=0.25,
-            yaxis=dict(tickfont=dict(color="#0F172A")),
+
+# ============================================================================
+# PAGE: RESULTS
+# ============================================================================
+
+PDF_POLL_INTERVAL = "1s"
+
+
+@st.fragment(run_every=PDF_POLL_INTERVAL)
+def _poll_pdf_job():
+    """Fortschritt des laufenden PDF-Jobs; nach Abschluss wird die Seite neu aufgebaut."""
+    job = pdf_jobs.job_status(st.session_state.pdf_job_id)
+    if job is None or job["status"] not in (pdf_jobs.QUEUED, pdf_jobs.RUNNING):
+        st.rerun()
+    if job["status"] == pdf_jobs.QUEUED:
+        st.progress(0.0, text="PDF-Report wartet auf einen freien Platz …")
+    else:
+        st.progress(job["progress"], text=f"PDF-Report wird erstellt … {job['progress'] * 100:.0f} %")
+
+
+def _render_pdf_job(job):
+    """Download bzw. Fehlermeldung eines abgeschlossenen PDF-Jobs."""
+    if job is None:
+        st.session_state.pdf_job_id = None
+        st.info("Der erstellte Report ist abgelaufen. Bitte erneut erstellen.")
+        return
+    if job["status"] == pdf_jobs.FAILED:
+        st.error(f"PDF-Generierung fehlgeschlagen: {job['error']}")
+        return
+    st.download_button(
+        label="PDF herunterladen",
+        data=pdf_jobs.job_result(st.session_state.pdf_job_id),
+        file_name=f"Circularity_Assessment_{datetime.now().strftime('%Y%m%d')}.pdf",
+        mime="application/pdf",
+        use_container_width=True,
+    )
+    if job["cached"]:
+        st.caption("Unveränderter Report, aus dem Cache geladen")
+    else:
+        st.caption(
+            f"Erstellt in {(job['finished'] - job['submitted']) * 1000:.0f} ms "
+            f"(Warteschlange {((job['started'] or job['finished']) - job['submitted']) * 1000:.0f} ms), "
+            f"Diagramme {job['timings'].get('charts', 0.0) * 1000:.0f} ms"
         )
-        st.plotly_chart(theme_bar, use_container_width=True)
-
-    with tab_indicators:
-        st.markdown("### Indikator-Details")
-        selected_theme = st.selectbox("Thema filtern", ["Alle"] + list(CIRCULAR_MODEL.keys()))
-        view_df = indicator_df
-        if selected_theme != "Alle":
-            view_df = indicator_df[indicator_df["Thema"] == selected_theme]
-        chart_df = view_df.copy()
-        chart_df["Score"] = chart_df["Score"].fillna(0)
-        chart_df["Score_%"] = chart_df["Score_%"].fillna(0)
-        chart_df = chart_df.sort_values(["ThemeOrder", "Order", "Indikator"], ascending=True)
-        y_order = chart_df["Indikator"].tolist()
-        if selected_theme == "Alle":
-            bar_color = "Thema"
-            color_map = theme_colors_soft
+
+
+def _benchmark_ranks(tables: dict) -> dict:
+    """Perzentilränge im eigenen Sektor und über alle Sektoren (aus den Benchmark-Sketches)."""
+    result = {"indicator": tables["scores"], "dimension": tables["theme_scores"], "total": tables["total"]}
+    index = get_benchmark()
+    sector = (st.session_state.sector or "").strip() or None
+    return {
+        "sector": sector,
+        "in_sector": index.compare(result, sector) if sector else None,
+        "overall": index.compare(result),
+    }
+
+
+def _format_rank(rank) -> str:
+    return "—" if rank is None else f"{rank:.0f}. Perzentil"
+
+
+def _render_benchmark(ranks: dict):
+    st.markdown("### Branchenvergleich")
+    overall = ranks["overall"]
+    in_sector = ranks["in_sector"]
+    if overall["n"] == 0:
+        st.caption("Noch keine gespeicherten Assessments zum Vergleich vorhanden.")
+        return
+    col1, col2 = st.columns(2)
+    with col1:
+        if in_sector and in_sector["n"]:
+            st.metric(f"Gesamtscore im Sektor {ranks['sector']}", _format_rank(in_sector["total"]))
+            st.caption(f"Vergleich mit {in_sector['n']} gespeicherten Assessments des Sektors")
         else:
-            bar_color = None
-            color_map = None
-        ind_bar = px.bar(
-            chart_df,
-            x="Score_%",
-            y="Indikator",
-            orientation="h",
-            text="Score_%",
-            color=bar_color,
-            color_discrete_map=color_map,
+            st.metric("Gesamtscore im Sektor", "—")
+            st.caption("Für diesen Sektor liegen noch keine gespeicherten Assessments vor.")
+    with col2:
+        st.metric("Gesamtscore über alle Sektoren", _format_rank(overall["total"]))
+        st.caption(f"Vergleich mit {overall['n']} gespeicherten Assessments")
+    rows = []
+    for theme in CIRCULAR_MODEL.keys():
+        row = {"Dimension": theme}
+        if in_sector and in_sector["n"]:
+            row["Perzentil (Sektor)"] = in_sector["dimension"].get(theme)
+        row["Perzentil (alle)"] = overall["dimension"].get(theme)
+        rows.append(row)
+    st.dataframe(
+        pd.DataFrame(rows),
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            column: st.column_config.NumberColumn(column, format="%.0f")
+            for column in ("Perzentil (Sektor)", "Perzentil (alle)")
+        },
+    )
+
+
+def _results_overview(fingerprint: str, tables: dict):
+    """Überblick: Reifegrad, Radar, Branchenvergleich und Reifegradskala."""
+    theme_scores = tables["theme_scores"]
+    total_01 = tables["total"]
+    total_score = total_01 * 5.0
+    level = tables["level"]
+
+    st.markdown("### Ihre Zirkularitätsreife")
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        scale_html = "<br/>".join(
+            [
+                f"{m['emoji']} {m['name']} ({m.get('label', '')}) ({rng})"
+                for m, (_, rng) in zip(MATURITY_LEVELS, MATURITY_SCALE)
+            ]
         )
-        ind_bar.update_traces(texttemplate="%{text:.0f}%", textposition="outside")
-        if selected_theme != "Alle":
-            ind_bar.update_traces(marker_color=theme_colors_soft.get(selected_theme, "#0F172A"))
-        chart_height = max(420, 28 * len(chart_df) + 120)
-        ind_bar.update_layout(
-            height=chart_height,
-            showlegend=selected_theme == "Alle",
-            xaxis_title="",
-            yaxis_title="",
-            yaxis=dict(categoryorder="array", categoryarray=y_order, autorange="reversed", tickfont=dict(color="#0F172A")),
+        st.markdown(
+            f"""
+        <div style='padding: 20px; background: #ffffff; border-radius: 16px;
+                    border: 1px solid rgba(15,23,42,0.08); box-shadow: 0 10px 28px rgba(15,23,42,0.06);
+                    text-align: center;'>
+            <h4 style='margin-top: 0; color: #0F172A;'>Reifegrad</h4>
+            <div style='font-size: 3em; font-weight: 900; color: #0F172A; margin: 10px 0;'>{level['emoji']}</div>
+            <p style='margin: 5px 0; font-size: 1.4em; font-weight: 800;'>{level['name']} ({level.get('label', '')})</p>
+            <p style='margin: 5px 0; color: rgba(15,23,42,0.65);'>{level['description']}</p>
+            <hr style='margin: 10px 0; border:none; border-top:1px solid rgba(15,23,42,0.10);'>
+            <p style='margin: 5px 0; font-size: 1em;'><strong>Gewichteter Score:</strong> {total_score:.2f}/5.0</p>
+            <p style='margin: 5px 0; font-size: 1em;'><strong>Gewichteter Prozentwert:</strong> {total_01*100:.0f}%</p>
+            <hr style='margin: 10px 0; border:none; border-top:1px dashed rgba(15,23,42,0.12);'>
+            <div style='text-align:left; font-size:0.92em; color: rgba(15,23,42,0.8);'>
+              <strong>Reifegrad-Skala</strong><br/>{scale_html}
+            </div>
+        </div>
+        """,
+            unsafe_allow_html=True,
         )
-        with st.container(height=520):
-            st.plotly_chart(ind_bar, use_container_width=True)
-        display_df = view_df.copy()
-        display_df = display_df.drop(columns=[c for c in ["Score_%", "Order", "ThemeOrder"] if c in display_df.columns])
-        display_df = display_df.rename(columns={"Score": "Aggregierter Score"})
-        st.dataframe(display_df.sort_values("Aggregierter Score", ascending=True), use_container_width=True, hide_index=True)
-
-    with tab_questions:
-        st.markdown("### Leitfragen-Details")
-        col1, col2 = st.columns([1, 1])
-        with col1:
-            q_theme = st.selectbox("Dimension", ["Alle"] + list(CIRCULAR_MODEL.keys()), key="q_theme_filter")
-        with col2:
-            q_indicator = st.selectbox(
-                "Indikator",
-                ["Alle"]
-                + (
-                    list(CIRCULAR_MODEL.get(q_theme, {}).keys())
-                    if q_theme != "Alle"
-                    else sorted(detail_df["Indikator"].unique().tolist())
-                ),
-                key="q_indicator_filter",
-            )
 
-        q_df = detail_df
-        if q_theme != "Alle":
-            q_df = q_df[q_df["Thema"] == q_theme]
-        if q_indicator != "Alle":
-            q_df = q_df[q_df["Indikator"] == q_indicator]
+    st.markdown("### Radar-Chart")
+    st.plotly_chart(_radar_figure(fingerprint, theme_scores), use_container_width=True)
+
+    _render_benchmark(_benchmark_ranks(tables))
+
+    st.markdown("### Detaillierte Berechnung mit Gewichtungen")
+    weighted_terms = []
+    for dim in CIRCULAR_MODEL.keys():
+        score = theme_scores.get(dim, 0.0)
+        weight = st.session_state.weights.get(dim, 0.0)
+        weighted_terms.append(f"{score:.2f} \\cdot {weight:.2f}")
+    numerator = " + ".join(weighted_terms) if weighted_terms else "0"
+    denominator = " + ".join([f"{st.session_state.weights.get(dim, 0.0):.2f}" for dim in CIRCULAR_MODEL.keys()]) or "1"
+    total_5 = total_01 * 5.0
+    st.latex(
+        rf"\text{{Gesamtscore}}=\frac{{{numerator}}}{{{denominator}}}={total_01:.2f}"
+    )
+    st.markdown("### Reifestufen im Überblick")
+    for stage, (_, interval) in zip(MATURITY_LEVELS, MATURITY_SCALE):
+        st.markdown(
+            f"""
+            <div style="margin-bottom:12px; padding:16px 18px; background:#ffffff; border:1px solid rgba(15,23,42,0.08);
+                        border-radius:14px; box-shadow:0 8px 22px rgba(15,23,42,0.05);">
+                <div style="font-weight:900; color:#0F172A;">{stage['emoji']} {stage['name']} ({stage.get('label', '')})</div>
+                <div style="font-size:13px; color:rgba(15,23,42,0.56); margin:4px 0 8px 0;">Zuordnung: {interval}</div>
+                <div style="color:#334155; line-height:1.55;">{html.escape(stage['description'])}</div>
+            </div>
+            """,
+            unsafe_allow_html=True,
+        )
 
-        unanswered = q_df[q_df["Bewertet"] == False]
-        answered = q_df[q_df["Bewertet"] == True]
 
-        col_a, _ = st.columns([1, 2])
-        with col_a:
-            total_questions = len(q_df)
-            st.markdown(
-                f"""
-                <div style="font-weight:900; font-size:16px; color:#0F172A;">Nicht bewertet</div>
-                <div style="font-weight:900; font-size:28px; color:#0F172A;">{len(unanswered)}/{total_questions}</div>
-                """,
-                unsafe_allow_html=True,
-            )
+def _results_dimensions(fingerprint: str, tables: dict):
+    """Dimensionen: Gauges und Ranking."""
+    st.markdown("### Dimensionenübersicht")
+    figures = _dimension_figures(fingerprint, tables["theme_df_ordered"])
+    st.plotly_chart(figures["gauges"], use_container_width=True)
+    st.markdown("### Dimensionen-Ranking")
+    st.plotly_chart(figures["ranking"], use_container_width=True)
+
+
+def _results_indicators(fingerprint: str, tables: dict):
+    """Indikatoren: Balkendiagramm und Tabelle, optional je Dimension gefiltert."""
+    indicator_df = tables["indicator_df"]
+
+    st.markdown("### Indikator-Details")
+    selected_theme = st.selectbox("Thema filtern", ["Alle"] + list(CIRCULAR_MODEL.keys()))
+    view_df = indicator_df
+    if selected_theme != "Alle":
+        view_df = indicator_df[indicator_df["Thema"] == selected_theme]
+    with st.container(height=520):
+        st.plotly_chart(_indicator_figure(fingerprint, selected_theme, view_df), use_container_width=True)
+    display_df = view_df.copy()
+    display_df = display_df.drop(columns=[c for c in ["Score_%", "Order", "ThemeOrder"] if c in display_df.columns])
+    display_df = display_df.rename(columns={"Score": "Aggregierter Score"})
+    ranks = _benchmark_ranks(tables)
+    peer = ranks["in_sector"] if ranks["in_sector"] and ranks["in_sector"]["n"] else ranks["overall"]
+    display_df["Perzentil"] = pd.Series(
+        [peer["indicator"].get(key) for key in zip(display_df["Thema"], display_df["Indikator"])],
+        index=display_df.index,
+        dtype=float,
+    ).round()
+    st.dataframe(display_df.sort_values("Aggregierter Score", ascending=True), use_container_width=True, hide_index=True)
+
+
+def _results_questions(fingerprint: str, tables: dict):
+    """Leitfragen: Antworten je Frage und Score-Verteilung."""
+    detail_df = tables["detail_df"]
+
+    st.markdown("### Leitfragen-Details")
+    col1, col2 = st.columns([1, 1])
+    with col1:
+        q_theme = st.selectbox("Dimension", ["Alle"] + list(CIRCULAR_MODEL.keys()), key="q_theme_filter")
+    with col2:
+        q_indicator = st.selectbox(
+            "Indikator",
+            ["Alle"]
+            + (
+                list(CIRCULAR_MODEL.get(q_theme, {}).keys())
+                if q_theme != "Alle"
+                else sorted(detail_df["Indikator"].unique().tolist())
+            ),
+            key="q_indicator_filter",
+        )
 
-        score_counts = (
-            answered.dropna(subset=["Score"])
-            .groupby("Score")["Frage-Code"]
-            .count()
-            .reset_index()
-            .rename(columns={"Frage-Code": "Anzahl"})
+    q_df = detail_df
+    if q_theme != "Alle":
+        q_df = q_df[q_df["Thema"] == q_theme]
+    if q_indicator != "Alle":
+        q_df = q_df[q_df["Indikator"] == q_indicator]
+
+    unanswered = q_df[q_df["Bewertet"] == False]
+    answered = q_df[q_df["Bewertet"] == True]
+
+    col_a, _ = st.columns([1, 2])
+    with col_a:
+        total_questions = len(q_df)
+        st.markdown(
+            f"""
+            <div style="font-weight:900; font-size:16px; color:#0F172A;">Nicht bewertet</div>
+            <div style="font-weight:900; font-size:28px; color:#0F172A;">{len(unanswered)}/{total_questions}</div>
+            """,
+            unsafe_allow_html=True,
         )
-        if not score_counts.empty:
-            if q_theme != "Alle":
-                scale = ["#F1F5F9", theme_colors.get(q_theme, "#B7791F")]
-            else:
-                scale = ["#FFF6E8", "#B7791F"]
-            dist_chart = px.bar(
-                score_counts,
-                x="Score",
-                y="Anzahl",
-                text="Anzahl",
-                color="Score",
-                color_continuous_scale=scale,
-            )
-            dist_chart.update_traces(textposition="outside")
-            dist_chart.update_layout(
-                height=280,
-                coloraxis_showscale=False,
-                xaxis_title="Score",
-                yaxis_title="Anzahl",
-            )
-            st.plotly_chart(dist_chart, use_container_width=True)
-        else:
-            st.info("Noch keine bewerteten Leitfragen vorhanden.")
-
-        def format_question_table(df: pd.DataFrame) -> pd.DataFrame:
-            display = df.copy()
-            if "Score_%" in display.columns:
-                display = display.drop(columns=["Score_%"])
-            if "Score" in display.columns:
-                display = display.rename(columns={"Score": "Aggregierter Score"})
-            if "Bewertet" in display.columns:
-                display["Bewertet"] = display["Bewertet"].map({True: "Ja", False: "Nein"})
-            return display
-
-        if len(unanswered) > 0:
-            with st.expander("Nicht bewertete Leitfragen anzeigen", expanded=True):
-                unanswered_display = format_question_table(
-                    unanswered.sort_values(["Thema", "Indikator", "Frage-Code"])
-                )
-                st.dataframe(
-                    unanswered_display,
-                    use_container_width=True,
-                    hide_index=True,
-                    height=320,
-                )
 
-        with st.expander("Alle Leitfragen anzeigen", expanded=False):
-            all_display = format_question_table(
-                q_df.sort_values(["Thema", "Indikator", "Frage-Code"])
+    dist_chart = _score_distribution_figure(fingerprint, q_theme, q_indicator, answered)
+    if dist_chart is not None:
+        st.plotly_chart(dist_chart, use_container_width=True)
+    else:
+        st.info("Noch keine bewerteten Leitfragen vorhanden.")
+
+    def format_question_table(df: pd.DataFrame) -> pd.DataFrame:
+        display = df.copy()
+        if "Score_%" in display.columns:
+            display = display.drop(columns=["Score_%"])
+        if "Score" in display.columns:
+            display = display.rename(columns={"Score": "Aggregierter Score"})
+        if "Bewertet" in display.columns:
+            display["Bewertet"] = display["Bewertet"].map({True: "Ja", False: "Nein"})
+        return display
+
+    if len(unanswered) > 0:
+        with st.expander("Nicht bewertete Leitfragen anzeigen", expanded=True):
+            unanswered_display = format_question_table(
+                unanswered.sort_values(["Thema", "Indikator", "Frage-Code"])
             )
             st.dataframe(
-                all_display,
+                unanswered_display,
                 use_container_width=True,
                 hide_index=True,
-                height=420,
+                height=320,
             )
 
-    with tab_recommendations:
-        st.markdown("### Handlungsempfehlungen")
-        st.caption("Angezeigt werden nur Indikatoren mit einer Einzelbewertung unter 50 %.")
+    with st.expander("Alle Leitfragen anzeigen", expanded=False):
+        all_display = format_question_table(
+            q_df.sort_values(["Thema", "Indikator", "Frage-Code"])
+        )
+        st.dataframe(
+            all_display,
+            use_container_width=True,
+            hide_index=True,
+            height=420,
+        )
 
-        if recommendation_df.empty:
-            st.success("Aktuell liegt kein Indikator unter 50 %. Es werden daher keine Handlungsempfehlungen angezeigt.")
-        else:
-            for row in recommendation_df.itertuples(index=False):
-                recommendation_text = INDICATOR_RECOMMENDATIONS.get(row.Indikator)
-                score_pct = int(round((row.Score or 0) * 100))
-                if not recommendation_text:
-                    st.warning(f"Für {row.Indikator} wurde in Anhang III keine Handlungsempfehlung gefunden.")
-                    continue
-                st.markdown(
-                    f"""
-                    <div style="margin-bottom:14px; padding:18px; background:#ffffff; border-radius:16px;
-                                border:1px solid rgba(15,23,42,0.08); box-shadow:0 10px 24px rgba(15,23,42,0.05);">
-                        <div style="font-size:13px; font-weight:800; color:{theme_colors.get(row.Thema, '#0F172A')}; text-transform:uppercase; letter-spacing:0.03em;">
-                            {html.escape(row.Thema)}
-                        </div>
-                        <div style="margin-top:4px; font-size:18px; font-weight:900; color:#0F172A;">
-                            {html.escape(row.Indikator)}
-                        </div>
-                        <div style="margin:6px 0 10px 0; color:rgba(15,23,42,0.62); font-weight:700;">
-                            Einzelbewertung: {score_pct} %
-                        </div>
-                        <div style="color:#334155; line-height:1.6;">{html.escape(recommendation_text)}</div>
+
+def _results_recommendations(fingerprint: str, tables: dict):
+    """Handlungsempfehlungen für Indikatoren unter 50 %."""
+    recommendations = tables["recommendations"]
+
+    st.markdown("### Handlungsempfehlungen")
+    st.caption("Angezeigt werden nur Indikatoren mit einer Einzelbewertung unter 50 %.")
+
+    if not recommendations:
+        st.success("Aktuell liegt kein Indikator unter 50 %. Es werden daher keine Handlungsempfehlungen angezeigt.")
+    else:
+        for item in recommendations:
+            recommendation_text = item["Empfehlung"]
+            score_pct = int(round((item["Score"] or 0) * 100))
+            if not recommendation_text:
+                st.warning(f"Für {item['Indikator']} wurde in Anhang III keine Handlungsempfehlung gefunden.")
+                continue
+            st.markdown(
+                f"""
+                <div style="margin-bottom:14px; padding:18px; background:#ffffff; border-radius:16px;
+                            border:1px solid rgba(15,23,42,0.08); box-shadow:0 10px 24px rgba(15,23,42,0.05);">
+                    <div style="font-size:13px; font-weight:800; color:{THEME_COLORS.get(item['Thema'], '#0F172A')}; text-transform:uppercase; letter-spacing:0.03em;">
+                        {html.escape(item['Thema'])}
                     </div>
-                    """,
-                    unsafe_allow_html=True,
+                    <div style="margin-top:4px; font-size:18px; font-weight:900; color:#0F172A;">
+                        {html.escape(item['Indikator'])}
+                    </div>
+                    <div style="margin:6px 0 10px 0; color:rgba(15,23,42,0.62); font-weight:700;">
+                        Einzelbewertung: {score_pct} %
+                    </div>
+                    <div style="color:#334155; line-height:1.6;">{html.escape(recommendation_text)}</div>
+                </div>
+                """,
+                unsafe_allow_html=True,
+            )
+
+
+def _results_export(fingerprint: str, tables: dict):
+    """Export: Speichern und PDF-Report."""
+    theme_scores = tables["theme_scores"]
+
+    st.markdown("### Export & Speicherung")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        product_name = st.text_input("Produktname", st.session_state.product_name or "Mein Produkt")
+        company = st.text_input("Unternehmensname", st.session_state.company_name or "Mein Unternehmen")
+        sector = st.text_input("Sektor", st.session_state.sector or "Nicht angegeben")
+
+        if st.button("Assessment speichern", use_container_width=True, type="primary"):
+            st.session_state.product_name = product_name
+            st.session_state.company_name = company
+            st.session_state.sector = sector
+            save_assessment_mc(st.session_state.theme_answers, product_name=product_name, company=company)
+            st.success(f"Lokal gespeichert ({get_store().location})")
+
+    with col2:
+        job = pdf_jobs.job_status(st.session_state.pdf_job_id) if st.session_state.pdf_job_id else None
+        busy = job is not None and job["status"] in (pdf_jobs.QUEUED, pdf_jobs.RUNNING)
+        if st.button("PDF-Report erstellen", use_container_width=True, disabled=busy):
+            if job is not None:
+                pdf_jobs.discard(st.session_state.pdf_job_id)
+            try:
+                st.session_state.pdf_job_id = pdf_jobs.submit(
+                    product_name=product_name,
+                    company=company,
+                    theme_scores=dict(theme_scores),
+                    weights=dict(st.session_state.weights),
+                    detailed_answers=copy.deepcopy(st.session_state.theme_answers),
+                    improvement_areas=[],
+                    theme_colors=THEME_COLORS,
+                    # Nur das Datum: die Uhrzeit würde den Cache-Schlüssel minütlich ändern
+                    assessment_date=datetime.now().date().isoformat(),
                 )
+            except pdf_jobs.JobQueueFull:
+                st.session_state.pdf_job_id = None
+                st.warning("Derzeit werden zu viele Reports erstellt. Bitte in einigen Sekunden erneut versuchen.")
+            else:
+                busy = True
+        if busy:
+            _poll_pdf_job()
+        elif st.session_state.pdf_job_id:
+            _render_pdf_job(job)
+
+
+RESULTS_SECTIONS = {
+    "Überblick": _results_overview,
+    "Dimensionen": _results_dimensions,
+    "Indikatoren": _results_indicators,
+    "Leitfragen": _results_questions,
+    "Handlungsempfehlungen": _results_recommendations,
+    "Export": _results_export,
+}
+RESULTS_DEFAULT_SECTION = "Überblick"
 
-    with tab_export:
-        st.markdown("### Export & Speicherung")
-        col1, col2 = st.columns(2)
-
-        with col1:
-            product_name = st.text_input("Produktname", st.session_state.product_name or "Mein Produkt")
-            company = st.text_input("Unternehmensname", st.session_state.company_name or "Mein Unternehmen")
-            sector = st.text_input("Sektor", st.session_state.sector or "Nicht angegeben")
-
-            if st.button("Assessment speichern", use_container_width=True, type="primary"):
-                st.session_state.product_name = product_name
-                st.session_state.company_name = company
-                st.session_state.sector = sector
-                save_assessment_mc(st.session_state.theme_answers, product_name=product_name, company=company)
-                st.success("Lokal gespeichert (assessments.json)")
-
-        with col2:
-            if st.button("PDF-Report herunterladen", use_container_width=True):
-                try:
-                    pdf_buffer = generate_pdf_report(
-                        product_name=product_name,
-                        company=company,
-                        theme_scores=theme_scores,
-                        weights=st.session_state.weights,
-                        detailed_answers=st.session_state.theme_answers,
-                        improvement_areas=[],
-                        theme_colors=theme_colors,
-                    )
-                except Exception as e:
-                    st.error(f"PDF-Generierung fehlgeschlagen: {str(e)}")
-                else:
-                    st.download_button(
-                        label="PDF herunterladen",
-                        data=pdf_buffer.getvalue(),
-                        file_name=f"Circularity_Assessment_{datetime.now().strftime('%Y%m%d')}.pdf",
-                        mime="application/pdf",
-                        use_container_width=True,
-                    )
+
+def render_results():
+    st.header("Ergebnisse & Dashboard")
+    st.markdown(
+        "<style>div[data-testid='stSpinner']{display:none;}</style>",
+        unsafe_allow_html=True,
+    )
+
+    fingerprint = results_fingerprint(st.session_state.theme_answers, st.session_state.weights)
+    tables = _results_tables(fingerprint, st.session_state.theme_answers, st.session_state.weights)
+
+    # Nur der geöffnete Bereich wird berechnet und gesendet; bereits geöffnete
+    # Bereiche kommen beim Zurückwechseln aus den Fingerprint-Caches
+    section = st.segmented_control(
+        "Bereich",
+        list(RESULTS_SECTIONS),
+        default=RESULTS_DEFAULT_SECTION,
+        key="results_section",
+        label_visibility="collapsed",
+    )
+    RESULTS_SECTIONS[section or RESULTS_DEFAULT_SECTION](fingerprint, tables)
 
 
 # ============================================================================
 # PAGE: HISTORY
 # ============================================================================
 
+def _history_labels(records) -> list:
+    """Auswahl-Beschriftung je Eintrag: laufende Nummer, Zeitpunkt, Unternehmen, Produkt."""
+    return [
+        f"{idx + 1}: {str(r.get('Timestamp') or r.get('timestamp') or '')[:16]} – "
+        f"{r.get('Unternehmen') or r.get('Company') or '—'} – {r.get('Produkt') or r.get('Product_Name') or '—'}"
+        for idx, r in enumerate(records)
+    ]
+
+
+COMPARISON_DEFAULT_SELECTION = 5
+# Historie: Einträge je Seite (Übersicht, Vergleich, Detailtabelle, Export)
+HISTORY_PAGE_SIZE = 200
+
+
+def _select_records(label: str, labels: list, key: str, default=None) -> list:
+    """
+    Auswahl von Historien-Einträgen (Indizes)
+
+    Statt eines Multiselects mit allen Einträgen gibt es eine ausdrückliche
+    Option "Alle auswählen"; das Multiselect startet mit ``default`` (leer).
+    """
+    if st.checkbox(f"Alle {len(labels)} auswählen", key=f"{key}_all"):
+        return list(range(len(labels)))
+    return st.multiselect(
+        label,
+        list(range(len(labels))),
+        default=default or [],
+        format_func=lambda idx: labels[idx],
+        key=key,
+    )
+
+
+def _render_comparison(records, dim_scores):
+    """Radar-Vergleich einer Auswahl (Dimensionen aus materialized_scores, ein Durchlauf)."""
+    st.markdown("### Vergleich (Dimensionen)")
+    labels = _history_labels(records)
+    # Historie ist chronologisch: die neuesten Einträge stehen am Ende
+    newest = list(range(max(0, len(records) - COMPARISON_DEFAULT_SELECTION), len(records)))
+    selected = _select_records("Assessments vergleichen", labels, key="comparison_selection", default=newest)
+    if len(selected) < 2:
+        st.info("Für einen Vergleich mindestens zwei Assessments auswählen.")
+        return
+    st.plotly_chart(
+        create_comparison_chart(dim_scores[selected], [labels[idx] for idx in selected], SCORING_ENGINE.themes),
+        use_container_width=True,
+    )
+    if len(selected) > COMPARISON_MAX_OVERLAYS:
+        st.caption(
+            f"{len(selected)} Assessments: Median, Interquartilsbereich und Spannweite je Dimension "
+            f"(einzelne Profile bis {COMPARISON_MAX_OVERLAYS} Assessments)."
+        )
+
+
+def _render_score_heatmap(filters: dict):
+    """Heatmap Assessments x Leitfragen/Indikatoren aus der dichten Score-Matrix (siehe score_matrix)."""
+    st.markdown("### Heatmap (Leitfragen)")
+    level = st.segmented_control(
+        "Ebene", ["Leitfragen", "Indikatoren"], default="Leitfragen", key="history_heatmap_level"
+    )
+    values, rows = score_matrix.get_score_matrix().select(**filters)
+    if len(values) == 0:
+        st.info("Keine Assessments für die Heatmap vorhanden.")
+        return
+    labels = _history_labels([dict(zip(score_matrix.ROW_FIELDS, row)) for row in rows])
+    if level == "Indikatoren":
+        values = SCORING_ENGINE.indicator_scores(values).astype(np.float32)
+        columns = [indicator for _, indicator in SCORING_ENGINE.indicators]
+    else:
+        columns = SCORING_ENGINE.codes
+    st.plotly_chart(create_score_heatmap(values, labels, columns), use_container_width=True)
+    if len(values) > HEATMAP_MAX_ROWS:
+        st.caption(
+            f"{len(values)} Assessments in höchstens {HEATMAP_MAX_ROWS} Zeilen: "
+            "aufeinanderfolgende Assessments sind gemittelt, leere Felder = keine Auswahl."
+        )
+
+
+@st.fragment(run_every=PDF_POLL_INTERVAL)
+def _poll_batch_export():
+    """Fortschritt des laufenden Batch-Exports; nach Abschluss wird die Seite neu aufgebaut."""
+    from report_batch import RUNNING, export_status
+
+    status = export_status(st.session_state.batch_export_job)
+    if status is None or status["status"] != RUNNING:
+        st.rerun()
+    st.progress(
+        status["done"] / max(status["total"], 1),
+        text=f"{status['done']} von {status['total']} Reports erstellt",
+    )
+
+
+def _batch_export_downloaded():
+    """Nach dem Download: ZIP und Zusammenfassung verwerfen."""
+    from report_batch import discard_export
+
+    discard_export(st.session_state.batch_export_job)
+    st.session_state.batch_export_job = None
+
+
+def _render_batch_export(records):
+    """PDF-Reports mehrerer gespeicherter Assessments als ZIP (Hintergrund-Export, siehe report_batch)."""
+    from report_batch import FAILED, RUNNING, ExportBusy, discard_export, export_status, start_export
+
+    st.markdown("### Batch-Export (PDF-Reports als ZIP)")
+    selected = _select_records("Assessments", _history_labels(records), key="batch_export_selection")
+    job_id = st.session_state.get("batch_export_job")
+    status = export_status(job_id) if job_id else None
+    running = status is not None and status["status"] == RUNNING
+    if st.button("ZIP erstellen", disabled=not selected or running, use_container_width=True):
+        if job_id:
+            discard_export(job_id)
+        BATCH_EXPORT_DIR.mkdir(parents=True, exist_ok=True)
+        zip_path = BATCH_EXPORT_DIR / f"Circularity_Reports_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
+        try:
+            job_id = start_export(
+                [records[idx] for idx in selected], zip_path, fallback_weights=dict(st.session_state.weights)
+            )
+        except ExportBusy:
+            job_id = None
+            st.warning("Es läuft bereits ein Batch-Export. Bitte in einigen Sekunden erneut versuchen.")
+        st.session_state.batch_export_job = job_id
+        status = export_status(job_id) if job_id else None
+        running = status is not None
+
+    if status is None:
+        st.session_state.batch_export_job = None
+        return
+    if running:
+        _poll_batch_export()
+        return
+    if status["status"] == FAILED:
+        st.error(f"Batch-Export fehlgeschlagen: {status['error']}")
+        return
+
+    summary = status["summary"]
+    zip_path = Path(summary["path"])
+    for message in summary["errors"]:
+        st.error(message)
+    if not zip_path.exists():
+        st.session_state.batch_export_job = None
+        st.info("Die ZIP-Datei ist nicht mehr vorhanden. Bitte erneut erstellen.")
+        return
+    # Die ZIP-Bytes werden nur nach ausdrücklicher Anforderung gelesen und übertragen
+    if st.button(
+        f"ZIP bereitstellen ({len(summary['reports'])} Reports, {zip_path.stat().st_size / 1024:.0f} KB)",
+        use_container_width=True,
+    ):
+        st.download_button(
+            label="ZIP herunterladen",
+            data=zip_path.read_bytes(),
+            file_name=zip_path.name,
+            mime="application/zip",
+            on_click=_batch_export_downloaded,
+            type="primary",
+            use_container_width=True,
+        )
+    st.caption(f"Gesamtdauer {summary['total_s']:.2f} s")
+    st.dataframe(
+        pd.DataFrame(
+            [
+                {
+                    "Datei": entry["name"],
+                    "Dauer (ms)": round(entry["seconds"] * 1000),
+                    "Größe (KB)": round(entry["bytes"] / 1024),
+                    "Aus Cache": entry["cached"],
+                }
+                for entry in summary["reports"]
+            ]
+        ),
+        use_container_width=True,
+        hide_index=True,
+    )
+
+
+def _render_product_trend(product: str, timestamps: list, dim_scores, totals):
+    """Verlauf eines Produkts: Scores über die Zeit und Wechsel des Reifegrads."""
+    st.markdown(f"### Verlauf: {product}")
+    if len(timestamps) < 2:
+        st.info("Für einen Verlauf werden mindestens zwei Assessments dieses Produkts benötigt.")
+        return
+
+    parsed = pd.to_datetime(pd.Series(timestamps), errors="coerce")
+    x_values = timestamps if parsed.isna().any() else parsed.tolist()
+    theme_scores = {theme: dim_scores[:, idx].tolist() for idx, theme in enumerate(SCORING_ENGINE.themes)}
+    st.plotly_chart(
+        create_trend_chart(x_values, totals.tolist(), theme_scores, theme_colors=THEME_COLORS),
+        use_container_width=True,
+    )
+
+    transitions = maturity_transitions(timestamps, totals.tolist())
+    rows = [
+        {
+            "Timestamp": str(t["timestamp"])[:16],
+            "Von": f"{t['from']['emoji']} {t['from']['name']}" if t["from"] else "—",
+            "Nach": f"{t['to']['emoji']} {t['to']['name']}",
+            "Gesamtscore": round(t["score"] * 5.0, 2),
+        }
+        for t in transitions
+    ]
+    st.markdown("**Reifegrad-Wechsel**")
+    st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+
+
 def render_history():
     st.header("Assessment-Historie (lokal)")
 
-    history_local = load_assessment_history_local()
-    history = pd.DataFrame(history_local) if history_local else None
-
-    if history is not None and len(history) > 0:
-        def extract_answers(row):
-            if isinstance(row.get("answers"), dict):
-                return row.get("answers")
-            if isinstance(row.get("Detailed_Answers"), str):
-                try:
-                    return json.loads(row.get("Detailed_Answers"))
-                except Exception:
-                    return {}
-            return {}
-
-        def calc_dimension_scores_from_answers(ans):
-            scores = {}
-            for dim, indicators in CIRCULAR_MODEL.items():
-                vals = []
-                for ind_name, ind_data in indicators.items():
-                    q_scores = []
-                    for q in ind_data.get("questions", []):
-                        code = q.get("code", "")
-                        score = ans.get(dim, {}).get(ind_name, {}).get(code)
-                        if score is not None:
-                            q_scores.append(score)
-                    if q_scores:
-                        vals.append(sum(q_scores) / len(q_scores))
-                scores[dim] = (sum(vals) / len(vals)) if vals else 0.0
-            return scores
-
-        def normalize_row(row):
-            answers = extract_answers(row)
-            dim_scores = calc_dimension_scores_from_answers(answers)
-            weights = row.get("weights") or st.session_state.weights
-            weights_sum = sum(weights.get(d, 0.0) for d in CIRCULAR_MODEL.keys()) if isinstance(weights, dict) else 0.0
-            if weights_sum > 0:
-                total_01 = sum(dim_scores.get(d, 0.0) * weights.get(d, 0.0) for d in CIRCULAR_MODEL.keys()) / weights_sum
-            else:
-                total_01 = 0.0
-            total_5 = total_01 * 5.0
-            base = {
-                "Timestamp": row.get("Timestamp") or row.get("timestamp"),
-                "Produkt": row.get("Produkt") or row.get("Product_Name"),
-                "Unternehmen": row.get("Unternehmen") or row.get("Company"),
-                "Gewichteter Gesamtscore": round(total_5, 2),
-            }
-            for dim in CIRCULAR_MODEL.keys():
-                base[f"{dim} Score"] = round(dim_scores.get(dim, 0.0), 2)
-            return base
+    store = get_store()
+    if store.count() == 0:
+        st.info("Noch keine Assessments gespeichert.")
+        return
 
-        normalized = pd.DataFrame([normalize_row(r) for r in history_local])
+    filter_cols = st.columns(len(FILTER_FIELDS))
+    filters = {}
+    for col, field in zip(filter_cols, FILTER_FIELDS):
+        with col:
+            choice = st.selectbox(field, ["Alle"] + store.distinct(field), key=f"history_filter_{field}")
+            filters[field] = None if choice == "Alle" else choice
+
+    history_count = store.count(**filters)
+    pages = max(1, -(-history_count // HISTORY_PAGE_SIZE))
+    page = 1
+    if pages > 1:
+        if st.session_state.get("history_page", 1) > pages:
+            # Nach einem Filterwechsel gibt es ggf. weniger Seiten
+            st.session_state.history_page = 1
+        page = int(
+            st.number_input(
+                f"Seite (je {HISTORY_PAGE_SIZE} Einträge, neueste zuerst)",
+                min_value=1,
+                max_value=pages,
+                value=1,
+                key="history_page",
+            )
+        )
+    offset = (page - 1) * HISTORY_PAGE_SIZE
+
+    timeline = None
+    if filters.get("Produkt"):
+        # Nur die Einträge dieses Produkts laden, chronologisch für den Verlauf
+        timeline = store.product_timeline(
+            filters["Produkt"], **{k: v for k, v in filters.items() if k != "Produkt"}
+        )
+        stop = len(timeline) - offset
+        history_local = timeline[max(stop - HISTORY_PAGE_SIZE, 0):max(stop, 0)]
+    else:
+        # Nur die angezeigte Seite laden; innerhalb der Seite chronologisch
+        history_local = store.query(limit=HISTORY_PAGE_SIZE, offset=offset, newest_first=True, **filters)
+        history_local.reverse()
+    if pages > 1:
+        st.caption(f"Einträge {offset + 1}–{offset + len(history_local)} von {history_count} (neueste zuerst)")
+
+    if history_local:
+        dim_scores, totals = materialized_scores(history_local, st.session_state.weights)
+        normalized = pd.DataFrame(
+            {
+                "Timestamp": [r.get("Timestamp") or r.get("timestamp") for r in history_local],
+                "Produkt": [r.get("Produkt") or r.get("Product_Name") for r in history_local],
+                "Unternehmen": [r.get("Unternehmen") or r.get("Company") for r in history_local],
+                "Gewichteter Gesamtscore": np.round(totals * 5.0, 2),
+            }
+        )
+        for idx, dim in enumerate(SCORING_ENGINE.themes):
+            normalized[f"{dim} Score"] = np.round(dim_scores[:, idx], 2)
         st.markdown("### Übersicht (gewichteter Gesamtscore + Dimensionen)")
         st.dataframe(normalized, use_container_width=True, hide_index=True)
 
+        if timeline is not None:
+            if len(timeline) == len(history_local):
+                timeline_scores, timeline_totals = dim_scores, totals
+            else:
+                timeline_scores, timeline_totals = materialized_scores(timeline, st.session_state.weights)
+            _render_product_trend(
+                filters["Produkt"],
+                [record_field(r, "Timestamp") for r in timeline],
+                timeline_scores,
+                timeline_totals,
+            )
+
+        # Aggregate je (Unternehmen, Sektor) decken alle Filter außer Produkt ab
+        summary = None
+        if filters.get("Produkt") is None:
+            summary = aggregates.get_aggregates().summary(
+                company=filters.get("Unternehmen"), sector=filters.get("Sektor")
+            )
         col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Gesamt Assessments", len(normalized))
-        with col2:
-            avg_score = normalized["Gewichteter Gesamtscore"].dropna()
-            st.metric("Ø Score", f"{avg_score.mean():.2f}" if len(avg_score) > 0 else "—")
-        with col3:
-            if "Timestamp" in normalized.columns and len(normalized) > 0:
-                st.metric("Letztes Assessment", str(normalized["Timestamp"].iloc[-1])[:16])
+        if summary is not None:
+            with col1:
+                st.metric("Gesamt Assessments", summary["count"])
+            with col2:
+                mean_total = summary["total"]["mean"]
+                st.metric("Ø Score", f"{mean_total * 5.0:.2f}" if mean_total is not None else "—")
+            with col3:
+                if summary["latest"]:
+                    st.metric("Letztes Assessment", str(summary["latest"])[:16])
+            if summary["count"]:
+                st.dataframe(
+                    pd.DataFrame(
+                        [
+                            {
+                                "Dimension": theme,
+                                "Ø": stats["mean"],
+                                "σ": stats["std"],
+                                "Min": stats["min"],
+                                "Max": stats["max"],
+                            }
+                            for theme, stats in summary["dimensions"].items()
+                        ]
+                    ).round(2),
+                    use_container_width=True,
+                    hide_index=True,
+                )
+        else:
+            with col1:
+                st.metric("Gesamt Assessments", history_count)
+            with col2:
+                st.metric("Ø Score", f"{timeline_totals.mean() * 5.0:.2f}")
+            with col3:
+                st.metric("Letztes Assessment", str(record_field(timeline[-1], "Timestamp"))[:16])
+
+        _render_comparison(history_local, dim_scores)
 
         # Detailtabelle pro Leitfrage
         detail_rows = []
         for row in history_local:
-            answers = extract_answers(row)
+            answers = record_answers(row)
             ts = row.get("Timestamp") or row.get("timestamp")
             product = row.get("Produkt") or row.get("Product_Name")
             company = row.get("Unternehmen") or row.get("Company")
-            for dim, indicators in CIRCULAR_MODEL.items():
-                for ind_name, ind_data in indicators.items():
-                    for q in ind_data.get("questions", []):
-                        code = q.get("code", "")
-                        score = answers.get(dim, {}).get(ind_name, {}).get(code)
-                        if score is None:
+            # Nur beantwortete Codes auflösen, Reihenfolge nach Modellposition
+            answered = []
+            for dim, indicators in answers.items():
+                for ind_name, questions in (indicators or {}).items():
+                    for code, score in (questions or {}).items():
+                        entry = QUESTION_INDEX.get(code)
+                        if score is None or entry is None or entry[:2] != (dim, ind_name):
                             continue
-                        detail_rows.append(
-                            {
-                                "Timestamp": ts,
-                                "Produkt": product,
-                                "Unternehmen": company,
-                                "Dimension": dim,
-                                "Indikator": ind_name,
-                                "Fragennummer": code,
-                                "Fragenscore": score,
-                            }
-                        )
+                        answered.append((entry[2], dim, ind_name, code, score))
+            for _, dim, ind_name, code, score in sorted(answered):
+                detail_rows.append(
+                    {
+                        "Timestamp": ts,
+                        "Produkt": product,
+                        "Unternehmen": company,
+                        "Dimension": dim,
+                        "Indikator": ind_name,
+                        "Fragennummer": code,
+                        "Fragenscore": score,
+                    }
+                )
         detail_df = pd.DataFrame(detail_rows)
         st.markdown("### Detailtabelle (Leitfragen)")
         if not detail_df.empty:
             st.dataframe(detail_df, use_container_width=True, hide_index=True)
         else:
             st.info("Keine detaillierten Leitfragen in der Historie vorhanden.")
+
+        _render_score_heatmap(filters)
+        _render_batch_export(history_local)
     else:
-        st.info("Noch keine Assessments gespeichert.")
+        st.info("Keine Assessments für die gewählten Filter gefunden.")
 
 
 # ============================================================================
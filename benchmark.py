@@ -0,0 +1,222 @@
+# ============================================================================
+# BENCHMARK - SECTOR PERCENTILES OVER STORED ASSESSMENTS
+# ============================================================================
+# Per sector, every benchmark key (total score, each dimension, each
+# indicator) keeps a fixed-bin histogram over the 0-1 score range. The
+# histograms are mergeable quantile sketches: adding an assessment increments
+# one bin per key, "all sectors" is the sum over sectors, and percentile
+# ranks are read from cumulative counts without touching the history.
+# The sketches are persisted to BENCHMARK_PATH together with the store
+# sequence they cover; derived.DerivedStore compares it with the store on
+# every get_benchmark() call (O(1)), so saves from other processes are picked
+# up without a restart. A new MODEL_VERSION triggers one rebuild.
+# ============================================================================
+
+import os
+
+import numpy as np
+
+from config import BENCHMARK_PATH, DEFAULT_WEIGHTS, MODEL_VERSION
+from derived import DerivedStore
+from scoring import SCORING_ENGINE
+from storage import record_answers, record_field
+
+BENCHMARK_BINS = 100
+UNKNOWN_SECTOR = "Nicht angegeben"
+TOTAL_KEY = "Gesamt"
+
+
+def sector_of(record: dict) -> str:
+    return (record_field(record, "Sektor") or "").strip() or UNKNOWN_SECTOR
+
+
+class BenchmarkIndex:
+    """
+    Histogramm-Sketches je Sektor
+
+    Schlüssel (Zeilen): Gesamtscore, Dimensionen, Indikatoren in Modellreihenfolge.
+    """
+
+    def __init__(self, engine=SCORING_ENGINE, bins: int = BENCHMARK_BINS):
+        self.engine = engine
+        self.bins = bins
+        self.keys = [TOTAL_KEY] + list(engine.themes) + [f"{theme} / {indicator}" for theme, indicator in engine.indicators]
+        self.sketches = {}
+        self.record_count = 0
+        self.sequence = None
+        self.store_location = None
+
+    # ------------------------------------------------------------------ update
+
+    def _empty(self) -> np.ndarray:
+        return np.zeros((len(self.keys), self.bins), dtype=np.int64)
+
+    def _score_vectors(self, totals, dimensions, indicators) -> np.ndarray:
+        """(N x Schlüssel) Werte 0-1, NaN = nicht bewertet."""
+        return np.column_stack([np.asarray(totals, dtype=float), dimensions, indicators])
+
+    def _add_rows(self, sectors, values):
+        bins = np.clip(np.floor(np.nan_to_num(values, nan=0.0) * self.bins), 0, self.bins - 1).astype(np.intp)
+        valid = ~np.isnan(values)
+        for sector in set(sectors):
+            rows = np.asarray([s == sector for s in sectors])
+            sketch = self.sketches.setdefault(sector, self._empty())
+            key_idx = np.broadcast_to(np.arange(len(self.keys)), bins.shape)
+            mask = valid & rows[:, None]
+            np.add.at(sketch, (key_idx[mask], bins[mask]), 1)
+        self.record_count += len(sectors)
+
+    def add_records(self, records, fallback_weights=None):
+        """Nimmt gespeicherte Assessments auf (Scores werden gemeinsam berechnet)."""
+        records = list(records)
+        if not records:
+            return
+        weights = [
+            r.get("weights") if isinstance(r.get("weights"), dict) else (fallback_weights or DEFAULT_WEIGHTS)
+            for r in records
+        ]
+        result = self.engine.score(
+            self.engine.answers_to_matrix(record_answers(r) for r in records),
+            self.engine.weights_to_matrix(weights),
+        )
+        # Dimensionen ohne Bewertung zählen wie in score_answers als 0
+        dimensions = np.nan_to_num(result["dimension"], nan=0.0)
+        self._add_rows([sector_of(r) for r in records], self._score_vectors(result["total"], dimensions, result["indicator"]))
+
+    def add_result(self, sector: str, result: dict):
+        """Nimmt ein Ergebnis von core.score_answers auf ({"indicator", "dimension", "total"})."""
+        values = self._score_vectors(
+            [result["total"]],
+            self.engine.dimension_vector(result["dimension"])[None, :],
+            self.engine.indicator_vector(result["indicator"])[None, :],
+        )
+        self._add_rows([sector or UNKNOWN_SECTOR], values)
+
+    def merge(self, other: "BenchmarkIndex"):
+        """Addiert die Sketches eines anderen Index (gleiche Schlüssel und Bins)."""
+        if other.keys != self.keys or other.bins != self.bins:
+            raise ValueError("Benchmark-Indizes mit unterschiedlichen Schlüsseln oder Bins")
+        for sector, sketch in other.sketches.items():
+            self.sketches[sector] = self.sketches.get(sector, self._empty()) + sketch
+        self.record_count += other.record_count
+
+    # ------------------------------------------------------------------ query
+
+    def sectors(self) -> list:
+        return sorted(self.sketches)
+
+    def sketch(self, sector=None) -> np.ndarray:
+        """Histogramme eines Sektors; None = alle Sektoren zusammengeführt."""
+        if sector is None:
+            return sum(self.sketches.values(), self._empty())
+        return self.sketches.get(sector, self._empty())
+
+    def sample_sizes(self, sector=None) -> np.ndarray:
+        return self.sketch(sector).sum(axis=1)
+
+    def percentile_ranks(self, values, sector=None) -> np.ndarray:
+        """
+        Perzentilränge (0-100) je Schlüssel
+
+        Anteil der Vergleichswerte unterhalb des Werts, Werte im selben Bin
+        zählen zur Hälfte. NaN, wenn Wert oder Vergleichsdaten fehlen.
+        """
+        sketch = self.sketch(sector)
+        counts = sketch.sum(axis=1)
+        values = np.asarray(values, dtype=float)
+        bins = np.clip(np.floor(np.nan_to_num(values, nan=0.0) * self.bins), 0, self.bins - 1).astype(np.intp)
+        below = np.cumsum(sketch, axis=1) - sketch
+        rows = np.arange(len(self.keys))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            ranks = (below[rows, bins] + 0.5 * sketch[rows, bins]) / counts * 100
+        return np.where(np.isnan(values) | (counts == 0), np.nan, ranks)
+
+    def compare(self, result: dict, sector=None) -> dict:
+        """
+        Perzentilränge eines Ergebnisses von core.score_answers
+
+        Returns:
+            dict: {"total": p, "dimension": {Thema: p}, "indicator": {(Thema, Indikator): p},
+                   "n": Anzahl Vergleichs-Assessments} (p = None ohne Vergleichsdaten)
+        """
+        values = self._score_vectors(
+            [result["total"]],
+            self.engine.dimension_vector(result["dimension"])[None, :],
+            self.engine.indicator_vector(result["indicator"])[None, :],
+        )[0]
+        ranks = [None if np.isnan(p) else float(p) for p in self.percentile_ranks(values, sector)]
+        n_themes = len(self.engine.themes)
+        return {
+            "total": ranks[0],
+            "dimension": dict(zip(self.engine.themes, ranks[1:1 + n_themes])),
+            "indicator": dict(zip(self.engine.indicators, ranks[1 + n_themes:])),
+            "n": int(self.sample_sizes(sector)[0]),
+        }
+
+    # ------------------------------------------------------------------ persistence
+
+    def save(self, path=None):
+        path = path or BENCHMARK_PATH
+        sectors = self.sectors()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp.npz")
+            np.savez(
+                tmp_path,
+                sectors=np.asarray(sectors, dtype=str),
+                sketches=np.stack([self.sketches[s] for s in sectors]) if sectors else np.zeros((0, len(self.keys), self.bins)),
+                keys=np.asarray(self.keys, dtype=str),
+                meta=np.asarray(
+                    [MODEL_VERSION, str(self.record_count), self.store_location or "", str(self.sequence)], dtype=str
+                ),
+            )
+            os.replace(tmp_path, path)
+        except OSError:
+            # Ohne beschreibbares Cache-Verzeichnis wird beim nächsten Start neu aufgebaut
+            pass
+
+    @classmethod
+    def load(cls, path=None):
+        """Gespeicherter Index oder None (fehlend, unlesbar oder andere Modellversion)."""
+        index = cls()
+        try:
+            with np.load(path or BENCHMARK_PATH, allow_pickle=False) as data:
+                model_version, record_count, store_location, sequence = data["meta"].tolist()
+                if model_version != MODEL_VERSION or data["keys"].tolist() != index.keys:
+                    return None
+                if data["sketches"].shape[1:] != (len(index.keys), index.bins):
+                    return None
+                index.sketches = {
+                    str(sector): sketch.astype(np.int64) for sector, sketch in zip(data["sectors"], data["sketches"])
+                }
+        except (OSError, KeyError, ValueError):
+            return None
+        index.record_count = int(record_count)
+        index.store_location = store_location or None
+        index.sequence = int(sequence) if sequence.isdigit() else None
+        return index
+
+
+_BENCHMARK = DerivedStore(BenchmarkIndex, BenchmarkIndex.load)
+
+
+def rebuild(store=None) -> BenchmarkIndex:
+    """Baut den Index aus der gesamten Historie neu auf (blockweise)."""
+    return _BENCHMARK.rebuild(store)
+
+
+def get_benchmark() -> BenchmarkIndex:
+    """Prozessweiter Benchmark-Index; bei jedem Aufruf mit der Ablage abgeglichen (nachladen oder neu aufbauen)."""
+    return _BENCHMARK.get()
+
+
+def record_saved(record: dict, result: dict, sequence: tuple):
+    """
+    Nach dem Speichern eines Assessments: Sketches fortschreiben und sichern
+
+    Args:
+        record (dict): gespeicherter Eintrag (für den Sektor)
+        result (dict): Ergebnis von core.score_answers für diesen Eintrag
+        sequence (tuple): Rückgabe von store.append() für diesen Eintrag
+    """
+    _BENCHMARK.record_saved(sequence, lambda index: index.add_result(sector_of(record), result))
@@ -0,0 +1,279 @@
+# ============================================================================
+# CIRCULARA - COMMAND LINE
+# ============================================================================
+# python -m circulara score in.jsonl -o out.jsonl
+# python -m circulara export-pdf -o reports.zip [--unternehmen ...] [--workers 4]
+#
+# export-pdf renders the reports in a process pool (report_batch); the app's
+# History page runs it as a subprocess as well.
+#
+# Input: one JSON object per line, either the answers themselves
+# ({Thema: {Indikator: {Code: Score}}}) or a record with an "answers" key
+# (optional "weights"; all other fields are passed through).
+# ============================================================================
+
+import argparse
+import contextlib
+import itertools
+import json
+import sys
+import time
+
+from config import DEFAULT_WEIGHTS, MODEL_VERSION
+from core import get_maturity_level
+
+DEFAULT_CHUNK_SIZE = 1024
+MAX_ERROR_MESSAGES = 100
+
+
+def _open_input(path):
+    if path == "-":
+        return contextlib.nullcontext(sys.stdin)
+    return open(path, "r", encoding="utf-8")
+
+
+def _open_output(path):
+    if path == "-":
+        return contextlib.nullcontext(sys.stdout)
+    return open(path, "w", encoding="utf-8")
+
+
+class ErrorLog:
+    """Fehlerzähler, der nur die ersten ``limit`` Meldungen aufbewahrt."""
+
+    def __init__(self, limit: int = MAX_ERROR_MESSAGES):
+        self.limit = limit
+        self.count = 0
+        self.messages = []
+
+    def append(self, message: str):
+        self.count += 1
+        if len(self.messages) < self.limit:
+            self.messages.append(message)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self):
+        return iter(self.messages)
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _shape_error(answers, weights):
+    """Fehlerbeschreibung, wenn Antworten/Gewichtung nicht die erwartete Struktur haben, sonst None."""
+    if not isinstance(answers, dict):
+        return "Antworten als Objekt erwartet"
+    for theme, indicators in answers.items():
+        if indicators is None:
+            continue
+        if not isinstance(indicators, dict):
+            return f"'{theme}': Objekt {{Indikator: {{Code: Score}}}} erwartet"
+        for indicator, questions in indicators.items():
+            if questions is None:
+                continue
+            if not isinstance(questions, dict):
+                return f"'{theme}' / '{indicator}': Objekt {{Code: Score}} erwartet"
+            for code, score in questions.items():
+                if score is not None and not _is_number(score):
+                    return f"'{theme}' / '{indicator}' / '{code}': Score muss eine Zahl oder null sein"
+    if weights is not None:
+        if not isinstance(weights, dict):
+            return "weights als Objekt {Thema: Gewicht} erwartet"
+        for theme, weight in weights.items():
+            if not _is_number(weight):
+                return f"weights '{theme}': Zahl erwartet"
+    return None
+
+
+def _iter_records(lines, errors):
+    """(Antworten, Gewichtung, übrige Felder) je gültiger Eingabezeile; ungültige werden in errors vermerkt."""
+    for line_no, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as exc:
+            errors.append(f"Zeile {line_no}: ungültiges JSON ({exc.msg})")
+            continue
+        if not isinstance(record, dict):
+            errors.append(f"Zeile {line_no}: Objekt erwartet")
+            continue
+        if "answers" in record:
+            answers, weights = record["answers"], record.get("weights")
+            meta = {k: v for k, v in record.items() if k not in ("answers", "weights")}
+        else:
+            answers, weights, meta = record, None, {}
+        problem = _shape_error(answers, weights)
+        if problem is not None:
+            errors.append(f"Zeile {line_no}: {problem}")
+            continue
+        yield answers, weights, meta
+
+
+def score_stream(lines, out, weights=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Bewertet Antwortsätze blockweise und schreibt die Ergebnisse sofort als JSON Lines
+
+    Der Speicherbedarf hängt nur von ``chunk_size`` ab, nicht von der Eingabegröße.
+
+    Returns:
+        tuple: (Anzahl bewerteter Datensätze, ErrorLog der übersprungenen Zeilen)
+    """
+    from scoring import SCORING_ENGINE
+
+    default_weights = weights or DEFAULT_WEIGHTS
+    errors = ErrorLog()
+    count = 0
+    records = _iter_records(lines, errors)
+
+    while True:
+        chunk = list(itertools.islice(records, chunk_size))
+        if not chunk:
+            break
+        result = SCORING_ENGINE.score(
+            SCORING_ENGINE.answers_to_matrix(answers for answers, _, _ in chunk),
+            SCORING_ENGINE.weights_to_matrix(
+                [w if isinstance(w, dict) else default_weights for _, w, _ in chunk]
+            ),
+        )
+        for row, (_, _, meta) in enumerate(chunk):
+            total = float(result["total"][row])
+            level = get_maturity_level(total)
+            output = dict(meta)
+            output.update(
+                {
+                    "scores": SCORING_ENGINE.indicator_dict(result["indicator"][row]),
+                    "dimension_scores": SCORING_ENGINE.dimension_dict(result["dimension"][row]),
+                    "total_score": total,
+                    "maturity_level": level["name"],
+                    "maturity_label": level.get("label", ""),
+                    "model_version": MODEL_VERSION,
+                }
+            )
+            out.write(json.dumps(output, ensure_ascii=False) + "\n")
+        out.flush()
+        count += len(chunk)
+    return count, errors
+
+
+def _parse_weights(text):
+    """(Gewichtung oder None, Fehlerbeschreibung oder None) für die Option --weights."""
+    if not text:
+        return None, None
+    try:
+        weights = json.loads(text)
+    except ValueError as exc:
+        return None, f"--weights: kein gültiges JSON ({exc})"
+    problem = _shape_error({}, weights)
+    return (None, f"--weights: {problem}") if problem else (weights, None)
+
+
+def _cmd_score(args) -> int:
+    if args.chunk_size < 1:
+        print("--chunk-size muss mindestens 1 sein", file=sys.stderr)
+        return 2
+    weights, problem = _parse_weights(args.weights)
+    if problem:
+        print(problem, file=sys.stderr)
+        return 2
+    started = time.perf_counter()
+    with _open_input(args.input) as src, _open_output(args.output) as out:
+        count, errors = score_stream(src, out, weights=weights, chunk_size=args.chunk_size)
+    elapsed = time.perf_counter() - started
+
+    for message in errors:
+        print(message, file=sys.stderr)
+    if len(errors) > len(errors.messages):
+        print(f"... {len(errors) - len(errors.messages)} weitere Fehler", file=sys.stderr)
+    rate = count / elapsed if elapsed > 0 else 0.0
+    print(
+        f"{count} Assessments bewertet in {elapsed:.2f}s ({rate:,.0f} records/s)"
+        + (f", {len(errors)} Zeilen übersprungen" if errors else ""),
+        file=sys.stderr,
+    )
+    return 1 if errors and count == 0 else 0
+
+
+def _cmd_export_pdf(args) -> int:
+    from report_batch import DEFAULT_BATCH_WORKERS, export_zip
+    from styles import THEME_UI
+
+    fallback_weights, problem = _parse_weights(args.weights)
+    if problem:
+        print(problem, file=sys.stderr)
+        return 2
+    if args.records:
+        with _open_input(args.records) as src:
+            records = [json.loads(line) for line in src if line.strip()]
+    else:
+        from storage import get_store
+
+        filters = {"Unternehmen": args.unternehmen, "Produkt": args.produkt, "Sektor": args.sektor}
+        records = get_store().query(limit=args.limit, **{k: v for k, v in filters.items() if v})
+    if not records:
+        print("Keine gespeicherten Assessments für die gewählten Filter", file=sys.stderr)
+        return 1
+
+    def report_progress(done, total):
+        print(json.dumps({"done": done, "total": total}), flush=True)
+
+    summary = export_zip(
+        records,
+        args.output,
+        workers=args.workers or DEFAULT_BATCH_WORKERS,
+        fallback_weights=fallback_weights,
+        theme_colors={theme: ui["accent"] for theme, ui in THEME_UI.items()},
+        progress=report_progress if args.json else None,
+    )
+    if args.json:
+        print(json.dumps({"summary": summary}, ensure_ascii=False), flush=True)
+    for entry in summary["reports"]:
+        source = "Cache" if entry["cached"] else f"{entry['seconds'] * 1000:.0f} ms"
+        print(f"{entry['name']}  {entry['bytes'] / 1024:.0f} KB  {source}", file=sys.stderr)
+    for message in summary["errors"]:
+        print(message, file=sys.stderr)
+    print(
+        f"{len(summary['reports'])} Reports in {summary['total_s']:.2f}s nach {summary['path']}"
+        + (f", {len(summary['errors'])} fehlgeschlagen" if summary["errors"] else ""),
+        file=sys.stderr,
+    )
+    return 1 if summary["errors"] and not summary["reports"] else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="circulara", description="Circularity Fit Check - Kommandozeile")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    score = commands.add_parser("score", help="Antwortsätze (JSON Lines) bewerten")
+    score.add_argument("input", help="Eingabedatei (JSON Lines) oder - für stdin")
+    score.add_argument("-o", "--output", default="-", help="Ausgabedatei (JSON Lines), Standard: stdout")
+    score.add_argument("--weights", help='Gewichtung als JSON, z. B. \'{"Design": 0.35, ...}\'')
+    score.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Datensätze pro Block")
+    score.set_defaults(func=_cmd_score)
+
+    export_pdf = commands.add_parser("export-pdf", help="PDF-Reports gespeicherter Assessments als ZIP")
+    export_pdf.add_argument("-o", "--output", required=True, help="Ziel der ZIP-Datei")
+    export_pdf.add_argument("--unternehmen", help="nur dieses Unternehmen")
+    export_pdf.add_argument("--produkt", help="nur dieses Produkt")
+    export_pdf.add_argument("--sektor", help="nur dieser Sektor")
+    export_pdf.add_argument("--limit", type=int, help="höchstens so viele Assessments")
+    export_pdf.add_argument("--records", help="Assessments als JSON Lines statt aus der Ablage (- für stdin)")
+    export_pdf.add_argument("--weights", help="Gewichtung als JSON für Einträge ohne gespeicherte Gewichtung")
+    export_pdf.add_argument("--workers", type=int, help="Anzahl Worker-Prozesse (Standard: CPU-Kerne, max. 4)")
+    export_pdf.add_argument("--json", action="store_true", help="Fortschritt und Zusammenfassung als JSON Lines auf stdout")
+    export_pdf.set_defaults(func=_cmd_export_pdf)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
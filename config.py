@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import pickle
 from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 
 DEFAULT_WEIGHTS = {
@@ -23,6 +27,27 @@ MODEL_PATH = DATA_DIR / "circular_model.json"
 MATURITY_PATH = DATA_DIR / "maturity_levels.json"
 RECOMMENDATIONS_PATH = DATA_DIR / "indicator_recommendations.json"
 
+# Assessment-Ablage (relativ zum Arbeitsverzeichnis der App)
+STORAGE_BACKEND = os.environ.get("CIRCULARA_STORAGE", "sqlite")
+ASSESSMENTS_PATH = Path("assessments.json")
+ASSESSMENT_LOG_DIR = Path("assessments")
+ASSESSMENT_DB_PATH = Path("assessments.db")
+SEGMENT_MAX_BYTES = 4 * 1024 * 1024
+
+# Kompiliertes Modell (siehe _load_compiled)
+CACHE_DIR = Path(os.environ.get("CIRCULARA_CACHE_DIR", BASE_DIR / ".cache"))
+COMPILED_MODEL_CACHE = CACHE_DIR / "compiled_model.pickle"
+COMPILED_MODEL_FORMAT = 3
+TEXT_PAGE_CACHE_SIZE = 16
+
+# PDF-Reports (siehe report_cache.py)
+REPORT_CACHE_DIR = CACHE_DIR / "reports"
+REPORT_CACHE_MAX_BYTES = int(os.environ.get("CIRCULARA_REPORT_CACHE_MB", "64")) * 1024 * 1024
+BATCH_EXPORT_DIR = CACHE_DIR / "exports"
+BENCHMARK_PATH = CACHE_DIR / "benchmark.npz"
+AGGREGATES_PATH = CACHE_DIR / "aggregates.json"
+SCORE_MATRIX_DIR = CACHE_DIR / "score_matrix"
+
 DEFAULT_MATURITY_LEVELS = [
     {
         "min_score": 0.0,
@@ -74,14 +99,280 @@ def _load_json(path: Path):
         return json.load(file)
 
 
-def _load_model() -> OrderedDict[str, dict]:
+def _split_model(data) -> tuple[OrderedDict[str, dict], list[dict]]:
+    """
+    Trennt das Modell in Struktur und Textseiten
+
+    Die Struktur enthält je Frage nur Code, Typ und Options-Scores; Beschreibungen,
+    Fragetexte, Erläuterungen und Options-Labels bleiben in den Textseiten
+    (eine Seite = vollständige Indikator-Daten, in Modellreihenfolge).
+    """
+    skeleton = OrderedDict()
+    pages = []
+    for theme, indicators in data.items():
+        skeleton[theme] = OrderedDict()
+        for indicator, indicator_data in indicators.items():
+            skeleton[theme][indicator] = {
+                "questions": [
+                    {
+                        "code": question["code"],
+                        "type": question.get("type", "mc"),
+                        "options": [{"score": option.get("score", 0.0)} for option in question.get("options", [])],
+                    }
+                    for question in indicator_data.get("questions", [])
+                ]
+            }
+            pages.append(indicator_data)
+    return skeleton, pages
+
+
+def _model_version(model) -> str:
+    """Hash über die scoring-relevante Struktur (Themen, Indikatoren, Codes, Options-Scores)."""
+    skeleton = [
+        [theme, indicator, [[q.get("code"), [o.get("score") for o in q.get("options", [])]]
+                            for q in indicator_data.get("questions", [])]]
+        for theme, indicators in model.items()
+        for indicator, indicator_data in indicators.items()
+    ]
+    payload = json.dumps(skeleton, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _compile_structure(model) -> dict:
+    """
+    Flache Modellstruktur für Scoring und UI
+
+    Fragen liegen in Modellreihenfolge; Spans sind halboffene (start, stop)-Bereiche:
+    indicator_spans in ``codes``, theme_spans in ``indicators``,
+    theme_question_spans in ``codes``. ``question_index`` bildet jeden Code auf
+    (Thema, Indikator, Position in ``codes``, Options-Scores) ab.
+
+    Raises:
+        ValueError: wenn ein Fragecode mehrfach vorkommt
+    """
+    themes = list(model.keys())
+    indicators = []
+    codes = []
+    option_scores = []
+    question_indicator = []
+    question_index = {}
+    indicator_theme = []
+    indicator_spans = []
+    theme_spans = []
+    theme_question_spans = []
+
+    for t_idx, (theme, theme_indicators) in enumerate(model.items()):
+        theme_start, theme_question_start = len(indicators), len(codes)
+        for indicator, indicator_data in theme_indicators.items():
+            i_idx = len(indicators)
+            indicators.append((theme, indicator))
+            indicator_theme.append(t_idx)
+            start = len(codes)
+            for question in indicator_data.get("questions", []):
+                code = question["code"]
+                if code in question_index:
+                    first_theme, first_indicator = question_index[code][:2]
+                    raise ValueError(
+                        f"Doppelter Fragecode {code!r} im Modell: {first_theme} / {first_indicator} "
+                        f"und {theme} / {indicator}"
+                    )
+                scores = tuple(option.get("score", 0.0) for option in question.get("options", []))
+                question_index[code] = (theme, indicator, len(codes), scores)
+                codes.append(code)
+                option_scores.append(list(scores))
+                question_indicator.append(i_idx)
+            indicator_spans.append((start, len(codes)))
+        theme_spans.append((theme_start, len(indicators)))
+        theme_question_spans.append((theme_question_start, len(codes)))
+
+    return {
+        "themes": themes,
+        "indicators": indicators,
+        "codes": codes,
+        "option_scores": option_scores,
+        "question_indicator": question_indicator,
+        "indicator_theme": indicator_theme,
+        "indicator_spans": indicator_spans,
+        "theme_spans": theme_spans,
+        "theme_question_spans": theme_question_spans,
+        "indicator_index": {key: idx for idx, key in enumerate(indicators)},
+        "question_index": question_index,
+        "indicator_code_spans": dict(zip(indicators, indicator_spans)),
+        "theme_code_spans": dict(zip(themes, theme_question_spans)),
+        "theme_question_counts": {
+            theme: stop - start for theme, (start, stop) in zip(themes, theme_question_spans)
+        },
+        "total_questions": len(codes),
+    }
+
+
+def _source_stamps(paths) -> dict | None:
+    try:
+        return {str(path): (path.stat().st_mtime_ns, path.stat().st_size) for path in paths}
+    except OSError:
+        return None
+
+
+def _source_hashes(paths) -> dict:
+    return {str(path): hashlib.sha256(path.read_bytes()).hexdigest() for path in paths}
+
+
+def _write_compiled(payload: dict):
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = COMPILED_MODEL_CACHE.with_suffix(f".{os.getpid()}.tmp")
+        with tmp_path.open("wb") as file:
+            pickle.dump(payload, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, COMPILED_MODEL_CACHE)
+    except OSError:
+        # Ohne beschreibbares Cache-Verzeichnis wird bei jedem Start neu kompiliert
+        pass
+
+
+def _write_text_store(pages):
+    """
+    Schreibt die Textseiten als JSON Lines (eine Zeile je Indikator)
+
+    Der Dateiname ist der Hash des Inhalts: geänderte Texte (bei gleicher
+    Struktur und damit gleicher MODEL_VERSION) landen in einer neuen Datei,
+    laufende Prozesse lesen mit ihren Offsets nie in eine fremde Fassung.
+
+    Returns:
+        tuple: (Pfad, Byte-Offsets je Seite) oder (None, None), wenn nicht schreibbar
+    """
+    offsets = []
+    digest = hashlib.sha256()
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = CACHE_DIR / f"model_text.{os.getpid()}.tmp"
+        with tmp_path.open("wb") as file:
+            for page in pages:
+                offsets.append(file.tell())
+                line = json.dumps(page, ensure_ascii=False).encode("utf-8") + b"\n"
+                digest.update(line)
+                file.write(line)
+        path = CACHE_DIR / f"model_text.{digest.hexdigest()[:16]}.jsonl"
+        os.replace(tmp_path, path)
+        for stale in CACHE_DIR.glob("model_text.*.jsonl"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        return None, None
+    return str(path), offsets
+
+
+def _load_compiled() -> dict:
+    """
+    Lädt Modell, Reifegrade, Empfehlungen und die kompilierte Struktur
+
+    Der Cache gilt, solange mtime und Größe der Quelldateien unverändert sind;
+    andernfalls entscheidet der Inhalts-Hash, ob neu kompiliert werden muss.
+    """
+    sources = (MODEL_PATH, MATURITY_PATH, RECOMMENDATIONS_PATH)
+    stamps = _source_stamps(sources)
+
+    cached = None
+    try:
+        with COMPILED_MODEL_CACHE.open("rb") as file:
+            cached = pickle.load(file)
+        if cached.get("format") != COMPILED_MODEL_FORMAT:
+            cached = None
+    except Exception:
+        cached = None
+
+    if cached is not None and stamps is not None and cached.get("stamps") == stamps:
+        return cached
+
+    hashes = _source_hashes(sources) if stamps is not None else None
+    if cached is not None and hashes is not None and cached.get("hashes") == hashes:
+        cached["stamps"] = stamps
+        _write_compiled(cached)
+        return cached
+
     data = _load_json(MODEL_PATH)
-    return OrderedDict(
-        (theme, OrderedDict((indicator, indicator_data) for indicator, indicator_data in indicators.items()))
-        for theme, indicators in data.items()
-    )
+    model, pages = _split_model(data)
+    text_store, text_offsets = _write_text_store(pages)
+    payload = {
+        "format": COMPILED_MODEL_FORMAT,
+        "stamps": stamps,
+        "hashes": hashes,
+        "model": model,
+        "model_version": _model_version(data),
+        "text_store": text_store,
+        "text_offsets": text_offsets,
+        "maturity_levels": _load_json(MATURITY_PATH) or DEFAULT_MATURITY_LEVELS,
+        "recommendations": _load_json(RECOMMENDATIONS_PATH),
+        "compiled": _compile_structure(model),
+    }
+    _write_compiled(payload)
+    if text_store is None:
+        # Ohne Text-Cache bleiben die Seiten im Speicher (wird nicht mitgepickelt)
+        payload["text_pages"] = pages
+    return payload
+
+
+_COMPILED = _load_compiled()
+
+CIRCULAR_MODEL = _COMPILED["model"]
+COMPILED_MODEL = _COMPILED["compiled"]
+QUESTION_INDEX = COMPILED_MODEL["question_index"]
+MODEL_VERSION = _COMPILED["model_version"]
+# Inhalt von Modell, Reifegraden und Empfehlungen: ändert sich auch bei reinen Textänderungen
+MODEL_TEXT_VERSION = hashlib.sha256(
+    json.dumps(_COMPILED.get("hashes"), sort_keys=True).encode("utf-8")
+).hexdigest()[:16]
+MATURITY_LEVELS = _COMPILED["maturity_levels"]
+INDICATOR_RECOMMENDATIONS = _COMPILED["recommendations"]
+
+
+# ============================================================================
+# MODELLTEXTE (LAZY)
+# ============================================================================
+# CIRCULAR_MODEL enthält nur die Struktur (Codes, Typen, Options-Scores).
+# Beschreibungen, Fragetexte, Erläuterungen und Options-Labels werden je
+# Indikator bei Bedarf aus dem Text-Cache gelesen.
+
+
+def _read_text_pages() -> list[dict]:
+    return _split_model(_load_json(MODEL_PATH))[1]
+
+
+@lru_cache(maxsize=TEXT_PAGE_CACHE_SIZE)
+def _text_page(index: int) -> dict:
+    pages = _COMPILED.get("text_pages")
+    if pages is None:
+        try:
+            with open(_COMPILED["text_store"], "rb") as file:
+                file.seek(_COMPILED["text_offsets"][index])
+                return json.loads(file.readline())
+        except (OSError, TypeError, ValueError):
+            pages = _COMPILED["text_pages"] = _read_text_pages()
+    return pages[index]
+
+
+def load_indicator(theme: str, indicator: str) -> dict:
+    """
+    Vollständige Indikator-Daten inkl. Texten
+
+    Args:
+        theme (str): Thema
+        indicator (str): Indikator
+
+    Returns:
+        dict: {"description", "questions": [{code, text, type, explanation, options: [{label, score}]}]};
+            das Ergebnis wird zwischengespeichert und darf nicht verändert werden
+    """
+    return _text_page(COMPILED_MODEL["indicator_index"][(theme, indicator)])
+
+
+def indicator_codes(theme: str, indicator: str) -> list[str]:
+    """Fragecodes eines Indikators in Modellreihenfolge (ohne Modell-Durchlauf)."""
+    start, stop = COMPILED_MODEL["indicator_code_spans"][(theme, indicator)]
+    return COMPILED_MODEL["codes"][start:stop]
 
 
-CIRCULAR_MODEL = _load_model()
-MATURITY_LEVELS = _load_json(MATURITY_PATH) or DEFAULT_MATURITY_LEVELS
-INDICATOR_RECOMMENDATIONS = _load_json(RECOMMENDATIONS_PATH)
+def question_text(code: str) -> dict:
+    """Vollständige Frage (Text, Erläuterung, Optionen) zu einem Fragecode."""
+    theme, indicator, position, _ = QUESTION_INDEX[code]
+    start, _ = COMPILED_MODEL["indicator_code_spans"][(theme, indicator)]
+    return load_indicator(theme, indicator)["questions"][position - start]
@@ -0,0 +1,243 @@
+# ============================================================================
+# CORE - MODEL, SCORING, MATURITY, RECOMMENDATIONS (PURE PYTHON)
+# ============================================================================
+# No Streamlit, plotly, reportlab or numpy imports: usable from batch jobs
+# and workers. Charts live in utils.py, the PDF report in report.py and the
+# vectorized batch scoring in scoring.py.
+# ============================================================================
+
+from config import (
+    CIRCULAR_MODEL,
+    DEFAULT_WEIGHTS,
+    INDICATOR_RECOMMENDATIONS,
+    MATURITY_LEVELS,
+)
+
+
+# ============================================================================
+# SCORING
+# ============================================================================
+# Semantik: Leitfragen mit "Keine Auswahl" (None) werden nicht bewertet.
+# Indikator = Durchschnitt der bewerteten Leitfragen, Dimension = Durchschnitt
+# der bewerteten Indikatoren, Gesamtscore = gewichteter Durchschnitt.
+
+
+def calculate_scores(answers):
+    """
+    Indikator-Scores eines Assessments
+
+    Args:
+        answers (dict): {Thema: {Indikator: {Code: Score oder None}}}
+
+    Returns:
+        dict: {Thema: {Indikator: Score (0-1) oder None}}
+    """
+    scores = {}
+    for theme, theme_data in CIRCULAR_MODEL.items():
+        scores[theme] = {}
+        for indicator_name, indicator_data in theme_data.items():
+            indicator_scores = []
+            for question in indicator_data.get("questions", []):
+                q_code = question["code"]
+                score = answers.get(theme, {}).get(indicator_name, {}).get(q_code)
+                if score is not None:
+                    indicator_scores.append(score)
+
+            scores[theme][indicator_name] = (
+                sum(indicator_scores) / len(indicator_scores) if indicator_scores else None
+            )
+    return scores
+
+
+def calculate_dimension_scores(scores):
+    """
+    Dimensionen-Scores aus Indikator-Scores
+
+    Returns:
+        dict: {Thema: Score (0-1)}, Dimensionen ohne Bewertung erhalten 0.0
+    """
+    dimension_scores = {}
+    for theme in CIRCULAR_MODEL.keys():
+        vals = [v for v in scores.get(theme, {}).values() if v is not None]
+        dimension_scores[theme] = (sum(vals) / len(vals)) if vals else 0.0
+    return dimension_scores
+
+
+def calculate_weighted_total(dimension_scores, weights, skip_missing=False):
+    """
+    Gewichteter Gesamtscore (0-1)
+
+    Args:
+        dimension_scores (dict): {Thema: Score oder None}
+        weights (dict): {Thema: Gewichtung}
+        skip_missing (bool): Dimensionen ohne Score samt Gewicht auslassen,
+            statt sie mit 0 in den Durchschnitt aufzunehmen
+
+    Returns:
+        float: Gesamtscore (0-1)
+    """
+    weighted_sum = 0.0
+    weights_sum = 0.0
+    for theme in CIRCULAR_MODEL.keys():
+        score = dimension_scores.get(theme)
+        if score is None and skip_missing:
+            continue
+        weight = weights.get(theme, 0.0)
+        weighted_sum += (score or 0.0) * weight
+        weights_sum += weight
+    return weighted_sum / weights_sum if weights_sum > 0 else 0.0
+
+
+def score_answers(answers, weights):
+    """
+    Indikator-, Dimensionen- und gewichteter Gesamtscore eines Assessments
+
+    Returns:
+        dict: {"indicator": {...}, "dimension": {...}, "total": float (0-1)}
+    """
+    indicator = calculate_scores(answers)
+    dimension = calculate_dimension_scores(indicator)
+    return {
+        "indicator": indicator,
+        "dimension": dimension,
+        "total": calculate_weighted_total(dimension, weights),
+    }
+
+
+def get_overall_score(scores):
+    """Gesamtscore (0-5) mit Standardgewichtung; Dimensionen ohne Bewertung zählen nicht."""
+    total_score = 0.0
+    used_weights = 0.0
+    for theme, theme_score in scores.items():
+        if theme_score:
+            valid_scores = [v for v in theme_score.values() if v is not None]
+            theme_avg = (sum(valid_scores) / len(valid_scores)) if valid_scores else None
+            weight = DEFAULT_WEIGHTS.get(theme, 0.2)
+            if theme_avg is not None:
+                total_score += theme_avg * weight
+                used_weights += weight
+    if used_weights == 0:
+        return 0.0
+    return (total_score / used_weights) * 5.0
+
+
+def calculate_theme_score(theme_answers):
+    """
+    Berechne Score für ein Thema (Durchschnitt der Indikatoren)
+
+    Args:
+        theme_answers (dict): {Indikator: {Frage1: score, Frage2: score, ...}}
+
+    Returns:
+        float: Theme Score (0-1)
+    """
+    all_scores = []
+    for indicator, questions in theme_answers.items():
+        for question, score in questions.items():
+            all_scores.append(score)
+
+    return sum(all_scores) / len(all_scores) if all_scores else 0
+
+
+def calculate_total_score(theme_scores, weights):
+    """
+    Berechne Gesamt-Zirkularitätsscore (gewichtet)
+
+    Args:
+        theme_scores (dict): {Thema: Score}
+        weights (dict): {Thema: Gewichtung}
+
+    Returns:
+        float: Gewichteter Gesamtscore (0-1)
+    """
+    weighted_sum = sum(theme_scores[theme] * weights[theme]
+                       for theme in theme_scores.keys())
+    total_weight = sum(weights.values())
+
+    return weighted_sum / total_weight if total_weight > 0 else 0
+
+
+# ============================================================================
+# MATURITY & RECOMMENDATIONS
+# ============================================================================
+
+
+def get_maturity_level(score):
+    """
+    Mapping Score → Reifegradlevel
+
+    Args:
+        score (float): Score 0-1
+
+    Returns:
+        dict: {name, emoji, description}
+    """
+    for level in MATURITY_LEVELS:
+        if level["min_score"] <= score < level["max_score"]:
+            return level
+    return MATURITY_LEVELS[-1]
+
+
+def maturity_transitions(timestamps, scores):
+    """
+    Wechsel des Reifegrads in einer zeitlich sortierten Score-Reihe
+
+    Args:
+        timestamps (list): Zeitpunkte in chronologischer Reihenfolge
+        scores (list): Gesamtscores (0-1) zu den Zeitpunkten
+
+    Returns:
+        list: [{"index", "timestamp", "score", "from", "to"}] mit Level-Dicts;
+            der erste Eintrag hat "from" = None
+    """
+    transitions = []
+    previous = None
+    for index, (timestamp, score) in enumerate(zip(timestamps, scores)):
+        level = get_maturity_level(score)
+        if previous is None or level["name"] != previous["name"]:
+            transitions.append({"index": index, "timestamp": timestamp, "score": score, "from": previous, "to": level})
+        previous = level
+    return transitions
+
+
+def get_improvement_areas(theme_scores, threshold=0.5):
+    """
+    Identifiziere Verbesserungsfelder (Scores < Schwellenwert)
+
+    Args:
+        theme_scores (dict): {Thema: Score}
+        threshold (float): Schwellenwert (0-1)
+
+    Returns:
+        list: Themen mit niedrigen Scores
+    """
+    return [theme for theme, score in theme_scores.items() if score < threshold]
+
+
+def get_recommendations(scores, threshold=0.5):
+    """
+    Handlungsempfehlungen für bewertete Indikatoren unter dem Schwellenwert
+
+    Args:
+        scores (dict): {Thema: {Indikator: Score oder None}}
+        threshold (float): Schwellenwert (0-1)
+
+    Returns:
+        list: [{"Thema", "Indikator", "Score", "Empfehlung"}] in Modellreihenfolge;
+            "Empfehlung" ist None, wenn für den Indikator keine hinterlegt ist
+    """
+    recommendations = []
+    for theme, indicators in CIRCULAR_MODEL.items():
+        for indicator in indicators.keys():
+            score = scores.get(theme, {}).get(indicator)
+            if score is None or score >= threshold:
+                continue
+            recommendations.append(
+                {
+                    "Thema": theme,
+                    "Indikator": indicator,
+                    "Score": score,
+                    "Empfehlung": INDICATOR_RECOMMENDATIONS.get(indicator),
+                }
+            )
+    return recommendations
@@ -0,0 +1,115 @@
+# ============================================================================
+# DERIVED STORES - PERSISTED VIEWS OVER THE ASSESSMENT HISTORY
+# ============================================================================
+# Benchmark sketches, aggregates and the score matrix are all kept the same
+# way: one process-wide object, persisted under CACHE_DIR together with the
+# store location and the store sequence (storage: sequence()) it covers.
+# Every access compares that sequence with the store in O(1):
+#   - equal: the object in memory is current;
+#   - otherwise the persisted object is loaded (another process may have
+#     saved it), and if that does not match either, the object is rebuilt
+#     in one chunked pass over the history.
+# After a save, record_saved() gets the (before, after) sequence range from
+# store.append(): if the object covers exactly "before", only the new record
+# is added; anything else means the history changed elsewhere.
+# ============================================================================
+
+import os
+import threading
+
+from storage import get_store
+
+DEFAULT_CHUNK_SIZE = 1024
+
+
+def store_id(store) -> str:
+    """Absoluter Ort der Ablage (Teil des gespeicherten Stands)."""
+    return os.path.abspath(str(store.location))
+
+
+def _chunks(records, size: int):
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class DerivedStore:
+    """
+    Prozessweites, mit der Ablage abgeglichenes abgeleitetes Objekt
+
+    Args:
+        factory (callable): liefert ein leeres Objekt mit add_records(records),
+            save() und den Attributen sequence und store_location
+        load (callable): liefert das gespeicherte Objekt oder None
+        store (object): feste Ablage (Standard: storage.get_store())
+        chunk_size (int): Einträge je Block beim Neuaufbau
+    """
+
+    def __init__(self, factory, load, store=None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self._factory = factory
+        self._load = load
+        self._store = store
+        self.chunk_size = chunk_size
+        self._value = None
+        self._lock = threading.Lock()
+
+    def store(self):
+        return self._store if self._store is not None else get_store()
+
+    def rebuild(self, store=None):
+        """Baut das Objekt in einem Durchlauf über die Historie neu auf und sichert es."""
+        store = store or self.store()
+        # Stand vor dem Lesen: später angehängte Einträge lösen beim nächsten Zugriff einen Abgleich aus
+        sequence = store.sequence()
+        value = self._factory()
+        for chunk in _chunks(store.iter_records(), self.chunk_size):
+            value.add_records(chunk)
+        value.sequence = sequence
+        value.store_location = store_id(store)
+        value.save()
+        return value
+
+    def _covering(self, store, sequence):
+        """Objekt im Speicher oder gespeichertes Objekt für genau diesen Stand, sonst None."""
+        location = store_id(store)
+        for value in (self._value, None):
+            if value is None:
+                value = self._load()
+            if value is not None and value.sequence == sequence and value.store_location == location:
+                return value
+        return None
+
+    def get(self):
+        """Aktuelles Objekt (nachgeladen oder neu aufgebaut, falls die Ablage weiter ist)."""
+        with self._lock:
+            store = self.store()
+            sequence = store.sequence()
+            if self._value is None or self._value.sequence != sequence:
+                self._value = self._covering(store, sequence) or self.rebuild(store)
+            return self._value
+
+    def record_saved(self, sequence_range, update):
+        """
+        Nach store.append(): neuen Eintrag aufnehmen und sichern
+
+        Args:
+            sequence_range (tuple): Rückgabe von store.append() (Stand vorher, Stand nachher)
+            update (callable): nimmt den Eintrag in das übergebene Objekt auf
+        """
+        before, after = sequence_range
+        with self._lock:
+            store = self.store()
+            value = self._covering(store, before)
+            if value is None:
+                # Historie anderweitig geändert: der Neuaufbau enthält den Eintrag bereits
+                self._value = self.rebuild(store)
+                return
+            update(value)
+            value.sequence = after
+            value.save()
+            self._value = value
@@ -0,0 +1,168 @@
+# ============================================================================
+# PDF CHARTS - VECTOR DRAWINGS (REPORTLAB.GRAPHICS)
+# ============================================================================
+# Radar and bar chart drawn directly as PDF vector shapes. The look follows
+# utils.create_radar_chart (dark profile, theme-coloured markers, dashed outer
+# ring); no browser or image rasterisation is involved.
+# ============================================================================
+
+import math
+
+from reportlab.graphics.shapes import Circle, Drawing, Line, PolyLine, Polygon, Rect, String
+from reportlab.lib import colors
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+INK = colors.HexColor("#0F172A")
+GRID = colors.Color(15 / 255, 23 / 255, 42 / 255, alpha=0.10)
+AXIS = colors.Color(15 / 255, 23 / 255, 42 / 255, alpha=0.20)
+MUTED = colors.Color(15 / 255, 23 / 255, 42 / 255, alpha=0.70)
+PROFILE_FILL = colors.Color(15 / 255, 23 / 255, 42 / 255, alpha=0.08)
+DEFAULT_MARKER = "#0F766E"
+FONT = "Helvetica"
+
+
+def _color(value, fallback=DEFAULT_MARKER):
+    return colors.HexColor(value or fallback)
+
+
+def _scale_max(scores) -> float:
+    """Wie create_radar_chart: Skala 0-1, sonst 0-5."""
+    return 1.0 if scores and max(scores) <= 1.01 else 5.0
+
+
+def radar_drawing(theme_scores, theme_colors=None, width=500, height=300):
+    """
+    Radar-Diagramm als Vektorgrafik
+
+    Args:
+        theme_scores (dict): {Thema: Score}
+        theme_colors (dict): {Thema: Farbe} für die Punkte
+        width (float), height (float): Größe in Punkten
+
+    Returns:
+        reportlab.graphics.shapes.Drawing
+    """
+    theme_colors = theme_colors or {}
+    themes = list(theme_scores.keys())
+    scores = [theme_scores.get(t, 0) or 0 for t in themes]
+    drawing = Drawing(width, height)
+    if not themes:
+        return drawing
+
+    max_score = _scale_max(scores)
+    cx, cy = width / 2.0, height / 2.0
+    radius = min(width * 0.30, height / 2.0 - 24)
+
+    def point(idx, value):
+        # Plotly-Standard: erste Achse nach rechts, gegen den Uhrzeigersinn
+        angle = 2 * math.pi * idx / len(themes)
+        r = radius * min(max(value / max_score, 0.0), 1.0)
+        return cx + r * math.cos(angle), cy + r * math.sin(angle)
+
+    drawing.add(Circle(cx, cy, radius, fillColor=colors.white, strokeColor=None))
+
+    ticks = 5
+    tick_angle = math.pi / len(themes)  # Skalenbeschriftung zwischen den ersten beiden Achsen
+    for step in range(1, ticks + 1):
+        value = max_score * step / ticks
+        drawing.add(Circle(cx, cy, radius * step / ticks, fillColor=None, strokeColor=GRID, strokeWidth=0.8))
+        drawing.add(
+            String(
+                cx + radius * step / ticks * math.cos(tick_angle) + 2,
+                cy + radius * step / ticks * math.sin(tick_angle) + 2,
+                f"{value:.2f}" if max_score <= 1.01 else f"{value:.0f}",
+                fontName=FONT,
+                fontSize=7,
+                fillColor=MUTED,
+            )
+        )
+
+    for idx, theme in enumerate(themes):
+        x, y = point(idx, max_score)
+        drawing.add(Line(cx, cy, x, y, strokeColor=GRID, strokeWidth=0.8))
+        angle = 2 * math.pi * idx / len(themes)
+        lx, ly = cx + (radius + 10) * math.cos(angle), cy + (radius + 10) * math.sin(angle)
+        anchor = "middle" if abs(math.cos(angle)) < 0.2 else ("start" if math.cos(angle) > 0 else "end")
+        drawing.add(String(lx, ly - 3, theme, fontName=FONT, fontSize=9, fillColor=MUTED, textAnchor=anchor))
+
+    outer = [coord for idx in range(len(themes)) for coord in point(idx, max_score)]
+    drawing.add(
+        PolyLine(outer + outer[:2], strokeColor=AXIS, strokeWidth=0.8, strokeDashArray=[3, 3])
+    )
+
+    profile = [coord for idx, value in enumerate(scores) for coord in point(idx, value)]
+    drawing.add(Polygon(profile, fillColor=PROFILE_FILL, strokeColor=INK, strokeWidth=1.5))
+
+    for idx, (theme, value) in enumerate(zip(themes, scores)):
+        x, y = point(idx, value)
+        drawing.add(Circle(x, y, 4, fillColor=_color(theme_colors.get(theme)), strokeColor=INK, strokeWidth=0.4))
+        drawing.add(
+            String(x, y + 7, f"{value:.2f}", fontName=FONT, fontSize=8, fillColor=INK, textAnchor="middle")
+        )
+
+    return drawing
+
+
+def bar_drawing(theme_scores, theme_colors=None, width=500, height=None, bar_height=16):
+    """
+    Horizontales Balkendiagramm der Dimensionen (Score in %)
+
+    Args:
+        theme_scores (dict): {Thema: Score}, Reihenfolge von oben nach unten
+        theme_colors (dict): {Thema: Farbe} der Balken
+        width (float): Breite in Punkten
+        height (float): Höhe in Punkten (Standard: aus der Anzahl der Balken)
+        bar_height (float): Balkenhöhe in Punkten
+
+    Returns:
+        reportlab.graphics.shapes.Drawing
+    """
+    theme_colors = theme_colors or {}
+    themes = list(theme_scores.keys())
+    scores = [theme_scores.get(t, 0) or 0 for t in themes]
+    row_height = bar_height * 1.6
+    height = height or row_height * len(themes) + 24
+    drawing = Drawing(width, height)
+    if not themes:
+        return drawing
+
+    max_score = _scale_max(scores)
+    label_width = max(stringWidth(theme, FONT, 9) for theme in themes)
+    plot_left = label_width + 8
+    plot_width = width - plot_left - 40
+    top = height - 8
+
+    for step in range(0, 101, 20):
+        x = plot_left + plot_width * step / 100
+        drawing.add(Line(x, 16, x, top, strokeColor=GRID, strokeWidth=0.6))
+        drawing.add(String(x, 4, f"{step}%", fontName=FONT, fontSize=7, fillColor=MUTED, textAnchor="middle"))
+
+    for idx, (theme, value) in enumerate(zip(themes, scores)):
+        pct = min(max(value / max_score, 0.0), 1.0) * 100
+        y = top - (idx + 1) * row_height + (row_height - bar_height) / 2
+        drawing.add(
+            String(label_width, y + bar_height / 2 - 3, theme, fontName=FONT, fontSize=9, fillColor=INK, textAnchor="end")
+        )
+        color = _color(theme_colors.get(theme))
+        drawing.add(
+            Rect(
+                plot_left,
+                y,
+                plot_width * pct / 100,
+                bar_height,
+                fillColor=colors.Color(color.red, color.green, color.blue, alpha=0.72),
+                strokeColor=None,
+            )
+        )
+        drawing.add(
+            String(
+                plot_left + plot_width * pct / 100 + 4,
+                y + bar_height / 2 - 3,
+                f"{pct:.0f}%",
+                fontName=FONT,
+                fontSize=8,
+                fillColor=INK,
+            )
+        )
+
+    return drawing
@@ -0,0 +1,188 @@
+# ============================================================================
+# PDF JOBS - BACKGROUND REPORT GENERATION
+# ============================================================================
+# PDF reports are built in a small process-wide thread pool instead of the
+# Streamlit script thread. Each submission gets a job ID; the UI polls
+# job_status() for progress and fetches the bytes once the job is done.
+# At most PDF_WORKERS reports render at once and at most PDF_QUEUE_SIZE wait;
+# further submissions are rejected (JobQueueFull) instead of piling up.
+# Reports already in report_cache are returned as finished jobs right away.
+# warm_up() (called once at app start) starts the worker threads and renders
+# a throw-away report in each, so the first real export does not pay for the
+# reportlab imports, font metrics and chart setup (~0.2 s cold vs ~45 ms).
+# ============================================================================
+
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import report_cache
+
+PDF_WORKERS = 2
+PDF_QUEUE_SIZE = 4
+JOB_TTL_S = 15 * 60
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+_executor = ThreadPoolExecutor(max_workers=PDF_WORKERS, thread_name_prefix="circulara-pdf")
+_slots = threading.BoundedSemaphore(PDF_WORKERS + PDF_QUEUE_SIZE)
+_jobs = {}
+_lock = threading.Lock()
+_warmup = {"started": False, "seconds": None}
+
+
+class JobQueueFull(RuntimeError):
+    """Alle Worker belegt und Warteschlange voll."""
+
+
+def _update(job_id: str, **fields):
+    with _lock:
+        job = _jobs.get(job_id)
+        if job is not None:
+            job.update(fields)
+
+
+def _expire():
+    cutoff = time.time() - JOB_TTL_S
+    with _lock:
+        for job_id in [k for k, job in _jobs.items() if job["status"] in (DONE, FAILED) and job["finished"] < cutoff]:
+            del _jobs[job_id]
+
+
+def _run(job_id: str, cache_key: str, report_kwargs: dict):
+    try:
+        from report import generate_pdf_report
+
+        _update(job_id, status=RUNNING, started=time.time())
+        timings = {}
+        pdf_buffer = generate_pdf_report(
+            **report_kwargs,
+            timings=timings,
+            progress=lambda fraction: _update(job_id, progress=fraction),
+        )
+        pdf = pdf_buffer.getvalue()
+        report_cache.put(cache_key, pdf)
+    except Exception as exc:
+        _update(job_id, status=FAILED, error=str(exc) or exc.__class__.__name__, finished=time.time())
+    else:
+        _update(
+            job_id,
+            status=DONE,
+            progress=1.0,
+            pdf=pdf,
+            timings=timings,
+            finished=time.time(),
+        )
+    finally:
+        _slots.release()
+
+
+def _warm_up_worker(report_kwargs: dict):
+    started = time.perf_counter()
+    try:
+        from report import generate_pdf_report
+
+        generate_pdf_report(**report_kwargs)
+    except Exception:
+        # Vorwärmen ist optional; ein echter Export meldet den Fehler selbst
+        return
+    with _lock:
+        _warmup["seconds"] = max(_warmup["seconds"] or 0.0, time.perf_counter() - started)
+
+
+def warm_up(**report_kwargs):
+    """
+    Startet die Worker-Threads und rendert in jedem einmal einen Report vorab (einmal je Prozess)
+
+    Args:
+        **report_kwargs: Argumente für report.generate_pdf_report (Beispielreport)
+    """
+    with _lock:
+        if _warmup["started"]:
+            return
+        _warmup["started"] = True
+    for _ in range(PDF_WORKERS):
+        _executor.submit(_warm_up_worker, report_kwargs)
+
+
+def warmup_seconds():
+    """Dauer des Vorwärmens in s (langsamster Worker) oder None, solange es läuft."""
+    with _lock:
+        return _warmup["seconds"]
+
+
+def submit(**report_kwargs) -> str:
+    """
+    Stellt einen PDF-Report in die Warteschlange
+
+    Args:
+        **report_kwargs: Argumente für report.generate_pdf_report
+
+    Returns:
+        str: Job-ID
+
+    Raises:
+        JobQueueFull: zu viele laufende oder wartende Reports
+    """
+    _expire()
+    cache_key = report_cache.report_key(report_kwargs)
+    job = {
+        "status": QUEUED,
+        "progress": 0.0,
+        "submitted": time.time(),
+        "started": None,
+        "finished": None,
+        "error": None,
+        "pdf": None,
+        "timings": {},
+        "cached": False,
+    }
+    job_id = uuid.uuid4().hex
+
+    cached_pdf = report_cache.get(cache_key)
+    if cached_pdf is not None:
+        job.update(status=DONE, progress=1.0, pdf=cached_pdf, finished=time.time(), cached=True)
+        with _lock:
+            _jobs[job_id] = job
+        return job_id
+
+    if not _slots.acquire(blocking=False):
+        raise JobQueueFull("PDF-Export ausgelastet")
+    with _lock:
+        _jobs[job_id] = job
+    try:
+        _executor.submit(_run, job_id, cache_key, report_kwargs)
+    except Exception:
+        _slots.release()
+        with _lock:
+            _jobs.pop(job_id, None)
+        raise
+    return job_id
+
+
+def job_status(job_id: str):
+    """Kopie des Job-Zustands (ohne PDF-Bytes) oder None, wenn unbekannt/abgelaufen."""
+    with _lock:
+        job = _jobs.get(job_id)
+        if job is None:
+            return None
+        return {k: v for k, v in job.items() if k != "pdf"}
+
+
+def job_result(job_id: str):
+    """PDF-Bytes eines fertigen Jobs oder None."""
+    with _lock:
+        job = _jobs.get(job_id)
+        return job["pdf"] if job is not None and job["status"] == DONE else None
+
+
+def discard(job_id: str):
+    """Entfernt einen abgeschlossenen Job samt Ergebnis."""
+    with _lock:
+        job = _jobs.get(job_id)
+        if job is not None and job["status"] in (DONE, FAILED):
+            del _jobs[job_id]
@@ -0,0 +1,54 @@
+# ============================================================================
+# QUESTIONNAIRE - CLIENT-SIDE COMPONENT
+# ============================================================================
+# Renders all questions of one indicator in a single component iframe
+# (assets/components/questionnaire). Selections stay in the browser and are
+# sent back in debounced batches: {"batch": id, "changes": {Code: Score}},
+# Score None = "Keine Auswahl".
+# ============================================================================
+
+import streamlit.components.v1 as components
+
+from config import BASE_DIR
+
+COMPONENT_DIR = BASE_DIR / "assets" / "components" / "questionnaire"
+DEFAULT_DEBOUNCE_MS = 400
+
+_questionnaire = components.declare_component("questionnaire", path=str(COMPONENT_DIR))
+
+
+def questionnaire(questions, answers, key, accent, pill, on_change=None, debounce_ms=DEFAULT_DEBOUNCE_MS):
+    """
+    Fragebogen eines Indikators
+
+    Args:
+        questions (list): Fragen aus load_indicator() ({code, text, explanation, options})
+        answers (dict): {Code: Score oder None} aktueller Stand
+        key (str): Widget-Key; der letzte Batch liegt in st.session_state[key]
+        accent (str), pill (str): Theme-Farben
+        on_change (callable): Callback je empfangenem Batch
+        debounce_ms (int): Wartezeit nach der letzten Auswahl bis zum Senden
+
+    Returns:
+        dict: letzter Batch {"batch", "changes"} oder None
+    """
+    return _questionnaire(
+        questions=[
+            {
+                "code": q.get("code", ""),
+                "text": q.get("text", ""),
+                "explanation": q.get("explanation", ""),
+                "options": [
+                    {"label": o.get("label", ""), "score": o.get("score", 0.0)} for o in q.get("options", [])
+                ],
+            }
+            for q in questions
+        ],
+        answers={code: score for code, score in answers.items() if score is not None},
+        accent=accent,
+        pill=pill,
+        debounce_ms=debounce_ms,
+        key=key,
+        default=None,
+        on_change=on_change,
+    )
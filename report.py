@@ -0,0 +1,231 @@
+# ============================================================================
+# PDF-EXPORT (REPORTLAB)
+# ============================================================================
+# Optional layer: only imported when a report is generated.
+# ============================================================================
+
+import time
+from datetime import datetime
+from io import BytesIO
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import inch
+from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+from config import CIRCULAR_MODEL, indicator_codes, question_text
+from core import calculate_weighted_total, get_maturity_level
+from pdf_charts import bar_drawing, radar_drawing
+
+# Bei jeder Änderung an Layout oder Inhalt erhöhen (Teil des Report-Cache-Schlüssels)
+REPORT_TEMPLATE_VERSION = 2
+
+
+def _format_date(value) -> str:
+    """ISO-Zeitstempel als TT.MM.JJJJ (mit Uhrzeit, falls enthalten), sonst unverändert."""
+    text = str(value)
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        return text
+    return parsed.strftime("%d.%m.%Y %H:%M" if len(text) > 10 else "%d.%m.%Y")
+
+
+def generate_pdf_report(
+    product_name,
+    company,
+    theme_scores,
+    weights,
+    detailed_answers,
+    improvement_areas,
+    theme_colors=None,
+    assessment_date=None,
+    timings=None,
+    progress=None,
+):
+    """
+    Generiere detaillierten PDF-Report
+    
+    Args:
+        product_name (str)
+        company (str)
+        theme_scores (dict): {Thema: Score}
+        weights (dict): {Thema: Gewichtung}
+        detailed_answers (dict): Alle Fragen+Answers
+        improvement_areas (list): Schwache Bereiche
+        assessment_date (str): Zeitpunkt des Assessments (ISO); ohne Angabe entfällt das Datum.
+            Teil des Cache-Schlüssels, daher nie das Erstellungsdatum des PDFs
+        timings (dict): optional, erhält {"charts": Zeichenzeit der Diagramme in s}
+        progress (callable): optional, erhält den Fortschritt (0-1) während des Seitenaufbaus
+    
+    Returns:
+        BytesIO: PDF als Bytes
+    """
+    
+    # Erstelle PDF-Datei im Memory
+    pdf_buffer = BytesIO()
+    doc = SimpleDocTemplate(pdf_buffer, pagesize=A4,
+                           rightMargin=0.5*inch, leftMargin=0.5*inch,
+                           topMargin=0.6*inch, bottomMargin=0.6*inch)
+    
+    # Sammle Elemente
+    elements = []
+    styles = getSampleStyleSheet()
+    
+    # Custom Styles
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        textColor='#1F7E8A',
+        spaceAfter=30,
+        alignment=TA_CENTER,
+        fontName='Helvetica-Bold'
+    )
+    
+    heading_style = ParagraphStyle(
+        'CustomHeading',
+        parent=styles['Heading2'],
+        fontSize=14,
+        textColor='#1F7E8A',
+        spaceAfter=6,
+        spaceBefore=8,
+        fontName='Helvetica-Bold'
+    )
+    
+    # Title
+    elements.append(Paragraph(
+        f"🌍 Circularity Fit Check Report",
+        title_style
+    ))
+    elements.append(Spacer(1, 0.15*inch))
+    
+    # Metadata
+    date_line = f"<b>Datum:</b> {_format_date(assessment_date)}<br/>" if assessment_date else ""
+    metadata_text = f"""
+    <b>Produkt:</b> {product_name}<br/>
+    <b>Unternehmen:</b> {company}<br/>
+    {date_line}
+    <b>Bewertungsphase:</b> Post-Design Phase
+    """
+    elements.append(Paragraph(metadata_text, styles['Normal']))
+    elements.append(Spacer(1, 0.18*inch))
+    
+    # Total Score
+    used_weights = sum(weights.get(theme, 0.0) for theme, score in theme_scores.items() if score is not None)
+    total_score_01 = calculate_weighted_total(theme_scores, weights, skip_missing=True)
+    total_score_5 = total_score_01 * 5.0
+    level = get_maturity_level(total_score_01)
+    
+    score_text = f"""
+    <b>Gesamt-Zirkularitätsscore: {total_score_5:.2f}/5.0</b><br/>
+    <b>Reifegradlevel:</b> {level['name']} ({level['emoji']})
+    """
+    elements.append(Paragraph(score_text, styles['Normal']))
+    elements.append(Spacer(1, 0.18*inch))
+    elements.append(Paragraph("Reifegrad-Skala", heading_style))
+    elements.append(Paragraph(
+        "Sehr gering (0.00–0.20)<br/>Gering (0.20–0.40)<br/>Mittel (0.40–0.60)<br/>"
+        "Fortgeschritten (0.60–0.80)<br/>Sehr hoch (0.80–1.00)",
+        styles['Normal']
+    ))
+    elements.append(Spacer(1, 0.12*inch))
+
+    if timings is None:
+        timings = {}
+    if theme_colors is None:
+        theme_colors = {}
+
+    # Charts (Vektorgrafik, direkt im PDF)
+    chart_started = time.perf_counter()
+    radar_chart = radar_drawing(theme_scores, theme_colors=theme_colors, width=7.0*inch, height=3.8*inch)
+    score_bars = bar_drawing(theme_scores, theme_colors=theme_colors, width=7.0*inch)
+    timings["charts"] = time.perf_counter() - chart_started
+
+    elements.append(Paragraph("📊 Zirkularitäts-Profil", heading_style))
+    elements.append(radar_chart)
+    elements.append(Spacer(1, 0.18*inch))
+
+    # Themen-Scores
+    elements.append(Paragraph("📊 Themen-Scores", heading_style))
+    elements.append(score_bars)
+    elements.append(Spacer(1, 0.12*inch))
+    
+    score_table_data = [["Thema", "Score", "Gewichtung", "Beitrag"]]
+    for theme in theme_scores.keys():
+        score = theme_scores[theme]
+        weight = weights.get(theme, 0.0)
+        contrib = (score * weight) / used_weights if used_weights else 0.0
+        score_table_data.append([
+            theme,
+            f"{(score or 0):.2f}",
+            f"{weight:.2f}x",
+            f"{contrib:.2f}"
+        ])
+    
+    score_table = Table(score_table_data, colWidths=[2.2*inch, 0.7*inch, 0.8*inch, 0.8*inch])
+    score_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1F7E8A')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ]))
+    elements.append(score_table)
+    elements.append(Spacer(1, 0.3*inch))
+    
+    # Detaillierte Answers
+    elements.append(PageBreak())
+    elements.append(Paragraph("📋 Detaillierte Bewertung (inkl. Nicht-Bewertet)", heading_style))
+
+    for theme, indicators in CIRCULAR_MODEL.items():
+        elements.append(Paragraph(f"<b>{theme}</b>", styles['Heading3']))
+        for indicator in indicators.keys():
+            elements.append(Paragraph(f"<i>{indicator}</i>", styles['Normal']))
+            rows = [["Code", "Frage", "Score", "Bewertet"]]
+            for code in indicator_codes(theme, indicator):
+                text = question_text(code).get("text", "")
+                score = detailed_answers.get(theme, {}).get(indicator, {}).get(code)
+                if score is None:
+                    score_display = "—"
+                    bewertet = "Nein"
+                else:
+                    score_display = f"{score:.2f}"
+                    bewertet = "Ja"
+                rows.append([code, Paragraph(text, styles['BodyText']), score_display, bewertet])
+
+            table = Table(rows, colWidths=[0.7*inch, 4.6*inch, 0.7*inch, 0.8*inch], repeatRows=1)
+            table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#0F172A')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                ('ALIGN', (0, 0), (0, -1), 'CENTER'),
+                ('ALIGN', (2, 0), (3, -1), 'CENTER'),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, 0), 9),
+                ('FONTSIZE', (0, 1), (-1, -1), 8),
+                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.whitesmoke, colors.lightgrey]),
+                ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+            ]))
+            elements.append(table)
+            elements.append(Spacer(1, 0.2*inch))
+    
+    # Build PDF
+    if progress is not None:
+        total_flowables = max(len(elements), 1)
+
+        def on_progress(kind, value):
+            if kind == 'PROGRESS':
+                progress(min(value / total_flowables, 0.99))
+
+        doc.setProgressCallBack(on_progress)
+    doc.build(elements)
+    pdf_buffer.seek(0)
+    
+    return pdf_buffer
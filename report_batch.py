@@ -0,0 +1,281 @@
+# ============================================================================
+# REPORT BATCH - PDF PACKS AS ZIP
+# ============================================================================
+# Renders generate_pdf_report for many stored assessments in a process pool
+# and writes each PDF into a ZIP on disk as soon as it is finished. At most
+# 2 x workers reports are in flight, so memory stays bounded regardless of
+# the number of assessments. Reports already in report_cache are reused.
+# Inside the Streamlit app the pool runs in a separate "circulara export-pdf"
+# process: spawned workers would otherwise re-import the app script as their
+# __main__ module. start_export() runs that process from a background thread
+# (one export per app process at a time), so the script thread only polls
+# export_status().
+# ============================================================================
+
+import json
+import multiprocessing
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+import uuid
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+from config import BASE_DIR, DEFAULT_WEIGHTS
+from core import score_answers
+from storage import record_answers, record_field
+
+DEFAULT_BATCH_WORKERS = min(4, os.cpu_count() or 1)
+MAX_BACKGROUND_EXPORTS = 1
+
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+_exports = {}
+_exports_lock = threading.Lock()
+
+
+class ExportBusy(RuntimeError):
+    """Es läuft bereits ein Batch-Export."""
+
+
+def record_report_kwargs(record: dict, fallback_weights=None, theme_colors=None) -> dict:
+    """Argumente für generate_pdf_report aus einem gespeicherten Assessment."""
+    answers = record_answers(record)
+    weights = record.get("weights") if isinstance(record.get("weights"), dict) else (fallback_weights or DEFAULT_WEIGHTS)
+    return {
+        "product_name": record_field(record, "Produkt") or "Mein Produkt",
+        "company": record_field(record, "Unternehmen") or "Mein Unternehmen",
+        "theme_scores": score_answers(answers, weights)["dimension"],
+        "weights": weights,
+        "detailed_answers": answers,
+        "improvement_areas": [],
+        "theme_colors": theme_colors,
+        "assessment_date": record_field(record, "Timestamp"),
+    }
+
+
+def _slug(value) -> str:
+    return re.sub(r"[^0-9A-Za-zÄÖÜäöüß]+", "-", str(value or "")).strip("-")[:40] or "unbenannt"
+
+
+def report_filename(position: int, record: dict) -> str:
+    """Dateiname im ZIP: laufende Nummer, Unternehmen, Produkt, Datum."""
+    date = str(record_field(record, "Timestamp") or "")[:10]
+    parts = [f"{position:04d}", _slug(record_field(record, "Unternehmen")), _slug(record_field(record, "Produkt"))]
+    if date:
+        parts.append(_slug(date))
+    return "_".join(parts) + ".pdf"
+
+
+def _render(report_kwargs: dict):
+    """Worker-Prozess: (PDF-Bytes, Sekunden, aus dem Cache)."""
+    import report_cache
+
+    started = time.perf_counter()
+    key = report_cache.report_key(report_kwargs)
+    pdf = report_cache.get(key)
+    if pdf is not None:
+        return pdf, time.perf_counter() - started, True
+
+    from report import generate_pdf_report
+
+    pdf = generate_pdf_report(**report_kwargs).getvalue()
+    report_cache.put(key, pdf)
+    return pdf, time.perf_counter() - started, False
+
+
+def export_zip(records, zip_path, workers=DEFAULT_BATCH_WORKERS, fallback_weights=None, theme_colors=None,
+               progress=None) -> dict:
+    """
+    Schreibt je Assessment einen PDF-Report in eine ZIP-Datei
+
+    Args:
+        records (list): gespeicherte Assessments
+        zip_path (Path|str): Ziel der ZIP-Datei (wird überschrieben)
+        workers (int): Anzahl Worker-Prozesse
+        fallback_weights (dict): Gewichtung für Einträge ohne gespeicherte Gewichtung
+        theme_colors (dict): {Thema: Farbe} für die Diagramme
+        progress (callable): optional, erhält (fertig, gesamt) nach jedem Report
+
+    Returns:
+        dict: {"path", "reports": [{"name", "seconds", "bytes", "cached"}], "errors": [...], "total_s"}
+    """
+    records = list(records)
+    started = time.perf_counter()
+    workers = max(1, int(workers))
+    names = [report_filename(position, record) for position, record in enumerate(records, start=1)]
+    reports = [None] * len(records)
+    errors = []
+    completed = 0
+
+    def advance():
+        nonlocal completed
+        completed += 1
+        if progress is not None:
+            progress(completed, len(records))
+
+    # "spawn": die App-Prozesse sind mehrfädig, fork wäre dort nicht sicher
+    context = multiprocessing.get_context("spawn")
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_STORED) as archive, \
+            ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        pending = {}
+        queued = iter(enumerate(records))
+
+        def fill():
+            for position, record in queued:
+                try:
+                    report_kwargs = record_report_kwargs(record, fallback_weights, theme_colors)
+                except Exception as exc:
+                    errors.append(f"{names[position]}: {exc}")
+                    advance()
+                    continue
+                pending[executor.submit(_render, report_kwargs)] = position
+                if len(pending) >= 2 * workers:
+                    return
+
+        fill()
+        while pending:
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                position = pending.pop(future)
+                try:
+                    pdf, seconds, cached = future.result()
+                except Exception as exc:
+                    errors.append(f"{names[position]}: {exc or exc.__class__.__name__}")
+                else:
+                    archive.writestr(names[position], pdf)
+                    reports[position] = {
+                        "name": names[position],
+                        "seconds": seconds,
+                        "bytes": len(pdf),
+                        "cached": cached,
+                    }
+                advance()
+            fill()
+
+    return {
+        "path": str(zip_path),
+        "reports": [entry for entry in reports if entry is not None],
+        "errors": errors,
+        "total_s": time.perf_counter() - started,
+    }
+
+
+def export_zip_subprocess(records, zip_path, fallback_weights=None, workers=None, progress=None) -> dict:
+    """
+    Wie export_zip, aber in einem eigenen Prozess (python -m circulara export-pdf)
+
+    Für Aufrufe aus der App: Fortschritt und Zusammenfassung kommen als JSON
+    Lines über stdout zurück.
+
+    Returns:
+        dict: Zusammenfassung wie export_zip
+
+    Raises:
+        RuntimeError: der Export-Prozess ist ohne Zusammenfassung beendet worden
+    """
+    zip_path = Path(zip_path)
+    records_path = zip_path.with_suffix(".records.jsonl")
+    log_path = zip_path.with_suffix(".log")
+    with records_path.open("w", encoding="utf-8") as file:
+        for record in records:
+            file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+
+    command = [
+        sys.executable, "-m", "circulara", "export-pdf",
+        "--records", str(records_path), "-o", str(zip_path), "--json",
+    ]
+    if fallback_weights:
+        command += ["--weights", json.dumps(fallback_weights)]
+    if workers:
+        command += ["--workers", str(workers)]
+
+    summary = None
+    try:
+        with log_path.open("w", encoding="utf-8") as log, subprocess.Popen(
+            command, cwd=BASE_DIR, stdout=subprocess.PIPE, stderr=log, text=True, encoding="utf-8"
+        ) as process:
+            for line in process.stdout:
+                message = json.loads(line)
+                if "summary" in message:
+                    summary = message["summary"]
+                elif progress is not None:
+                    progress(message["done"], message["total"])
+        log_lines = log_path.read_text(encoding="utf-8").strip().splitlines()
+    finally:
+        records_path.unlink(missing_ok=True)
+        log_path.unlink(missing_ok=True)
+
+    if summary is None:
+        raise RuntimeError(log_lines[-1] if log_lines else "Batch-Export fehlgeschlagen")
+    return summary
+
+
+def _run_export(job_id: str, records, zip_path, fallback_weights):
+    def report_progress(done, total):
+        with _exports_lock:
+            _exports[job_id].update(done=done, total=total)
+
+    try:
+        summary = export_zip_subprocess(records, zip_path, fallback_weights=fallback_weights, progress=report_progress)
+    except Exception as exc:
+        fields = {"status": FAILED, "error": str(exc) or exc.__class__.__name__}
+    else:
+        fields = {"status": DONE, "summary": summary}
+    with _exports_lock:
+        _exports[job_id].update(fields)
+
+
+def start_export(records, zip_path, fallback_weights=None) -> str:
+    """
+    Startet export_zip_subprocess in einem Hintergrund-Thread
+
+    Returns:
+        str: Job-ID für export_status()
+
+    Raises:
+        ExportBusy: es laufen bereits MAX_BACKGROUND_EXPORTS Exporte
+    """
+    records = list(records)
+    with _exports_lock:
+        if sum(1 for job in _exports.values() if job["status"] == RUNNING) >= MAX_BACKGROUND_EXPORTS:
+            raise ExportBusy("Batch-Export läuft bereits")
+        job_id = uuid.uuid4().hex
+        _exports[job_id] = {
+            "status": RUNNING,
+            "done": 0,
+            "total": len(records),
+            "path": str(zip_path),
+            "summary": None,
+            "error": None,
+        }
+    threading.Thread(
+        target=_run_export,
+        args=(job_id, records, zip_path, fallback_weights),
+        name="circulara-batch-export",
+        daemon=True,
+    ).start()
+    return job_id
+
+
+def export_status(job_id: str):
+    """Kopie des Export-Zustands oder None, wenn unbekannt/verworfen."""
+    with _exports_lock:
+        job = _exports.get(job_id)
+        return dict(job) if job is not None else None
+
+
+def discard_export(job_id: str):
+    """Entfernt einen abgeschlossenen Export samt ZIP-Datei."""
+    with _exports_lock:
+        job = _exports.get(job_id)
+        if job is None or job["status"] == RUNNING:
+            return
+        del _exports[job_id]
+    Path(job["path"]).unlink(missing_ok=True)
@@ -0,0 +1,92 @@
+# ============================================================================
+# REPORT CACHE - CONTENT-ADDRESSED PDF FILES
+# ============================================================================
+# Generated PDFs are stored under REPORT_CACHE_DIR as <sha256>.pdf, keyed by
+# everything that ends up in the document (answers, weights, product, company,
+# colours, assessment date) plus MODEL_VERSION, MODEL_TEXT_VERSION (the wording of questions,
+# indicators, maturity levels and recommendations) and
+# report.REPORT_TEMPLATE_VERSION. The file mtime is the LRU clock: hits touch
+# the file, and after each write the oldest files are removed until the
+# directory fits REPORT_CACHE_MAX_BYTES.
+# ============================================================================
+
+import hashlib
+import json
+import os
+
+from config import MODEL_TEXT_VERSION, MODEL_VERSION, REPORT_CACHE_DIR, REPORT_CACHE_MAX_BYTES
+
+KEY_FIELDS = (
+    "product_name",
+    "company",
+    "theme_scores",
+    "weights",
+    "detailed_answers",
+    "improvement_areas",
+    "theme_colors",
+    "assessment_date",
+)
+
+
+def report_key(report_kwargs: dict) -> str:
+    """Cache-Schlüssel für die Argumente von report.generate_pdf_report."""
+    from report import REPORT_TEMPLATE_VERSION
+
+    payload = {field: report_kwargs.get(field) for field in KEY_FIELDS}
+    payload["model_version"] = MODEL_VERSION
+    payload["text_version"] = MODEL_TEXT_VERSION
+    payload["template_version"] = REPORT_TEMPLATE_VERSION
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _path(key: str):
+    return REPORT_CACHE_DIR / f"{key}.pdf"
+
+
+def get(key: str):
+    """PDF-Bytes aus dem Cache oder None."""
+    path = _path(key)
+    try:
+        data = path.read_bytes()
+        os.utime(path)
+    except OSError:
+        return None
+    return data
+
+
+def put(key: str, data: bytes):
+    """Legt einen Report ab und hält das Verzeichnis unter REPORT_CACHE_MAX_BYTES."""
+    path = _path(key)
+    try:
+        REPORT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        # Ohne beschreibbares Cache-Verzeichnis wird jeder Report neu erzeugt
+        return
+    evict()
+
+
+def evict(max_bytes: int = REPORT_CACHE_MAX_BYTES):
+    """Entfernt die am längsten nicht genutzten Reports, bis max_bytes eingehalten ist."""
+    entries = []
+    try:
+        for path in REPORT_CACHE_DIR.glob("*.pdf"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+    except OSError:
+        return
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+        if total <= max_bytes:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
@@ -0,0 +1,211 @@
+# ============================================================================
+# SCORE MATRIX - DENSE QUESTION SCORES NEXT TO THE HISTORY
+# ============================================================================
+# Every stored assessment is one float32 row of question scores in model
+# order (SCORING_ENGINE.codes), NaN for "Keine Auswahl". The rows live in
+# SCORE_MATRIX_DIR as a raw little-endian float32 file plus a JSON Lines
+# file with Timestamp/Unternehmen/Produkt/Sektor per row; both are appended
+# to on every save, and meta.json is written last with the row count, store
+# sequence, store location, MODEL_VERSION and question codes it covers (rows
+# beyond meta["rows"] are ignored). Resync goes through derived.DerivedStore
+# like benchmark.py: every get_score_matrix() call compares the sequence with
+# the store in O(1) and reloads or rebuilds on a mismatch.
+# Filtering is a boolean mask over the row fields, the scores themselves
+# are never walked as dicts.
+# ============================================================================
+
+import itertools
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+from config import MODEL_VERSION, SCORE_MATRIX_DIR
+from derived import DerivedStore
+from scoring import SCORING_ENGINE
+from storage import record_answers, record_field
+
+ROW_FIELDS = ("Timestamp", "Unternehmen", "Produkt", "Sektor")
+VALUES_DTYPE = np.dtype("<f4")
+META_NAME = "meta.json"
+VALUES_NAME = "questions.f32"
+ROWS_NAME = "rows.jsonl"
+
+
+class ScoreMatrix:
+    """Fragen-Scores aller Assessments (N x Fragen, float32) mit Zeilenfeldern."""
+
+    def __init__(self, root: Path = None, codes=None):
+        self.root = Path(root or SCORE_MATRIX_DIR)
+        self.codes = list(codes or SCORING_ENGINE.codes)
+        self.rows = []
+        self.sequence = None
+        self.store_location = None
+        self._persisted = None
+        self._values = np.empty((0, len(self.codes)), dtype=np.float32)
+        self._size = 0
+        self._columns = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def values(self) -> np.ndarray:
+        """(N x Fragen) Sicht auf die Scores, Zeilen in Speicherreihenfolge der Ablage."""
+        return self._values[:self._size]
+
+    # ------------------------------------------------------------------ update
+
+    def _extend(self, block: np.ndarray):
+        needed = self._size + len(block)
+        if needed > len(self._values):
+            # Kapazität verdoppeln: Anhängen bleibt amortisiert O(1)
+            grown = np.empty((max(needed, 2 * len(self._values), 64), len(self.codes)), dtype=np.float32)
+            grown[:self._size] = self._values[:self._size]
+            self._values = grown
+        self._values[self._size:needed] = block
+        self._size = needed
+
+    def add_records(self, records):
+        """Hängt gespeicherte Assessments als Zeilen an (nur im Speicher, gesichert wird mit save())."""
+        records = list(records)
+        if not records:
+            return
+        block = SCORING_ENGINE.answers_to_matrix(record_answers(r) for r in records).astype(np.float32)
+        self._extend(block)
+        self.rows.extend([record_field(r, field) for field in ROW_FIELDS] for r in records)
+        self._columns = {}
+
+    # ------------------------------------------------------------------ query
+
+    def _column(self, field: str) -> np.ndarray:
+        column = self._columns.get(field)
+        if column is None:
+            idx = ROW_FIELDS.index(field)
+            column = self._columns[field] = np.asarray([row[idx] for row in self.rows], dtype=object)
+        return column
+
+    def select(self, **filters):
+        """
+        Zeilen, die allen Filtern entsprechen (None/leer = ohne Filter)
+
+        Returns:
+            tuple: (Werte N x Fragen, Zeilen [[Timestamp, Unternehmen, Produkt, Sektor], ...]);
+                ohne Filter ist Werte eine Sicht ohne Kopie
+        """
+        active = {field: value for field, value in filters.items() if value}
+        if not active:
+            return self.values, list(self.rows)
+        mask = np.ones(self._size, dtype=bool)
+        for field, value in active.items():
+            mask &= self._column(field) == value
+        positions = np.flatnonzero(mask)
+        return self.values[positions], [self.rows[idx] for idx in positions]
+
+    # ------------------------------------------------------------------ persistence
+
+    def _file_sizes(self):
+        try:
+            return (self.root / VALUES_NAME).stat().st_size, (self.root / ROWS_NAME).stat().st_size
+        except OSError:
+            return None
+
+    def _write_rows(self, start: int, mode: str):
+        """Schreibt die Zeilen ab start in beide Dateien ("ab" anhängen, "wb" neu)."""
+        with open(self.root / VALUES_NAME, mode) as f:
+            f.write(self.values[start:].astype(VALUES_DTYPE).tobytes())
+        with open(self.root / ROWS_NAME, mode) as f:
+            for row in self.rows[start:]:
+                f.write((json.dumps(row, ensure_ascii=False, default=str) + "\n").encode("utf-8"))
+
+    def save(self):
+        """
+        Sichert neue Zeilen und danach meta.json (Stand der Ablage, Zeilenzahl)
+
+        Sind die Dateien seit dem letzten Laden/Sichern nicht mehr genau so groß
+        wie erwartet (anderer Prozess, abgebrochenes Schreiben), werden sie neu
+        geschrieben; sonst werden nur die noch nicht gesicherten Zeilen angehängt.
+        """
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            if self._persisted is not None and self._file_sizes() == self._persisted[1]:
+                self._write_rows(self._persisted[0], "ab")
+            else:
+                # meta.json zuerst entfernen: halb geschriebene Dateien werden so nie geladen
+                (self.root / META_NAME).unlink(missing_ok=True)
+                self._write_rows(0, "wb")
+            meta = {
+                "model_version": MODEL_VERSION,
+                "store_location": self.store_location,
+                "sequence": self.sequence,
+                "rows": self._size,
+                "codes": self.codes,
+            }
+            tmp_path = self.root / f"{META_NAME}.{os.getpid()}.tmp"
+            tmp_path.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, self.root / META_NAME)
+            self._persisted = (self._size, self._file_sizes())
+        except OSError:
+            # Ohne beschreibbares Cache-Verzeichnis wird beim nächsten Start neu aufgebaut
+            self._persisted = None
+
+    @classmethod
+    def load(cls, root: Path = None):
+        """Gespeicherte Matrix oder None (fehlend, unvollständig oder anderes Modell)."""
+        matrix = cls(root or SCORE_MATRIX_DIR)
+        try:
+            meta = json.loads((matrix.root / META_NAME).read_text(encoding="utf-8"))
+            if meta.get("model_version") != MODEL_VERSION or meta.get("codes") != matrix.codes:
+                return None
+            size = int(meta["rows"])
+            values = np.fromfile(matrix.root / VALUES_NAME, dtype=VALUES_DTYPE, count=size * len(matrix.codes))
+            rows_bytes = 0
+            rows = []
+            with open(matrix.root / ROWS_NAME, "rb") as f:
+                for line in itertools.islice(f, size):
+                    rows_bytes += len(line)
+                    rows.append(json.loads(line))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if values.size != size * len(matrix.codes) or len(rows) != size:
+            return None
+        matrix._values = values.reshape(-1, len(matrix.codes)).astype(np.float32, copy=False)
+        matrix._size = size
+        matrix.rows = rows
+        matrix.sequence = meta.get("sequence")
+        matrix.store_location = meta.get("store_location")
+        # Über meta.json hinaus geschriebene Zeilen (abgebrochenes Sichern): beim nächsten save() neu schreiben
+        expected = (values.nbytes, rows_bytes)
+        matrix._persisted = (size, expected) if matrix._file_sizes() == expected else None
+        return matrix
+
+
+_MATRIX = DerivedStore(ScoreMatrix, ScoreMatrix.load)
+
+
+def rebuild(store=None) -> ScoreMatrix:
+    """Baut die Matrix in einem Durchlauf über die Historie neu auf."""
+    return _MATRIX.rebuild(store)
+
+
+def get_score_matrix() -> ScoreMatrix:
+    """
+    Prozessweite Score-Matrix
+
+    Bei jedem Aufruf wird der Stand der Ablage (store.sequence()) verglichen;
+    Einträge anderer Prozesse (CLI-Import, zweiter Server) werden so
+    nachgeladen bzw. die Matrix neu aufgebaut.
+    """
+    return _MATRIX.get()
+
+
+def record_saved(record: dict, sequence: tuple):
+    """
+    Nach dem Speichern eines Assessments: Zeile anhängen (Speicher und Dateien)
+
+    Args:
+        record (dict): gespeicherter Eintrag
+        sequence (tuple): Rückgabe von store.append() für diesen Eintrag
+    """
+    _MATRIX.record_saved(sequence, lambda matrix: matrix.add_records([record]))
@@ -0,0 +1,186 @@
+# ============================================================================
+# SCORING ENGINE - VECTORIZED (NUMPY)
+# ============================================================================
+# The compiled model structure (config.COMPILED_MODEL) is turned into index
+# arrays once (question -> indicator, indicator -> theme). Assessments are
+# scored as an (N x questions) matrix, unanswered questions ("Keine Auswahl")
+# are NaN and skipped in every mean.
+# ============================================================================
+
+import numpy as np
+
+from config import COMPILED_MODEL
+
+
+def _segment_index(starts, n_cols) -> np.ndarray:
+    """Gepolsterte Spaltenindizes je Segment (Segmente x max. Länge), Polster = -1."""
+    lengths = np.diff(np.append(starts, n_cols))
+    width = int(lengths.max()) if len(lengths) else 0
+    offsets = np.arange(width)
+    return np.where(offsets[None, :] < lengths[:, None], starts[:, None] + offsets[None, :], -1)
+
+
+def _segment_nanmean(values, segment_index):
+    """
+    Mittelwert je Spaltensegment, NaN wird übersprungen
+
+    Summiert wird Position für Position von links nach rechts, damit die
+    Ergebnisse bitgleich zu ``sum(werte) / len(werte)`` in Python sind.
+    """
+    n_rows = values.shape[0]
+    sums = np.zeros((n_rows, segment_index.shape[0]))
+    counts = np.zeros((n_rows, segment_index.shape[0]), dtype=np.intp)
+    for position in range(segment_index.shape[1]):
+        columns = segment_index[:, position]
+        present = columns >= 0
+        gathered = values[:, np.where(present, columns, 0)]
+        valid = present[None, :] & ~np.isnan(gathered)
+        sums = np.where(valid, sums + np.where(valid, gathered, 0.0), sums)
+        counts += valid
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+
+
+class ScoringEngine:
+    """
+    Kompiliertes Bewertungsmodell
+
+    Fragen eines Indikators und Indikatoren eines Themas liegen in
+    Modellreihenfolge zusammenhängend und werden als Spaltensegmente gemittelt.
+    """
+
+    def __init__(self, compiled):
+        self.themes = list(compiled["themes"])
+        self.indicators = list(compiled["indicators"])
+        self.codes = list(compiled["codes"])
+        self.code_columns = {
+            (theme, indicator, code): col
+            for col, (code, i_idx) in enumerate(zip(self.codes, compiled["question_indicator"]))
+            for theme, indicator in [self.indicators[i_idx]]
+        }
+
+        self.question_indicator = np.asarray(compiled["question_indicator"], dtype=np.intp)
+        self.indicator_theme = np.asarray(compiled["indicator_theme"], dtype=np.intp)
+        self.question_segments = _segment_index(
+            np.asarray([start for start, _ in compiled["indicator_spans"]], dtype=np.intp), len(self.codes)
+        )
+        self.indicator_segments = _segment_index(
+            np.asarray([start for start, _ in compiled["theme_spans"]], dtype=np.intp), len(self.indicators)
+        )
+        self.indicator_columns = dict(compiled["indicator_index"])
+        self._nested_columns = {}
+        for (theme, indicator, code), col in self.code_columns.items():
+            self._nested_columns.setdefault(theme, {}).setdefault(indicator, {})[code] = col
+        self.theme_columns = {theme: idx for idx, theme in enumerate(self.themes)}
+
+    @property
+    def n_questions(self) -> int:
+        return len(self.codes)
+
+    # ------------------------------------------------------------------ input
+
+    def answers_to_matrix(self, answers_list) -> np.ndarray:
+        """
+        Antworten {Thema: {Indikator: {Code: Score}}} -> Matrix (N x Fragen)
+
+        Nicht beantwortete Fragen (fehlend oder None) werden NaN; Einträge, die
+        keine verschachtelten Objekte sind, werden übersprungen.
+        """
+        answers_list = list(answers_list)
+        matrix = np.full((len(answers_list), self.n_questions), np.nan)
+        nested = self._nested_columns
+        for row, answers in enumerate(answers_list):
+            values = matrix[row]
+            for theme, indicators in (answers or {}).items():
+                theme_columns = nested.get(theme)
+                if theme_columns is None or not isinstance(indicators, dict):
+                    continue
+                for indicator, questions in indicators.items():
+                    columns = theme_columns.get(indicator)
+                    if columns is None or not isinstance(questions, dict):
+                        continue
+                    for code, score in questions.items():
+                        col = columns.get(code)
+                        if col is not None and score is not None:
+                            values[col] = score
+        return matrix
+
+    def weights_to_matrix(self, weights_list, default: float = 0.0) -> np.ndarray:
+        """Gewichtungen {Thema: Gewicht} -> Matrix (N x Themen)."""
+        return np.array(
+            [[(weights or {}).get(theme, default) for theme in self.themes] for weights in weights_list],
+            dtype=float,
+        ).reshape(-1, len(self.themes))
+
+    def indicator_vector(self, scores) -> np.ndarray:
+        """Indikator-Scores {Thema: {Indikator: Score}} -> Vektor, None wird NaN."""
+        vector = np.full(len(self.indicators), np.nan)
+        for idx, (theme, indicator) in enumerate(self.indicators):
+            value = (scores or {}).get(theme, {}).get(indicator)
+            if value is not None:
+                vector[idx] = value
+        return vector
+
+    def dimension_vector(self, dimension_scores) -> np.ndarray:
+        """Dimensionen-Scores {Thema: Score} -> Vektor, None/fehlend wird NaN."""
+        return np.array(
+            [np.nan if dimension_scores.get(theme) is None else dimension_scores[theme] for theme in self.themes],
+            dtype=float,
+        )
+
+    # ------------------------------------------------------------------ scoring
+
+    def indicator_scores(self, question_matrix) -> np.ndarray:
+        return _segment_nanmean(np.asarray(question_matrix, dtype=float), self.question_segments)
+
+    def dimension_scores(self, indicator_matrix) -> np.ndarray:
+        return _segment_nanmean(np.asarray(indicator_matrix, dtype=float), self.indicator_segments)
+
+    def weighted_totals(self, dimension_matrix, weight_matrix, skip_missing: bool = False) -> np.ndarray:
+        """
+        Gewichteter Gesamtscore (0-1) je Assessment
+
+        skip_missing=False: Dimensionen ohne Bewertung zählen als 0, ihr Gewicht bleibt im Nenner.
+        skip_missing=True:  Dimensionen ohne Bewertung und ihr Gewicht werden ausgelassen.
+        """
+        dims = np.asarray(dimension_matrix, dtype=float)
+        weights = np.broadcast_to(np.asarray(weight_matrix, dtype=float), dims.shape)
+        missing = np.isnan(dims)
+        if skip_missing:
+            weights = np.where(missing, 0.0, weights)
+        contributions = np.where(missing, 0.0, dims * weights)
+        weighted_sum = np.zeros(dims.shape[0])
+        weights_sum = np.zeros(dims.shape[0])
+        for col in range(dims.shape[1]):
+            weighted_sum += contributions[:, col]
+            weights_sum += weights[:, col]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(weights_sum > 0, weighted_sum / np.where(weights_sum > 0, weights_sum, 1.0), 0.0)
+
+    def score(self, question_matrix, weight_matrix, skip_missing: bool = False) -> dict:
+        """Indikator-, Dimensionen- und Gesamtscores für alle Zeilen in einem Durchlauf."""
+        indicator = self.indicator_scores(question_matrix)
+        dimension = self.dimension_scores(indicator)
+        total = self.weighted_totals(dimension, weight_matrix, skip_missing=skip_missing)
+        return {"indicator": indicator, "dimension": dimension, "total": total}
+
+    def weighted_total(self, dimension_scores, weights, skip_missing: bool = True) -> float:
+        """Gesamtscore (0-1) für ein einzelnes Assessment aus {Thema: Score}."""
+        dims = self.dimension_vector(dimension_scores)[None, :]
+        return float(self.weighted_totals(dims, self.weights_to_matrix([weights]), skip_missing=skip_missing)[0])
+
+    # ------------------------------------------------------------------ output
+
+    def indicator_dict(self, row) -> dict:
+        """Indikator-Zeile -> {Thema: {Indikator: Score oder None}}."""
+        scores = {theme: {} for theme in self.themes}
+        for (theme, indicator), value in zip(self.indicators, row):
+            scores[theme][indicator] = None if np.isnan(value) else float(value)
+        return scores
+
+    def dimension_dict(self, row, fill=0.0) -> dict:
+        """Dimensionen-Zeile -> {Thema: Score}, Dimensionen ohne Bewertung erhalten ``fill``."""
+        return {theme: fill if np.isnan(value) else float(value) for theme, value in zip(self.themes, row)}
+
+
+SCORING_ENGINE = ScoringEngine(COMPILED_MODEL)
@@ -0,0 +1,610 @@
+# ============================================================================
+# ASSESSMENT STORAGE - LOCAL HISTORY
+# ============================================================================
+# "json":     legacy single file (assessments.json), rewritten on every save
+# "segments": append-only JSON Lines segments + small manifest
+# "sqlite":   indexed repository (WAL) for queries, filters and counts
+#
+# Every backend has an O(1) sequence(): a number that grows with each append
+# (record count for json, byte end of the segment log, max(id) for sqlite).
+# append() returns (sequence before, sequence after) for its record, so
+# derived stores can tell "exactly this record is new" from "the history
+# changed elsewhere" without counting the history.
+# ============================================================================
+
+import collections
+import itertools
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional
+
+from config import (
+    ASSESSMENT_DB_PATH,
+    ASSESSMENT_LOG_DIR,
+    ASSESSMENTS_PATH,
+    SEGMENT_MAX_BYTES,
+    STORAGE_BACKEND,
+)
+
+MANIFEST_NAME = "manifest.json"
+
+# Ältere Historien-Einträge verwenden englische Feldnamen
+LEGACY_FIELDS = {
+    "Timestamp": "timestamp",
+    "Produkt": "Product_Name",
+    "Unternehmen": "Company",
+}
+
+FILTER_FIELDS = ("Unternehmen", "Produkt", "Sektor")
+
+
+def record_field(record: dict, field: str):
+    value = record.get(field)
+    if value is None and field in LEGACY_FIELDS:
+        value = record.get(LEGACY_FIELDS[field])
+    return value
+
+
+def record_answers(record: dict) -> dict:
+    if isinstance(record.get("answers"), dict):
+        return record["answers"]
+    if isinstance(record.get("Detailed_Answers"), str):
+        try:
+            return json.loads(record["Detailed_Answers"])
+        except Exception:
+            return {}
+    return {}
+
+
+def _read_json_records(path: Path) -> list:
+    if not path.exists():
+        return []
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception:
+        return []
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict):
+        return [data]
+    return []
+
+
+class _ScanQueryMixin:
+    """Filter und Zählungen für Ablagen ohne Index (sequentieller Scan)."""
+
+    def _iter_matching(self, filters: dict):
+        active = {k: v for k, v in filters.items() if v}
+        for record in self.iter_records():
+            if all(record_field(record, k) == v for k, v in active.items()):
+                yield record
+
+    def query(self, limit: Optional[int] = None, newest_first: bool = False, offset: int = 0, **filters) -> list:
+        matching = self._iter_matching(filters)
+        if not newest_first:
+            return list(itertools.islice(matching, offset, None if limit is None else offset + limit))
+        # Nur die letzten offset + limit Einträge im Speicher halten
+        records = list(collections.deque(matching, maxlen=None if limit is None else offset + limit))
+        records.reverse()
+        return records[offset:]
+
+    def count(self, **filters) -> int:
+        return sum(1 for _ in self._iter_matching(filters))
+
+    def product_timeline(self, product: str, **filters) -> list:
+        """Assessments eines Produkts in zeitlicher Reihenfolge (Timestamp, dann Speicherreihenfolge)."""
+        records = self.query(Produkt=product, **filters)
+        return sorted(records, key=lambda r: str(record_field(r, "Timestamp") or ""))
+
+    def distinct(self, field: str) -> list:
+        values = {record_field(r, field) for r in self.iter_records()}
+        return sorted(v for v in values if v)
+
+
+class JsonFileStore(_ScanQueryMixin):
+    """Historie als eine JSON-Liste (ursprüngliches Format, O(Historie) pro Speichern)."""
+
+    def __init__(self, path: Path = ASSESSMENTS_PATH):
+        self.path = Path(path)
+        self.location = str(self.path)
+        self._lock = threading.Lock()
+        self._counted = None
+
+    def _stat_key(self):
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def append(self, record: dict) -> tuple:
+        with self._lock:
+            history = _read_json_records(self.path)
+            history.append(record)
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(history, f, indent=2, ensure_ascii=False)
+            self._counted = (self._stat_key(), len(history))
+        return len(history) - 1, len(history)
+
+    def sequence(self) -> int:
+        """Anzahl Einträge; gezählt wird nur, wenn sich die Datei geändert hat."""
+        key = self._stat_key()
+        if key is None:
+            return 0
+        with self._lock:
+            if self._counted is None or self._counted[0] != key:
+                self._counted = (key, len(_read_json_records(self.path)))
+            return self._counted[1]
+
+    def iter_records(self):
+        yield from _read_json_records(self.path)
+
+    def load_all(self) -> list:
+        return list(self.iter_records())
+
+
+class SegmentLogStore(_ScanQueryMixin):
+    """
+    Append-only Historie in rollierenden JSON-Lines-Segmenten
+
+    Jedes Assessment wird als eine Zeile an das aktive Segment angehängt.
+    Das Manifest listet die Segmente in Schreibreihenfolge und wird nur beim
+    Anlegen eines neuen Segments neu geschrieben.
+
+    Abfragen mit Produkt-Filter lesen nur die Zeilen dieses Produkts: ein
+    Index im Speicher hält je Produkt (Segment, Byte-Offset) und wird vor
+    jeder solchen Abfrage um die seitdem angehängten Zeilen ergänzt.
+    """
+
+    def __init__(self, root: Path = ASSESSMENT_LOG_DIR, max_segment_bytes: int = SEGMENT_MAX_BYTES,
+                 legacy_path: Optional[Path] = None):
+        self.root = Path(root)
+        self.max_segment_bytes = max_segment_bytes
+        self.location = str(self.root)
+        self._lock = threading.Lock()
+        self._manifest = None
+        self._legacy_path = Path(legacy_path) if legacy_path else None
+        self._defer_manifest = False
+        self._product_index = {}
+        self._indexed_bytes = {}
+        self._sealed = (0, 0)
+
+    # ------------------------------------------------------------------ manifest
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.root / MANIFEST_NAME
+
+    def _write_manifest(self, manifest: dict):
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _load_manifest(self) -> dict:
+        if self._manifest is not None:
+            return self._manifest
+        if self.manifest_path.exists():
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                self._manifest = json.load(f)
+            return self._manifest
+
+        # Manifest erst nach vollständigem Legacy-Import sichtbar machen: bricht der
+        # Import ab, fehlt das Manifest und der nächste Start beginnt von vorn
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._manifest = {"version": 1, "segments": []}
+        self._defer_manifest = True
+        try:
+            self._new_segment()
+            self._import_legacy()
+        except BaseException:
+            self._manifest = None
+            raise
+        finally:
+            self._defer_manifest = False
+        self._write_manifest(self._manifest)
+        return self._manifest
+
+    def _new_segment(self) -> str:
+        manifest = self._manifest
+        name = f"segment-{len(manifest['segments']):06d}.jsonl"
+        # Leeren statt touch(): Reste eines abgebrochenen Anlegens nicht übernehmen
+        (self.root / name).write_bytes(b"")
+        manifest["segments"].append(name)
+        if not self._defer_manifest:
+            self._write_manifest(manifest)
+        return name
+
+    def _sealed_bytes(self, manifest: dict) -> int:
+        """Bytes aller abgeschlossenen Segmente (ändern sich nicht mehr, daher zwischengespeichert)."""
+        sealed = manifest["segments"][:-1]
+        if self._sealed[0] != len(sealed):
+            total = 0
+            for name in sealed:
+                try:
+                    total += (self.root / name).stat().st_size
+                except FileNotFoundError:
+                    continue
+            self._sealed = (len(sealed), total)
+        return self._sealed[1]
+
+    def _import_legacy(self):
+        """Übernimmt einmalig eine vorhandene assessments.json beim Anlegen der Ablage."""
+        if self._legacy_path is None:
+            return
+        for record in _read_json_records(self._legacy_path):
+            self._append_unlocked(record)
+
+    # ------------------------------------------------------------------ write
+
+    def _append_unlocked(self, record: dict) -> tuple:
+        manifest = self._load_manifest()
+        segment_path = self.root / manifest["segments"][-1]
+        size = segment_path.stat().st_size if segment_path.exists() else 0
+        if size >= self.max_segment_bytes:
+            segment_path = self.root / self._new_segment()
+            size = 0
+        before = self._sealed_bytes(manifest) + size
+
+        payload = (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+        with open(segment_path, "ab+") as f:
+            if size > 0:
+                # Abgebrochene letzte Zeile (z. B. nach Absturz) nicht fortsetzen
+                f.seek(size - 1)
+                if f.read(1) != b"\n":
+                    payload = b"\n" + payload
+            f.write(payload)
+        return before, before + len(payload)
+
+    def append(self, record: dict) -> tuple:
+        with self._lock:
+            return self._append_unlocked(record)
+
+    def sequence(self) -> int:
+        """Byte-Ende des Logs über alle Segmente (ein stat() auf das aktive Segment)."""
+        with self._lock:
+            manifest = self._load_manifest()
+            segment_path = self.root / manifest["segments"][-1]
+            try:
+                size = segment_path.stat().st_size
+            except FileNotFoundError:
+                size = 0
+            if size >= self.max_segment_bytes and self.manifest_path.exists():
+                # Ein anderer Prozess hat ggf. ein neues Segment begonnen
+                self._manifest = None
+                if len(self._load_manifest()["segments"]) != len(manifest["segments"]):
+                    manifest = self._manifest
+                    segment_path = self.root / manifest["segments"][-1]
+                    size = segment_path.stat().st_size if segment_path.exists() else 0
+            return self._sealed_bytes(manifest) + size
+
+    # ------------------------------------------------------------------ read
+
+    def iter_records(self):
+        with self._lock:
+            segments = list(self._load_manifest()["segments"])
+        for name in segments:
+            segment_path = self.root / name
+            if not segment_path.exists():
+                continue
+            with open(segment_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+
+    def load_all(self) -> list:
+        return list(self.iter_records())
+
+    # ------------------------------------------------------------------ product index
+
+    def _refresh_product_index(self):
+        """Indexiert die seit dem letzten Aufruf angehängten, vollständigen Zeilen."""
+        for name in self._load_manifest()["segments"]:
+            segment_path = self.root / name
+            if not segment_path.exists():
+                continue
+            offset = self._indexed_bytes.get(name, 0)
+            with open(segment_path, "rb") as f:
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        # Noch nicht vollständig geschrieben: beim nächsten Mal erneut lesen
+                        break
+                    try:
+                        product = record_field(json.loads(line), "Produkt")
+                    except (json.JSONDecodeError, UnicodeDecodeError, AttributeError):
+                        product = None
+                    if product:
+                        self._product_index.setdefault(product, []).append((name, offset))
+                    offset += len(line)
+            self._indexed_bytes[name] = offset
+
+    def _iter_product(self, product: str):
+        with self._lock:
+            self._refresh_product_index()
+            locations = list(self._product_index.get(product, []))
+        handles = {}
+        try:
+            for name, offset in locations:
+                f = handles.get(name)
+                if f is None:
+                    f = handles[name] = open(self.root / name, "rb")
+                f.seek(offset)
+                yield json.loads(f.readline())
+        finally:
+            for f in handles.values():
+                f.close()
+
+    def _iter_matching(self, filters: dict):
+        product = filters.get("Produkt")
+        if not product:
+            yield from super()._iter_matching(filters)
+            return
+        active = {k: v for k, v in filters.items() if v and k != "Produkt"}
+        for record in self._iter_product(product):
+            if all(record_field(record, k) == v for k, v in active.items()):
+                yield record
+
+
+class SQLiteAssessmentRepository:
+    """
+    Assessment-Historie in SQLite (WAL-Modus)
+
+    Unternehmen, Produkt, Sektor und Timestamp liegen als indizierte Spalten
+    vor, weights und answers als JSON. Die beim Speichern berechneten Scores
+    (total_score, dimension_scores, model_version) sind eigene Spalten. Übrige
+    Felder des Eintrags (z. B. scores, Dimensionen_Prioritaet) werden in
+    ``extra`` mitgeführt.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS assessments (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            timestamp TEXT,
+            unternehmen TEXT,
+            produkt TEXT,
+            sektor TEXT,
+            weights TEXT,
+            answers TEXT,
+            model_version TEXT,
+            total_score REAL,
+            dimension_scores TEXT,
+            extra TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_assessments_unternehmen ON assessments (unternehmen);
+        CREATE INDEX IF NOT EXISTS idx_assessments_produkt ON assessments (produkt);
+        CREATE INDEX IF NOT EXISTS idx_assessments_sektor ON assessments (sektor);
+        CREATE INDEX IF NOT EXISTS idx_assessments_timestamp ON assessments (timestamp);
+        CREATE INDEX IF NOT EXISTS idx_assessments_produkt_timestamp ON assessments (produkt, timestamp);
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+    """
+
+    COLUMNS = {
+        "Timestamp": "timestamp",
+        "Unternehmen": "unternehmen",
+        "Produkt": "produkt",
+        "Sektor": "sektor",
+    }
+
+    # Spalten, die in älteren Datenbanken nachgezogen werden
+    ADDED_COLUMNS = {
+        "model_version": "TEXT",
+        "total_score": "REAL",
+        "dimension_scores": "TEXT",
+    }
+
+    ROW_COLUMNS = (
+        "timestamp", "unternehmen", "produkt", "sektor", "weights", "answers",
+        "model_version", "total_score", "dimension_scores", "extra",
+    )
+    INSERT_SQL = (
+        f"INSERT INTO assessments ({', '.join(ROW_COLUMNS)}) "
+        f"VALUES ({', '.join('?' for _ in ROW_COLUMNS)})"
+    )
+    SELECT_SQL = f"SELECT {', '.join(ROW_COLUMNS)} FROM assessments"
+
+    def __init__(self, path: Path = ASSESSMENT_DB_PATH):
+        self.path = Path(path)
+        self.location = str(self.path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+        self._migrate()
+
+    def _migrate(self):
+        existing = {row[1] for row in self._conn.execute("PRAGMA table_info(assessments)")}
+        with self._conn:
+            for column, column_type in self.ADDED_COLUMNS.items():
+                if column not in existing:
+                    self._conn.execute(f"ALTER TABLE assessments ADD COLUMN {column} {column_type}")
+
+    # ------------------------------------------------------------------ rows
+
+    @staticmethod
+    def _to_row(record: dict) -> tuple:
+        own_fields = {"answers", "weights", "Detailed_Answers", "model_version", "total_score", "dimension_scores"}
+        extra = {
+            k: v for k, v in record.items()
+            if k not in own_fields
+            and k not in SQLiteAssessmentRepository.COLUMNS
+            and k not in LEGACY_FIELDS.values()
+        }
+        dimension_scores = record.get("dimension_scores")
+        return (
+            record_field(record, "Timestamp"),
+            record_field(record, "Unternehmen"),
+            record_field(record, "Produkt"),
+            record_field(record, "Sektor"),
+            json.dumps(record.get("weights"), ensure_ascii=False),
+            json.dumps(record_answers(record), ensure_ascii=False),
+            record.get("model_version"),
+            record.get("total_score"),
+            json.dumps(dimension_scores, ensure_ascii=False) if dimension_scores is not None else None,
+            json.dumps(extra, ensure_ascii=False),
+        )
+
+    @staticmethod
+    def _from_row(row) -> dict:
+        (timestamp, company, product, sector, weights, answers,
+         model_version, total_score, dimension_scores, extra) = row
+        record = {
+            "Timestamp": timestamp,
+            "Produkt": product,
+            "Unternehmen": company,
+            "Sektor": sector,
+        }
+        record.update(json.loads(extra) if extra else {})
+        record["answers"] = json.loads(answers) if answers else {}
+        record["weights"] = json.loads(weights) if weights else None
+        if model_version is not None:
+            record["model_version"] = model_version
+            record["total_score"] = total_score
+            record["dimension_scores"] = json.loads(dimension_scores) if dimension_scores else None
+        return record
+
+    def _where(self, filters: dict):
+        clauses, params = [], []
+        for field, value in filters.items():
+            if not value:
+                continue
+            if field not in self.COLUMNS:
+                raise ValueError(f"Unbekannter Filter: {field}")
+            clauses.append(f"{self.COLUMNS[field]} = ?")
+            params.append(value)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    # ------------------------------------------------------------------ write
+
+    def append(self, record: dict) -> tuple:
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                self.INSERT_SQL,
+                self._to_row(record),
+            )
+            # Nach dem INSERT (Schreibsperre gehalten), damit kein anderer Prozess dazwischen einfügt
+            before = self._conn.execute(
+                "SELECT COALESCE(MAX(id), 0) FROM assessments WHERE id < ?", (cursor.lastrowid,)
+            ).fetchone()[0]
+        return before, cursor.lastrowid
+
+    def sequence(self) -> int:
+        """Höchste vergebene id (Primärschlüssel, ohne Scan)."""
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(MAX(id), 0) FROM assessments").fetchone()[0]
+
+    def import_records(self, records, source: str) -> int:
+        """Importiert Einträge genau einmal pro Quelle (Marker in ``meta``)."""
+        key = f"imported:{source}"
+        with self._lock, self._conn:
+            if self._conn.execute("SELECT 1 FROM meta WHERE key = ?", (key,)).fetchone():
+                return 0
+            rows = [self._to_row(r) for r in records if isinstance(r, dict)]
+            self._conn.executemany(
+                self.INSERT_SQL,
+                rows,
+            )
+            self._conn.execute("INSERT INTO meta (key, value) VALUES (?, ?)", (key, str(len(rows))))
+        return len(rows)
+
+    def import_json(self, path: Path = ASSESSMENTS_PATH) -> int:
+        """One-shot-Import einer bestehenden assessments.json."""
+        path = Path(path)
+        if not path.exists():
+            return 0
+        return self.import_records(_read_json_records(path), source=str(path.resolve()))
+
+    # ------------------------------------------------------------------ read
+
+    def iter_records(self):
+        yield from self.query()
+
+    def load_all(self) -> list:
+        return self.query()
+
+    def query(self, limit: Optional[int] = None, newest_first: bool = False, offset: int = 0, **filters) -> list:
+        where, params = self._where(filters)
+        sql = (
+            self.SELECT_SQL
+            + where
+            + (" ORDER BY id DESC" if newest_first else " ORDER BY id")
+        )
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([-1 if limit is None else int(limit), int(offset)])
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [self._from_row(row) for row in rows]
+
+    def count(self, **filters) -> int:
+        where, params = self._where(filters)
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM assessments" + where, params).fetchone()[0]
+
+    def product_timeline(self, product: str, **filters) -> list:
+        """Assessments eines Produkts in zeitlicher Reihenfolge (Index auf produkt, timestamp)."""
+        where, params = self._where({**filters, "Produkt": product})
+        with self._lock:
+            rows = self._conn.execute(self.SELECT_SQL + where + " ORDER BY timestamp, id", params).fetchall()
+        return [self._from_row(row) for row in rows]
+
+    def distinct(self, field: str) -> list:
+        column = self.COLUMNS[field]
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT DISTINCT {column} FROM assessments WHERE {column} IS NOT NULL AND {column} != '' "
+                f"ORDER BY {column}"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+
+_STORE = None
+_STORE_LOCK = threading.Lock()
+
+
+def _open_sqlite(db_path: Path, json_path: Path, log_dir: Path) -> SQLiteAssessmentRepository:
+    """
+    SQLite-Ablage, vorhandene Historie wird einmalig übernommen
+
+    Ein Segment-Log enthält assessments.json bereits (Legacy-Import beim
+    Anlegen), daher wird dann nur das Log importiert, sonst die JSON-Datei.
+    """
+    repository = SQLiteAssessmentRepository(db_path)
+    manifest_path = Path(log_dir) / MANIFEST_NAME
+    if manifest_path.exists():
+        repository.import_records(SegmentLogStore(log_dir).iter_records(), source=str(manifest_path.resolve()))
+    else:
+        repository.import_json(json_path)
+    return repository
+
+
+def create_store(backend: str = STORAGE_BACKEND):
+    if backend == "json":
+        return JsonFileStore(ASSESSMENTS_PATH)
+    if backend == "segments":
+        return SegmentLogStore(ASSESSMENT_LOG_DIR, legacy_path=ASSESSMENTS_PATH)
+    if backend == "sqlite":
+        return _open_sqlite(ASSESSMENT_DB_PATH, ASSESSMENTS_PATH, ASSESSMENT_LOG_DIR)
+    raise ValueError(f"Unbekanntes Storage-Backend: {backend}")
+
+
+def get_store():
+    """Prozessweite Assessment-Ablage gemäß CIRCULARA_STORAGE."""
+    global _STORE
+    with _STORE_LOCK:
+        if _STORE is None:
+            _STORE = create_store()
+        return _STORE
@@ -0,0 +1,143 @@
+# ============================================================================
+# STYLES - PRECOMPILED STYLESHEETS
+# ============================================================================
+# The CSS sources in assets/css are assembled once per process into bundles
+# (base, welcome, assessment). Each bundle is published as a content-hashed
+# file (<name>.<sha>.css) in STYLESHEET_DIR, which is registered as a static
+# component directory: Streamlit serves component files as text/css with
+# Cache-Control: public. A rerun therefore only emits a short <link> element;
+# the browser fetches each bundle once and keeps it until its content (and
+# with it the file name) changes. Without a writable STYLESHEET_DIR the
+# bundle is inlined as a <style> element instead, resent on every rerun.
+# The five THEME_UI variants are CSS variable blocks keyed on a marker class
+# (.cf-theme-<n>), so switching dimension or indicator only changes a tiny
+# marker element, not the CSS.
+# ============================================================================
+
+import hashlib
+import os
+import threading
+
+from config import BASE_DIR, CACHE_DIR, COMPILED_MODEL
+
+CSS_SOURCE_DIR = BASE_DIR / "assets" / "css"
+STYLESHEET_DIR = CACHE_DIR / "stylesheets"
+
+THEME_UI = {
+    "Design": {"bg": "#E9FBF5", "bg2": "#F6FFFC", "accent": "#1F7E8A", "pill": "#D8F6EE"},
+    "Strategie": {"bg": "#EAF3FF", "bg2": "#F6FAFF", "accent": "#2B6CB0", "pill": "#DCEBFF"},
+    "Wirtschaftlichkeit": {"bg": "#FFF6E8", "bg2": "#FFFBF3", "accent": "#B7791F", "pill": "#FFE9C8"},
+    "Regulatorik": {"bg": "#F3EEFF", "bg2": "#FAF7FF", "accent": "#6B46C1", "pill": "#E8DEFF"},
+    "Systemische Befähiger": {"bg": "#FFF0F5", "bg2": "#FFF7FB", "accent": "#C026D3", "pill": "#FAD5E8"},
+}
+
+THEME_CLASSES = {theme: f"cf-theme-{idx}" for idx, theme in enumerate(THEME_UI)}
+
+
+def _read_css(name: str) -> str:
+    return (CSS_SOURCE_DIR / f"{name}.css").read_text(encoding="utf-8")
+
+
+def _theme_variables_css() -> str:
+    """Eine Variablen-Gruppe je Dimension, aktiv über die Marker-Klasse."""
+    blocks = []
+    for theme, ui in THEME_UI.items():
+        blocks.append(
+            f".stApp:has(.{THEME_CLASSES[theme]}) {{"
+            f" --cf-bg: {ui['bg']}; --cf-bg2: {ui['bg2']};"
+            f" --cf-accent: {ui['accent']}; --cf-pill: {ui['pill']}; }}"
+        )
+    return "\n".join(blocks)
+
+
+def _active_card_css() -> str:
+    """Hervorhebung der aktiven Dimensions-Karte und des aktiven Indikators (.cf-dim-<i>, .cf-ind-<i>)."""
+    n_themes = len(COMPILED_MODEL["themes"])
+    max_indicators = max((stop - start for start, stop in COMPILED_MODEL["theme_spans"]), default=0)
+    rules = [
+        f".stApp:has(.cf-dim-{i}) [class*='st-key-dim-card-{i}']{{outline:2px solid var(--cf-accent);}}"
+        for i in range(n_themes)
+    ]
+    rules += [
+        f".stApp:has(.cf-ind-{i}) [class*='st-key-indicator-btn-{i}'] button"
+        "{background:var(--cf-pill) !important; border-color:var(--cf-accent) !important;"
+        " color:#0B1220 !important; font-weight:900 !important;}"
+        for i in range(max_indicators)
+    ]
+    return "\n".join(rules)
+
+
+def _build_bundles() -> dict:
+    return {
+        "base": _read_css("base"),
+        "welcome": _read_css("welcome"),
+        "assessment": "\n".join([_theme_variables_css(), _active_card_css(), _read_css("assessment")]),
+    }
+
+
+BUNDLES = _build_bundles()
+
+_LINK_TAGS = None
+_LINK_TAGS_LOCK = threading.Lock()
+
+
+def _inline_tag(css: str) -> str:
+    return f"<style>\n{css}\n</style>"
+
+
+def publish_bundles(directory=STYLESHEET_DIR) -> dict:
+    """
+    Schreibt jedes Bundle als <name>.<sha>.css (nur falls noch nicht vorhanden)
+
+    Returns:
+        dict: {Bundle: Dateiname}; leer, wenn das Verzeichnis nicht beschreibbar ist
+    """
+    files = {}
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        for name, css in BUNDLES.items():
+            data = css.encode("utf-8")
+            filename = f"{name}.{hashlib.sha256(data).hexdigest()[:16]}.css"
+            path = directory / filename
+            if not path.exists():
+                tmp_path = directory / f"{filename}.{os.getpid()}.tmp"
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, path)
+            files[name] = filename
+    except OSError:
+        return {}
+    return files
+
+
+def _link_tags() -> dict:
+    """<link>-Elemente je Bundle (einmal je Prozess veröffentlicht und registriert)."""
+    global _LINK_TAGS
+    with _LINK_TAGS_LOCK:
+        if _LINK_TAGS is None:
+            _LINK_TAGS = {}
+            directory = STYLESHEET_DIR
+            files = publish_bundles(directory)
+            if files:
+                import streamlit.components.v1 as components
+
+                component = components.declare_component("stylesheets", path=str(directory))
+                _LINK_TAGS = {
+                    name: f'<link rel="stylesheet" href="component/{component.name}/{filename}">'
+                    for name, filename in files.items()
+                }
+        return _LINK_TAGS
+
+
+def stylesheet(name: str) -> str:
+    """HTML zum Einbinden eines Bundles ("base", "welcome", "assessment"): <link>, sonst <style>."""
+    return _link_tags().get(name) or _inline_tag(BUNDLES[name])
+
+
+def theme_marker(theme: str, dimension_index=None, indicator_index=None) -> str:
+    """Leeres Marker-Element, über dessen Klassen Theme und aktive Karten gewählt werden."""
+    classes = ["cf-marker", THEME_CLASSES.get(theme, THEME_CLASSES["Design"])]
+    if dimension_index is not None:
+        classes.append(f"cf-dim-{dimension_index}")
+    if indicator_index is not None:
+        classes.append(f"cf-ind-{indicator_index}")
+    return f"<span class=\"{' '.join(classes)}\"></span>"
@@ -0,0 +1,18 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import storage  # noqa: E402
+
+
+@pytest.fixture(params=["json", "segments", "sqlite"])
+def store(request, tmp_path):
+    """Leere Ablage je Backend (kleine Segmente, damit mehrere entstehen)."""
+    if request.param == "json":
+        return storage.JsonFileStore(tmp_path / "a.json")
+    if request.param == "segments":
+        return storage.SegmentLogStore(tmp_path / "log", max_segment_bytes=256, legacy_path=tmp_path / "none.json")
+    return storage.SQLiteAssessmentRepository(tmp_path / "a.db")
@@ -0,0 +1,43 @@
+import io
+import json
+
+import circulara
+from scoring import SCORING_ENGINE
+
+
+def _valid_answers():
+    (theme, indicator), code = SCORING_ENGINE.indicators[0], SCORING_ENGINE.codes[0]
+    return {theme: {indicator: {code: 1.0}}}
+
+
+def test_bad_shape_lines_are_skipped_and_valid_lines_scored():
+    lines = [
+        json.dumps({"answers": _valid_answers(), "id": 1}),
+        json.dumps({"answers": {"Design": 5}, "id": 2}),
+        json.dumps({"answers": _valid_answers(), "weights": {"Design": "hoch"}, "id": 3}),
+        "{kein json",
+        json.dumps({"answers": _valid_answers(), "id": 4}),
+    ]
+    out = io.StringIO()
+    count, errors = circulara.score_stream(lines, out, chunk_size=16)
+
+    assert count == 2
+    assert [json.loads(line)["id"] for line in out.getvalue().splitlines()] == [1, 4]
+    assert len(errors) == 3
+    assert [message.split(":")[0] for message in errors] == ["Zeile 2", "Zeile 3", "Zeile 4"]
+
+
+def test_error_messages_are_capped():
+    errors = circulara.ErrorLog(limit=2)
+    for idx in range(5):
+        errors.append(f"Zeile {idx}")
+    assert len(errors) == 5
+    assert list(errors) == ["Zeile 0", "Zeile 1"]
+
+
+def test_invalid_weights_option_is_reported(tmp_path, capsys):
+    source = tmp_path / "in.jsonl"
+    source.write_text(json.dumps({"answers": _valid_answers()}) + "\n", encoding="utf-8")
+    for weights, expected in (("{kein json", "kein gültiges JSON"), ('{"Design": "hoch"}', "Zahl erwartet")):
+        assert circulara.main(["score", str(source), "--weights", weights]) == 2
+        assert expected in capsys.readouterr().err
@@ -0,0 +1,150 @@
+import random
+
+import numpy as np
+import pytest
+
+import aggregates
+import benchmark
+import score_matrix
+from config import CIRCULAR_MODEL, DEFAULT_WEIGHTS
+from core import score_answers
+from derived import DerivedStore
+
+SECTORS = ["Bau", "Textil", ""]
+
+
+def _records(seed, n):
+    rng = random.Random(seed)
+    records = []
+    for idx in range(n):
+        answers = {
+            theme: {
+                indicator: {q["code"]: rng.choice([0.0, 0.5, 1.0, None]) for q in data.get("questions", [])}
+                for indicator, data in indicators.items()
+            }
+            for theme, indicators in CIRCULAR_MODEL.items()
+        }
+        records.append({"Timestamp": f"t{idx}", "Sektor": rng.choice(SECTORS), "answers": answers})
+    return records
+
+
+def _save(store, record):
+    """Wie save_assessment_mc: anhängen, dann die abgeleiteten Stände fortschreiben."""
+    sequence = store.append(record)
+    result = score_answers(record["answers"], DEFAULT_WEIGHTS)
+    benchmark.record_saved(record, result, sequence)
+    aggregates.record_saved(record, result, sequence)
+    score_matrix.record_saved(record, sequence)
+
+
+@pytest.fixture
+def bench(store, tmp_path, monkeypatch):
+    """Abgeleitete Stände mit eigenem Cache-Verzeichnis über der Test-Ablage."""
+    monkeypatch.setattr(benchmark, "BENCHMARK_PATH", tmp_path / "cache" / "benchmark.npz")
+    monkeypatch.setattr(aggregates, "AGGREGATES_PATH", tmp_path / "cache" / "aggregates.json")
+    monkeypatch.setattr(score_matrix, "SCORE_MATRIX_DIR", tmp_path / "cache" / "score_matrix")
+    for module, name, cls in ((benchmark, "_BENCHMARK", benchmark.BenchmarkIndex),
+                              (aggregates, "_AGGREGATES", aggregates.AggregateTable),
+                              (score_matrix, "_MATRIX", score_matrix.ScoreMatrix)):
+        monkeypatch.setattr(module, name, DerivedStore(cls, cls.load, store=store, chunk_size=3))
+    return store
+
+
+def _sketches(index):
+    return {sector: index.sketches[sector].tolist() for sector in index.sectors()}
+
+
+def test_benchmark_incremental_updates_match_rebuild(bench, monkeypatch):
+    rebuilds = []
+    original = benchmark._BENCHMARK.rebuild
+    monkeypatch.setattr(benchmark._BENCHMARK, "rebuild", lambda store=None: rebuilds.append(1) or original(store))
+
+    for record in _records(seed=1, n=8):
+        _save(bench, record)
+
+    index = benchmark.get_benchmark()
+    assert len(rebuilds) == 1  # nur beim ersten Speichern (noch kein gesicherter Stand)
+    assert index.record_count == 8
+    assert index.sequence == bench.sequence()
+    assert _sketches(index) == _sketches(benchmark.rebuild(bench))
+
+    # Der gesicherte Stand wird ohne Neuaufbau übernommen
+    loaded = benchmark.BenchmarkIndex.load()
+    assert loaded.sequence == index.sequence
+    assert _sketches(loaded) == _sketches(index)
+
+
+def test_benchmark_resyncs_after_foreign_appends(bench):
+    records = _records(seed=2, n=6)
+    _save(bench, records[0])
+    assert benchmark.get_benchmark().record_count == 1
+
+    # Anderer Prozess: speichert, ohne diesen Index fortzuschreiben
+    for record in records[1:3]:
+        bench.append(record)
+    assert benchmark.get_benchmark().record_count == 3
+
+    # Eigenes Speichern nach fremdem Eintrag: Bereich passt nicht, daher Neuaufbau
+    bench.append(records[3])
+    _save(bench, records[4])
+    index = benchmark.get_benchmark()
+    assert index.record_count == 5
+    assert np.array_equal(index.sample_sizes(), benchmark.rebuild(bench).sample_sizes())
+
+
+def test_aggregates_incremental_updates_match_rebuild(bench):
+    records = _records(seed=3, n=9)
+    for record in records[:7]:
+        _save(bench, record)
+    bench.append(records[7])  # fremder Eintrag, erst beim nächsten Zugriff übernommen
+    _save(bench, records[8])
+
+    table = aggregates.get_aggregates()
+    rebuilt = aggregates.rebuild(bench)
+    assert table.sequence == rebuilt.sequence == bench.sequence()
+    assert table.record_count == 9
+    for sector in SECTORS:
+        summary, expected = table.summary(sector=sector), rebuilt.summary(sector=sector)
+        assert summary["count"] == expected["count"]
+        assert summary["latest"] == expected["latest"]
+        assert summary["total"] == pytest.approx(expected["total"])
+    assert aggregates.AggregateTable.load().sequence == table.sequence
+
+
+def _assert_same_matrix(matrix, expected):
+    assert matrix.rows == expected.rows
+    np.testing.assert_array_equal(matrix.values, expected.values)
+
+
+def test_score_matrix_appends_only_new_rows(bench):
+    records = _records(seed=4, n=8)
+    for record in records[:5]:
+        _save(bench, record)
+    bench.append(records[5])
+    _save(bench, records[6])
+
+    matrix = score_matrix.get_score_matrix()
+    assert len(matrix) == 7
+    assert matrix.sequence == bench.sequence()
+    _assert_same_matrix(score_matrix.ScoreMatrix.load(), matrix)
+    _assert_same_matrix(matrix, score_matrix.rebuild(bench))
+
+
+def test_score_matrix_ignores_rows_beyond_meta(bench):
+    records = _records(seed=5, n=4)
+    for record in records[:3]:
+        _save(bench, record)
+    saved = score_matrix.ScoreMatrix.load()
+
+    # Abgebrochenes Sichern: Zeile angehängt, meta.json nicht mehr geschrieben
+    partial = score_matrix.ScoreMatrix.load()
+    partial.add_records(records[3:])
+    partial._write_rows(3, "ab")
+
+    loaded = score_matrix.ScoreMatrix.load()
+    _assert_same_matrix(loaded, saved)
+    assert loaded.sequence == saved.sequence
+
+    # Das nächste Sichern schreibt die Dateien vollständig neu
+    _save(bench, records[3])
+    _assert_same_matrix(score_matrix.ScoreMatrix.load(), score_matrix.rebuild(bench))
@@ -0,0 +1,85 @@
+import random
+
+import numpy as np
+import pytest
+
+import core
+from config import CIRCULAR_MODEL
+from scoring import SCORING_ENGINE
+
+SCORE_VALUES = [0.0, 0.25, 0.5, 0.75, 1.0]
+
+
+def _random_answers(rng, answer_rate):
+    """Zufällige Antworten; je Thema wird gelegentlich alles ausgelassen."""
+    answers = {}
+    for theme, indicators in CIRCULAR_MODEL.items():
+        if rng.random() < 0.15:
+            continue
+        for indicator, data in indicators.items():
+            for question in data.get("questions", []):
+                if rng.random() < answer_rate:
+                    score = rng.choice(SCORE_VALUES)
+                elif rng.random() < 0.5:
+                    score = None  # "Keine Auswahl"
+                else:
+                    continue
+                answers.setdefault(theme, {}).setdefault(indicator, {})[question["code"]] = score
+    return answers
+
+
+def _random_weights(rng):
+    return {theme: rng.choice([0.0, 0.1, 0.2, 0.35, 1.0]) for theme in CIRCULAR_MODEL}
+
+
+def _cases(seed, n=200):
+    rng = random.Random(seed)
+    cases = [({}, _random_weights(rng)), ({}, {theme: 0.0 for theme in CIRCULAR_MODEL})]
+    for _ in range(n):
+        cases.append((_random_answers(rng, rng.choice([0.0, 0.1, 0.5, 0.9, 1.0])), _random_weights(rng)))
+    return cases
+
+
+def _engine_result(cases, skip_missing=False):
+    return SCORING_ENGINE.score(
+        SCORING_ENGINE.answers_to_matrix(answers for answers, _ in cases),
+        SCORING_ENGINE.weights_to_matrix(weights for _, weights in cases),
+        skip_missing=skip_missing,
+    )
+
+
+def test_engine_matches_score_answers():
+    cases = _cases(seed=1)
+    result = _engine_result(cases)
+
+    for row, (answers, weights) in enumerate(cases):
+        expected = core.score_answers(answers, weights)
+        indicator = SCORING_ENGINE.indicator_dict(result["indicator"][row])
+        for theme, scores in expected["indicator"].items():
+            for name, score in scores.items():
+                assert indicator[theme][name] == (None if score is None else pytest.approx(score))
+        assert SCORING_ENGINE.dimension_dict(result["dimension"][row]) == pytest.approx(expected["dimension"])
+        assert result["total"][row] == pytest.approx(expected["total"])
+
+
+def test_engine_skip_missing_matches_core_weighted_total():
+    cases = _cases(seed=2)
+    result = _engine_result(cases, skip_missing=True)
+
+    for row, (answers, weights) in enumerate(cases):
+        indicator = core.calculate_scores(answers)
+        # Dimensionen ohne bewerteten Indikator als None, damit skip_missing greift
+        dimension = {
+            theme: (None if all(v is None for v in scores.values()) else value)
+            for (theme, scores), value in zip(indicator.items(), core.calculate_dimension_scores(indicator).values())
+        }
+        expected = core.calculate_weighted_total(dimension, weights, skip_missing=True)
+        assert result["total"][row] == pytest.approx(expected)
+        assert SCORING_ENGINE.weighted_total(dimension, weights, skip_missing=True) == pytest.approx(expected)
+
+
+def test_unanswered_rows_score_nan_indicators_and_zero_total():
+    result = _engine_result([({}, {theme: 1.0 for theme in CIRCULAR_MODEL})])
+    assert np.isnan(result["indicator"]).all()
+    assert np.isnan(result["dimension"]).all()
+    assert result["total"].tolist() == [0.0]
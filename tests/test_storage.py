@@ -0,0 +1,78 @@
+import json
+
+import pytest
+
+import storage
+
+
+def _write_legacy(path, timestamps):
+    path.write_text(json.dumps([{"Timestamp": ts, "Produkt": "P"} for ts in timestamps]), encoding="utf-8")
+
+
+def test_segment_legacy_import_is_retried_after_crash(tmp_path, monkeypatch):
+    legacy = tmp_path / "assessments.json"
+    _write_legacy(legacy, ["t1", "t2", "t3"])
+
+    calls = []
+    original = storage.SegmentLogStore._append_unlocked
+
+    def crash_on_second(self, record):
+        calls.append(record)
+        if len(calls) == 2:
+            raise OSError("disk full")
+        original(self, record)
+
+    monkeypatch.setattr(storage.SegmentLogStore, "_append_unlocked", crash_on_second)
+    with pytest.raises(OSError):
+        storage.SegmentLogStore(tmp_path / "log", legacy_path=legacy).load_all()
+    assert not (tmp_path / "log" / storage.MANIFEST_NAME).exists()
+
+    monkeypatch.setattr(storage.SegmentLogStore, "_append_unlocked", original)
+    store = storage.SegmentLogStore(tmp_path / "log", legacy_path=legacy)
+    assert [r["Timestamp"] for r in store.load_all()] == ["t1", "t2", "t3"]
+
+
+def test_sqlite_migration_from_segments_does_not_duplicate_legacy_records(tmp_path):
+    legacy = tmp_path / "assessments.json"
+    _write_legacy(legacy, ["t1", "t2"])
+    log_dir = tmp_path / "log"
+    storage.SegmentLogStore(log_dir, legacy_path=legacy).append({"Timestamp": "t3", "Produkt": "P"})
+
+    repository = storage._open_sqlite(tmp_path / "a.db", legacy, log_dir)
+    assert repository.count() == 3
+    assert [r["Timestamp"] for r in repository.load_all()] == ["t1", "t2", "t3"]
+
+    # Erneutes Öffnen importiert nichts doppelt
+    repository = storage._open_sqlite(tmp_path / "a.db", legacy, log_dir)
+    assert repository.count() == 3
+
+
+def test_sqlite_imports_json_without_segment_log(tmp_path):
+    legacy = tmp_path / "assessments.json"
+    _write_legacy(legacy, ["t1", "t2"])
+    repository = storage._open_sqlite(tmp_path / "a.db", legacy, tmp_path / "log")
+    assert [r["Timestamp"] for r in repository.load_all()] == ["t1", "t2"]
+
+
+def test_query_pages_match_full_query(store):
+    for idx in range(7):
+        store.append({"Timestamp": f"t{idx}", "Produkt": "P" if idx % 2 else "Q"})
+
+    for newest_first in (False, True):
+        full = [r["Timestamp"] for r in store.query(newest_first=newest_first, Produkt="P")]
+        pages = [
+            [r["Timestamp"] for r in store.query(limit=2, offset=offset, newest_first=newest_first, Produkt="P")]
+            for offset in (0, 2, 4)
+        ]
+        assert pages == [full[0:2], full[2:4], full[4:6]]
+        assert [r["Timestamp"] for r in store.query(offset=1, newest_first=newest_first, Produkt="P")] == full[1:]
+
+
+def test_append_returns_consecutive_sequence_ranges(store):
+    assert store.sequence() == 0
+    previous = 0
+    for idx in range(12):
+        before, after = store.append({"Timestamp": f"t{idx}", "Produkt": "P" * 40})
+        assert before == previous < after == store.sequence()
+        previous = after
+    assert store.count() == 12
@@ -0,0 +1,30 @@
+import styles
+
+
+def test_bundles_are_published_as_content_hashed_files(tmp_path):
+    files = styles.publish_bundles(tmp_path)
+
+    assert set(files) == set(styles.BUNDLES)
+    for name, filename in files.items():
+        assert (tmp_path / filename).read_text(encoding="utf-8") == styles.BUNDLES[name]
+    # Erneutes Veröffentlichen ergibt dieselben Dateinamen
+    assert styles.publish_bundles(tmp_path) == files
+
+
+def test_stylesheet_links_every_bundle_regardless_of_size(tmp_path, monkeypatch):
+    monkeypatch.setattr(styles, "STYLESHEET_DIR", tmp_path)
+    monkeypatch.setattr(styles, "_LINK_TAGS", None)
+
+    for name in styles.BUNDLES:
+        tag = styles.stylesheet(name)
+        assert tag.startswith('<link rel="stylesheet"'), name
+        assert "<style>" not in tag
+
+
+def test_stylesheet_is_inlined_without_writable_directory(tmp_path, monkeypatch):
+    blocker = tmp_path / "file"
+    blocker.write_text("", encoding="utf-8")
+    monkeypatch.setattr(styles, "STYLESHEET_DIR", blocker / "stylesheets")
+    monkeypatch.setattr(styles, "_LINK_TAGS", None)
+
+    assert styles.stylesheet("assessment") == f"<style>\n{styles.BUNDLES['assessment']}\n</style>"
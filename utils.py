@@ -1,90 +1,30 @@
 # ============================================================================
-# UTILITY FUNCTIONS - CHARTS, PDF, CALCULATIONS
+# UTILITY FUNCTIONS - CHARTS
 # ============================================================================
-
-import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
-import plotly.io as pio
-import numpy as np
-from datetime import datetime
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, Image
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-from io import BytesIO
-import json
-
+# Scoring/maturity live in core.py (re-exported here for compatibility),
+# the PDF report in report.py.
 # ============================================================================
-# SCORING & CALCULATIONS
-# ============================================================================
-
-def calculate_theme_score(theme_answers):
-    """
-    Berechne Score für ein Thema (Durchschnitt der Indikatoren)
-
-    Args:
-        theme_answers (dict): {Indikator: {Frage1: score, Frage2: score, ...}}
-
-    Returns:
-        float: Theme Score (0-1)
-    """
-    all_scores = []
-    for indicator, questions in theme_answers.items():
-        for question, score in questions.items():
-            all_scores.append(score)
-    
-    return sum(all_scores) / len(all_scores) if all_scores else 0
-
-def calculate_total_score(theme_scores, weights):
-    """
-    Berechne Gesamt-Zirkularitätsscore (gewichtet)
-
-    Args:
-        theme_scores (dict): {Thema: Score}
-        weights (dict): {Thema: Gewichtung}
-
-    Returns:
-        float: Gewichteter Gesamtscore (0-1)
-    """
-    weighted_sum = sum(theme_scores[theme] * weights[theme] 
-                       for theme in theme_scores.keys())
-    total_weight = sum(weights.values())
-    
-    return weighted_sum / total_weight if total_weight > 0 else 0
-
-def get_maturity_level(score):
-    """
-    Mapping Score → Reifegradlevel
 
-    Args:
-        score (float): Score 0-1
-
-    Returns:
-        dict: {name, emoji, description}
-    """
-    from config import MATURITY_LEVELS
-
-    for level in MATURITY_LEVELS:
-        if level["min_score"] <= score < level["max_score"]:
-            return level
-    return MATURITY_LEVELS[-1]
+import numpy as np
+import plotly.graph_objects as go
+from plotly.colors import qualitative
 
-def get_improvement_areas(theme_scores, threshold=0.5):
-    """
-    Identifiziere Verbesserungsfelder (Scores < Schwellenwert)
+from config import MATURITY_LEVELS
+from core import (
+    calculate_theme_score,
+    calculate_total_score,
+    get_improvement_areas,
+    get_maturity_level,
+    maturity_transitions,
+)
 
-    Args:
-        theme_scores (dict): {Thema: Score}
-        threshold (float): Schwellenwert (0-1)
+# Vergleich: einzeln gezeichnete Assessments (WebGL), darüber Median/IQR-Bänder
+COMPARISON_MAX_OVERLAYS = 50
+COMPARISON_LEGEND_LIMIT = 12
 
-    Returns:
-        list: Themen mit niedrigen Scores
-    """
-    return [theme for theme, score in theme_scores.items() if score < threshold]
+# Heatmap: höchstens HEATMAP_MAX_ROWS Zeilen (≈ 3 px je Zeile bei maximaler Höhe), darüber zusammengefasst
+HEATMAP_MAX_ROWS = 300
+HEATMAP_MAX_HEIGHT = 900
 
 # ============================================================================
 # VISUALISIERUNGEN (PLOTLY)
@@ -175,95 +115,128 @@ def create_radar_chart(theme_scores, title="Circularity Fit Check - Radar Chart"
     
     return fig
 
-def create_heatmap(theme_answers, theme_name):
+def _downsample_rows(values, labels, max_rows):
+    """Fasst aufeinanderfolgende Zeilen zu höchstens max_rows Mittelwert-Zeilen zusammen (NaN ignoriert)."""
+    n_rows = len(values)
+    if n_rows <= max_rows:
+        return values, list(labels)
+    size = -(-n_rows // max_rows)
+    groups = -(-n_rows // size)
+    padded = np.full((groups * size, values.shape[1]), np.nan, dtype=np.float32)
+    padded[:n_rows] = values
+    blocks = padded.reshape(groups, size, values.shape[1])
+    counts = (~np.isnan(blocks)).sum(axis=1)
+    sums = np.nansum(blocks, axis=1)
+    binned = np.where(counts > 0, sums / np.maximum(counts, 1), np.nan).astype(np.float32)
+    binned_labels = [f"{start + 1}–{min(start + size, n_rows)}" for start in range(0, n_rows, size)]
+    return binned, binned_labels
+
+def create_score_heatmap(values, row_labels, column_labels, title=None, max_rows=HEATMAP_MAX_ROWS):
     """
-    Erstelle Heatmap der Indikatoren im Thema
-    
+    Heatmap Assessments x Leitfragen (oder Indikatoren)
+
     Args:
-        theme_answers (dict): {Indikator: {Frage: Score}}
-        theme_name (str): Name des Themas
-    
+        values (array): (N x Spalten) Scores 0-1, NaN = keine Auswahl
+        row_labels (list): Beschriftung je Assessment (eindeutig)
+        column_labels (list): Beschriftung je Spalte
+        title (str): optionaler Titel
+        max_rows (int): mehr Zeilen werden serverseitig zu Mittelwert-Blöcken zusammengefasst
+
     Returns:
         plotly.graph_objects.Figure
     """
-    indicators = []
-    questions = []
-    scores = []
-    
-    for indicator, qs in theme_answers.items():
-        for question, score in qs.items():
-            indicators.append(indicator)
-            questions.append(question[:40] + "..." if len(question) > 40 else question)
-            scores.append(score)
-    
-    # Erstelle Matrix
-    unique_indicators = list(theme_answers.keys())
-    unique_questions = []
-    score_matrix = []
-    
-    for indicator in unique_indicators:
-        row = []
-        for question, score in theme_answers[indicator].items():
-            if question not in unique_questions:
-                unique_questions.append(question)
-            row.append(score)
-        score_matrix.append(row)
-    
+    z, y = _downsample_rows(np.asarray(values, dtype=np.float32), row_labels, max_rows)
+
     fig = go.Figure(data=go.Heatmap(
-        z=score_matrix,
-        x=unique_questions,
-        y=unique_indicators,
+        z=z,
+        x=list(column_labels),
+        y=y,
         colorscale='RdYlGn',
-        zmid=2.5,
         zmin=0,
-        zmax=5,
-        colorbar=dict(title="Score")
+        zmax=1,
+        hoverongaps=False,
+        hovertemplate="%{y}<br>%{x}: %{z:.2f}<extra></extra>",
+        colorbar=dict(title="Score", tickformat=".0%")
     ))
-    
+
     fig.update_layout(
-        title=f"Heatmap: {theme_name}",
-        xaxis_title="Leitfragen",
-        yaxis_title="Indikatoren",
-        height=400,
-        template='plotly_white'
+        title=title,
+        xaxis=dict(side="top", tickangle=-45, type="category"),
+        yaxis=dict(autorange="reversed", type="category", showticklabels=len(y) <= 60),
+        height=int(np.clip(14 * len(y) + 140, 320, HEATMAP_MAX_HEIGHT)),
+        template='plotly_white',
+        margin=dict(l=10, r=10, t=80 if title else 60, b=10)
     )
-    
+
     return fig
 
-def create_comparison_chart(assessments_df):
+def create_comparison_chart(dimension_scores, labels, themes, max_overlays=COMPARISON_MAX_OVERLAYS, height=560):
     """
-    Vergleich mehrerer Assessments
-    
+    Vergleich mehrerer Assessments im Radar
+
+    Bis max_overlays Assessments wird jedes als eigene WebGL-Spur
+    (Scatterpolargl) überlagert, darüber werden Median, Interquartilsbereich
+    und Spannweite je Dimension gezeigt.
+
     Args:
-        assessments_df (pd.DataFrame): Assessment-Historie
-    
+        dimension_scores (array): (N x Themen) Scores 0-1, Spalten in der Reihenfolge von themes
+        labels (list): Beschriftung je Assessment (Hover/Legende)
+        themes (list): Dimensionen
+        max_overlays (int): maximale Anzahl einzeln gezeichneter Assessments
+        height (int): Höhe in Pixeln
+
     Returns:
         plotly.graph_objects.Figure
     """
-    theme_cols = ["Design_Score", "Strategie_Score", "Wirtschaftlichkeit_Score", 
-                  "Regulatorik_Score", "Systemische_Befaehiger_Score"]
-    
+    scores = np.asarray(dimension_scores, dtype=float).reshape(-1, len(themes))
+    closed_themes = list(themes) + [themes[0]]
+    closed_scores = np.concatenate([scores, scores[:, :1]], axis=1)
     fig = go.Figure()
-    
-    for idx, row in assessments_df.iterrows():
+
+    if len(scores) <= max_overlays:
+        palette = qualitative.Plotly
+        show_legend = len(scores) <= COMPARISON_LEGEND_LIMIT
+        for idx, (label, values) in enumerate(zip(labels, closed_scores)):
+            fig.add_trace(go.Scatterpolargl(
+                r=values, theta=closed_themes, mode="lines+markers", name=label,
+                line={'color': palette[idx % len(palette)], 'width': 1.5}, marker={'size': 4},
+                opacity=0.85 if show_legend else 0.45, showlegend=show_legend,
+                hovertemplate=f"{label}<br>%{{theta}}: %{{r:.2f}}<extra></extra>",
+            ))
+    else:
+        low, q1, median, q3, high = np.percentile(closed_scores, [0, 25, 50, 75, 100], axis=0)
         fig.add_trace(go.Scatterpolar(
-            r=[row[col] for col in theme_cols],
-            theta=['Design', 'Strategie', 'Wirtschaftlichkeit', 'Regulatorik', 'Systemische Befähiger'],
-            fill='toself',
-            name=f"{row['Product_Name']} ({row['Timestamp'][:10]})",
-            opacity=0.7
+            r=high, theta=closed_themes, mode="lines", name="Max",
+            line={'color': "#94A3B8", 'width': 1, 'dash': "dot"},
         ))
-    
+        fig.add_trace(go.Scatterpolar(
+            r=low, theta=closed_themes, mode="lines", name="Min",
+            line={'color': "#94A3B8", 'width': 1, 'dash': "dot"},
+        ))
+        fig.add_trace(go.Scatterpolar(
+            r=q1, theta=closed_themes, mode="lines", name="25 %-Quantil",
+            line={'color': "#0F766E", 'width': 1}, showlegend=False,
+        ))
+        fig.add_trace(go.Scatterpolar(
+            r=q3, theta=closed_themes, mode="lines", name="Interquartilsbereich", fill="tonext",
+            fillcolor="rgba(15, 118, 110, 0.18)", line={'color': "#0F766E", 'width': 1},
+        ))
+        fig.add_trace(go.Scatterpolar(
+            r=median, theta=closed_themes, mode="lines+markers", name=f"Median (n = {len(scores)})",
+            line={'color': "#0F172A", 'width': 3}, marker={'size': 6},
+        ))
+
     fig.update_layout(
         polar=dict(
-            radialaxis=dict(visible=True, range=[0, 5]),
-            angularaxis=dict(tickfont=dict(size=10))
+            radialaxis=dict(visible=True, range=[0, 1], tickformat=".0%"),
+            angularaxis=dict(tickfont=dict(size=11))
         ),
-        title="Assessment Vergleich",
         template='plotly_white',
-        height=500
+        height=height,
+        legend={'orientation': "h", 'y': -0.1},
+        margin=dict(l=40, r=40, t=30, b=30)
     )
-    
+
     return fig
 
 def create_gauge_chart(total_score, max_score=5):
@@ -311,207 +284,110 @@ def create_gauge_chart(total_score, max_score=5):
     
     return fig
 
-# ============================================================================
-# PDF-EXPORT
-# ============================================================================
-
-def generate_pdf_report(
-    product_name,
-    company,
-    theme_scores,
-    weights,
-    detailed_answers,
-    improvement_areas,
-    theme_colors=None,
-):
+def create_dimension_gauges(theme_scores, theme_colors=None, bar_colors=None, columns=3, row_height=220):
     """
-    Generiere detaillierten PDF-Report
-    
+    Gauges aller Dimensionen in einer Figur (ein Raster, eine Indicator-Spur je Dimension)
+
     Args:
-        product_name (str)
-        company (str)
-        theme_scores (dict): {Thema: Score}
-        weights (dict): {Thema: Gewichtung}
-        detailed_answers (dict): Alle Fragen+Answers
-        improvement_areas (list): Schwache Bereiche
-    
+        theme_scores (dict): {Thema: Score 0-1}, Reihenfolge = Anordnung im Raster
+        theme_colors (dict): {Thema: Farbe} für die Prozentzahl
+        bar_colors (dict): {Thema: Farbe} für den Gauge-Balken (Standard: theme_colors)
+        columns (int): Gauges pro Zeile
+        row_height (int): Höhe je Rasterzeile in Pixeln
+
     Returns:
-        BytesIO: PDF als Bytes
+        plotly.graph_objects.Figure
     """
-    
-    # Erstelle PDF-Datei im Memory
-    pdf_buffer = BytesIO()
-    doc = SimpleDocTemplate(pdf_buffer, pagesize=A4,
-                           rightMargin=0.5*inch, leftMargin=0.5*inch,
-                           topMargin=0.6*inch, bottomMargin=0.6*inch)
-    
-    # Sammle Elemente
-    elements = []
-    styles = getSampleStyleSheet()
-    
-    # Custom Styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor='#1F7E8A',
-        spaceAfter=30,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold'
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor='#1F7E8A',
-        spaceAfter=6,
-        spaceBefore=8,
-        fontName='Helvetica-Bold'
+    theme_colors = theme_colors or {}
+    bar_colors = bar_colors or theme_colors
+    themes = list(theme_scores.keys())
+    columns = max(1, min(columns, len(themes) or 1))
+    rows = max(1, -(-len(themes) // columns))
+
+    fig = go.Figure()
+    for idx, theme in enumerate(themes):
+        color = theme_colors.get(theme, "#0F172A")
+        fig.add_trace(go.Indicator(
+            mode="gauge+number",
+            value=(theme_scores.get(theme) or 0) * 100,
+            number={'suffix': "%", 'font': {'size': 28, 'color': color}},
+            gauge={
+                'axis': {'range': [0, 100]},
+                'bar': {'color': bar_colors.get(theme, color)},
+                'bgcolor': "#F8FAFC",
+                'bordercolor': "#E2E8F0",
+                'borderwidth': 2,
+                'steps': [{'range': [0, 100], 'color': "#F1F5F9"}],
+            },
+            title={'text': theme, 'font': {'size': 14, 'color': "#0F172A"}},
+            domain={'row': idx // columns, 'column': idx % columns},
+        ))
+
+    fig.update_layout(
+        grid={'rows': rows, 'columns': columns, 'pattern': "independent", 'ygap': 0.35},
+        height=row_height * rows,
+        margin=dict(l=30, r=30, t=50, b=10)
     )
-    
-    # Title
-    elements.append(Paragraph(
-        f"🌍 Circularity Fit Check Report",
-        title_style
-    ))
-    elements.append(Spacer(1, 0.15*inch))
-    
-    # Metadata
-    metadata_text = f"""
-    <b>Produkt:</b> {product_name}<br/>
-    <b>Unternehmen:</b> {company}<br/>
-    <b>Datum:</b> {datetime.now().strftime('%d.%m.%Y %H:%M')}<br/>
-    <b>Bewertungsphase:</b> Post-Design Phase
+
+    return fig
+
+def create_trend_chart(timestamps, totals, theme_scores, theme_colors=None, height=420):
     """
-    elements.append(Paragraph(metadata_text, styles['Normal']))
-    elements.append(Spacer(1, 0.18*inch))
-    
-    # Total Score
-    weighted_sum = 0.0
-    used_weights = 0.0
-    for theme, score in theme_scores.items():
-        if score is None:
-            continue
-        weight = weights.get(theme, 0.0)
-        weighted_sum += score * weight
-        used_weights += weight
-    total_score_01 = (weighted_sum / used_weights) if used_weights else 0.0
-    total_score_5 = total_score_01 * 5.0
-    level = get_maturity_level(total_score_01)
-    
-    score_text = f"""
-    <b>Gesamt-Zirkularitätsscore: {total_score_5:.2f}/5.0</b><br/>
-    <b>Reifegradlevel:</b> {level['name']} ({level['emoji']})
+    Verlauf eines Produkts: gewichteter Gesamtscore und Dimensionen über die Zeit
+
+    Reifegrad-Bänder liegen im Hintergrund, Wechsel des Reifegrads
+    (core.maturity_transitions) sind im Gesamtscore markiert.
+
+    Args:
+        timestamps (list): Zeitpunkte in chronologischer Reihenfolge
+        totals (list): gewichtete Gesamtscores (0-1)
+        theme_scores (dict): {Thema: [Scores 0-1 je Zeitpunkt]}
+        theme_colors (dict): {Thema: Farbe}
+        height (int): Höhe in Pixeln
+
+    Returns:
+        plotly.graph_objects.Figure
     """
-    elements.append(Paragraph(score_text, styles['Normal']))
-    elements.append(Spacer(1, 0.18*inch))
-    elements.append(Paragraph("Reifegrad-Skala", heading_style))
-    elements.append(Paragraph(
-        "Sehr gering (0.00–0.20)<br/>Gering (0.20–0.40)<br/>Mittel (0.40–0.60)<br/>"
-        "Fortgeschritten (0.60–0.80)<br/>Sehr hoch (0.80–1.00)",
-        styles['Normal']
+    theme_colors = theme_colors or {}
+    fig = go.Figure()
+
+    for idx, level in enumerate(MATURITY_LEVELS):
+        fig.add_hrect(
+            y0=level["min_score"], y1=level["max_score"],
+            fillcolor="#F1F5F9" if idx % 2 == 0 else "#FFFFFF", line_width=0, layer="below",
+            annotation_text=f"{level['emoji']} {level['name']}", annotation_position="right",
+            annotation_font={'size': 11, 'color': "#64748B"},
+        )
+
+    for theme, values in theme_scores.items():
+        fig.add_trace(go.Scatter(
+            x=timestamps, y=values, name=theme, mode="lines+markers",
+            line={'width': 1.5, 'color': theme_colors.get(theme)}, marker={'size': 5}, opacity=0.75,
+        ))
+    fig.add_trace(go.Scatter(
+        x=timestamps, y=totals, name="Gesamtscore (gewichtet)", mode="lines+markers",
+        line={'width': 3, 'color': "#0F172A"}, marker={'size': 8},
     ))
-    elements.append(Spacer(1, 0.12*inch))
-
-    def plotly_to_rl_image(fig, width=900, height=520):
-        try:
-            img_bytes = pio.to_image(fig, format="png", width=width, height=height, scale=2)
-        except Exception:
-            return None
-        return Image(BytesIO(img_bytes), width=6.8*inch, height=3.8*inch)
-
-    # Charts
-    try:
-        from config import CIRCULAR_MODEL
-        if theme_colors is None:
-            theme_colors = {}
-    except Exception:
-        CIRCULAR_MODEL = {}
-        if theme_colors is None:
-            theme_colors = {}
-
-    radar_fig = create_radar_chart(theme_scores, "Zirkularitäts-Profil", theme_colors=theme_colors)
-    radar_img = plotly_to_rl_image(radar_fig, width=800, height=420)
-    elements.append(Paragraph("📊 Zirkularitäts-Profil", heading_style))
-    if radar_img:
-        elements.append(radar_img)
-    else:
-        elements.append(Paragraph("Hinweis: Chart-Export nicht verfügbar (kaleido fehlt).", styles['Normal']))
-    elements.append(Spacer(1, 0.18*inch))
 
-    # Themen-Scores
-    elements.append(Paragraph("📊 Themen-Scores", heading_style))
-    
-    score_table_data = [["Thema", "Score", "Gewichtung", "Beitrag"]]
-    for theme in theme_scores.keys():
-        score = theme_scores[theme]
-        weight = weights.get(theme, 0.0)
-        contrib = (score * weight) / used_weights if used_weights else 0.0
-        score_table_data.append([
-            theme,
-            f"{(score or 0):.2f}",
-            f"{weight:.2f}x",
-            f"{contrib:.2f}"
-        ])
-    
-    score_table = Table(score_table_data, colWidths=[2.2*inch, 0.7*inch, 0.8*inch, 0.8*inch])
-    score_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1F7E8A')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
-    elements.append(score_table)
-    elements.append(Spacer(1, 0.3*inch))
-    
-    # Detaillierte Answers
-    elements.append(PageBreak())
-    elements.append(Paragraph("📋 Detaillierte Bewertung (inkl. Nicht-Bewertet)", heading_style))
-
-    for theme, indicators in CIRCULAR_MODEL.items():
-        elements.append(Paragraph(f"<b>{theme}</b>", styles['Heading3']))
-        for indicator, indicator_data in indicators.items():
-            elements.append(Paragraph(f"<i>{indicator}</i>", styles['Normal']))
-            rows = [["Code", "Frage", "Score", "Bewertet"]]
-            for q in indicator_data.get("questions", []):
-                code = q.get("code", "")
-                text = q.get("text", "")
-                score = detailed_answers.get(theme, {}).get(indicator, {}).get(code)
-                if score is None:
-                    score_display = "—"
-                    bewertet = "Nein"
-                else:
-                    score_display = f"{score:.2f}"
-                    bewertet = "Ja"
-                rows.append([code, Paragraph(text, styles['BodyText']), score_display, bewertet])
-
-            table = Table(rows, colWidths=[0.7*inch, 4.6*inch, 0.7*inch, 0.8*inch], repeatRows=1)
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#0F172A')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('ALIGN', (0, 0), (0, -1), 'CENTER'),
-                ('ALIGN', (2, 0), (3, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 9),
-                ('FONTSIZE', (0, 1), (-1, -1), 8),
-                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.whitesmoke, colors.lightgrey]),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-            ]))
-            elements.append(table)
-            elements.append(Spacer(1, 0.2*inch))
-    
-    # Build PDF
-    doc.build(elements)
-    pdf_buffer.seek(0)
-    
-    return pdf_buffer
+    for transition in maturity_transitions(timestamps, totals):
+        if transition["from"] is None:
+            continue
+        level = transition["to"]
+        fig.add_annotation(
+            x=transition["timestamp"], y=transition["score"],
+            text=f"{level['emoji']} {level['name']}", showarrow=True, arrowhead=2, ay=-35,
+            font={'size': 11, 'color': "#0F172A"}, bgcolor="#FFFFFF",
+        )
+
+    fig.update_layout(
+        height=height,
+        yaxis={'range': [0, 1], 'tickformat': ".0%", 'title': "Score"},
+        xaxis={'title': None},
+        legend={'orientation': "h", 'y': -0.15},
+        margin=dict(l=10, r=90, t=30, b=10)
+    )
+
+    return fig
 
 def create_quick_summary(theme_scores, improvement_areas):
     """